@@ -17,31 +17,53 @@ Usage:
     # JSON output for CI/CD
     python scripts/auto_triage.py --apply --json-output
 
+    # Ignore cached agent responses (dry runs only; cached for --cache-ttl seconds, same day only)
+    python scripts/auto_triage.py --dry-run --no-cache
+
+    # Keep the agent resident and send runs to it
+    python scripts/auto_triage.py --daemon --dry-run &
+    python scripts/auto_triage.py --client --apply --jql "project=RHIDP"
+
 Exit Codes:
     0 - Success (all applied successfully)
     1 - Failures (some updates failed)
 """
 
 import argparse
+import hashlib
 import json
 import os
 import re
+import sqlite3
 import sys
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing
+from datetime import date
 from pathlib import Path
+from typing import Any
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from loguru import logger
 
-from agno.db.sqlite import SqliteDb
-
-# Import toolkit configs to register token types with global registry
-from agentllm.agents.toolkit_configs.jira_config import JiraConfig  # noqa: F401
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Constants
 AUTOMATION_USER_ID = "jira-triager-bot"
 DB_PATH = "tmp/agent-data/agno_sessions.db"
+# Maximum number of concurrent Jira update requests
+APPLY_MAX_WORKERS = 8
+# Maximum age in seconds of a cached agent response
+TRIAGE_CACHE_TTL = 3600
+# Unix socket used by --daemon and --client
+DAEMON_SOCKET_PATH = "tmp/auto_triage.sock"
 # Config file: use env var, or "config/rhdh-teams.json" (CI), or fallback to "tmp/rhdh-teams.json" (local dev)
 CONFIG_FILE_PATH = os.getenv("JIRA_TRIAGER_CONFIG_FILE") or (
     "config/rhdh-teams.json" if os.path.exists("config/rhdh-teams.json") else "tmp/rhdh-teams.json"
@@ -53,6 +75,16 @@ DEFAULT_JQL_FILTER = (
     'AND issuetype not in (Sub-task, Feature, "Feature Request", Outcome) '
     "ORDER BY created DESC, priority DESC"
 )
+TRIAGE_PROMPT_TEMPLATE = "Triage all issues matching this JQL filter: {jql}"
+DEFAULT_TRIAGE_PROMPT = TRIAGE_PROMPT_TEMPLATE.format(jql=DEFAULT_JQL_FILTER)
+
+# Triage table parsing patterns
+_TABLE_HEADER_RE = re.compile(r"\| Ticket \| Summary \| Field \| Current \| Recommended \| Confidence \| Action \|")
+_TABLE_ROW_RE = re.compile(r"\|([^|\n]*)\|([^|\n]*)\|([^|\n]*)\|([^|\n]*)\|([^|\n]*)\|([^|\n]*)\|([^|\n]*)\|[^\n]*(?:\n|$)")
+_CONFIDENCE_RE = re.compile(r"(\d+)%")
+
+# Jira Triager agents reused across runs (daemon mode), keyed by (user_id, db_path)
+_triage_agents: dict[tuple[str, str], Any] = {}
 
 # Signal automation mode to configurator (disables Google Drive requirement)
 # This must be set before importing/creating the JiraTriager agent
@@ -60,8 +92,8 @@ if not os.environ.get("JIRA_TRIAGER_CONFIG_FILE"):
     os.environ["JIRA_TRIAGER_CONFIG_FILE"] = CONFIG_FILE_PATH
 
 
-def parse_triage_table(response_text: str) -> list[dict]:
-    """Parse triage recommendations from agent response.
+def iter_triage_table(response_text: str) -> Iterator[dict]:
+    """Yield triage recommendations from agent response one row at a time.
 
     Looks for markdown table with format:
     | Ticket | Summary | Field | Current | Recommended | Confidence | Action |
@@ -69,38 +101,44 @@ def parse_triage_table(response_text: str) -> list[dict]:
     Args:
         response_text: Full agent response text
 
-    Returns:
-        List of recommendation dictionaries
+    Yields:
+        Recommendation dictionaries
     """
-    recommendations = []
-
     # Find table in response (look for header row)
-    table_pattern = r"\| Ticket \| Summary \| Field \| Current \| Recommended \| Confidence \| Action \|"
-    match = re.search(table_pattern, response_text)
+    match = _TABLE_HEADER_RE.search(response_text)
 
     if not match:
         logger.warning("No triage table found in response")
-        return recommendations
-
-    # Extract table section
-    table_start = match.start()
-    table_text = response_text[table_start:]
-
-    # Parse each data row (skip header and separator)
-    lines = table_text.split("\n")
-    current_ticket = None
-
-    for line in lines[2:]:  # Skip header and separator
-        if not line.strip() or not line.startswith("|"):
+        return
+
+    # Skip the header and separator lines
+    pos = match.end()
+    for _ in range(2):
+        newline = response_text.find("\n", pos)
+        if newline == -1:
+            pos = len(response_text)
             break
+        pos = newline + 1
 
-        # Parse columns
-        cols = [col.strip() for col in line.split("|")[1:-1]]  # Remove empty first/last
+    # Parse each data row in place, stopping at the end of the contiguous table
+    current_ticket = None
 
-        if len(cols) < 7:
+    while True:
+        row = _TABLE_ROW_RE.match(response_text, pos)
+
+        if row is None:
+            # Rows with an unexpected column count are skipped, anything else ends the table
+            if not response_text.startswith("|", pos):
+                break
+            newline = response_text.find("\n", pos)
+            logger.debug("Skipping malformed table row: {}", response_text[pos : None if newline == -1 else newline])
+            if newline == -1:
+                break
+            pos = newline + 1
             continue
 
-        ticket, _summary, field, current, recommended, confidence_str, action = cols
+        pos = row.end()
+        ticket, _summary, field, current, recommended, confidence_str, action = map(str.strip, row.groups())
 
         # If ticket is empty, use previous ticket (multi-row format)
         if ticket:
@@ -112,15 +150,14 @@ def parse_triage_table(response_text: str) -> list[dict]:
 
         # Skip if action is not NEW (skip APPEND and SKIP)
         if action.upper() != "NEW":
-            logger.debug(f"Skipping {ticket} {field} (action: {action})")
+            logger.debug("Skipping {} {} (action: {})", ticket, field, action)
             continue
 
         # Parse confidence percentage
-        confidence_match = re.search(r"(\d+)%", confidence_str)
+        confidence_match = _CONFIDENCE_RE.search(confidence_str)
         confidence = int(confidence_match.group(1)) if confidence_match else 0
 
-        # Build recommendation dict
-        rec = {
+        yield {
             "ticket": ticket,
             "field": field.lower(),
             "current": current,
@@ -129,10 +166,20 @@ def parse_triage_table(response_text: str) -> list[dict]:
             "action": action,
         }
 
-        recommendations.append(rec)
 
-    unique_issues = len(set(rec["ticket"] for rec in recommendations))
-    logger.info(f"Parsed {len(recommendations)} recommendations for {unique_issues} issues from table")
+def parse_triage_table(response_text: str) -> list[dict]:
+    """Parse triage recommendations from agent response.
+
+    Args:
+        response_text: Full agent response text
+
+    Returns:
+        List of recommendation dictionaries (see iter_triage_table())
+    """
+    recommendations = list(iter_triage_table(response_text))
+
+    unique_issues = len({rec["ticket"] for rec in recommendations})
+    logger.info("Parsed {} recommendations for {} issues from table", len(recommendations), unique_issues)
     return recommendations
 
 
@@ -146,10 +193,8 @@ def classify_recommendations(recommendations: list[dict], threshold: int) -> dic
     Returns:
         Dictionary with 'auto_apply' containing all items
     """
-    unique_count = len(set(rec["ticket"] for rec in recommendations))
-    logger.info(
-        f"Will apply all {len(recommendations)} recommendations to {unique_count} issues"
-    )
+    unique_count = len({rec["ticket"] for rec in recommendations})
+    logger.info("Will apply all {} recommendations to {} issues", len(recommendations), unique_count)
     return {
         "auto_apply": recommendations,
     }
@@ -195,7 +240,7 @@ def build_ticket_details(recommendations: list[dict], token_storage, user_id: st
     try:
         jira = JIRA(server=jira_token["server_url"], token_auth=jira_token["token"])
     except Exception as e:
-        logger.error(f"Failed to connect to Jira for fetching titles: {e}")
+        logger.error("Failed to connect to Jira for fetching titles: {}", e)
         return []
 
     # Group recommendations by ticket
@@ -218,9 +263,9 @@ def build_ticket_details(recommendations: list[dict], token_storage, user_id: st
         try:
             issue = jira.issue(ticket, fields="summary")
             by_ticket[ticket]["title"] = issue.fields.summary
-            logger.debug(f"Fetched title for {ticket}")
+            logger.debug("Fetched title for {}", ticket)
         except Exception as e:
-            logger.warning(f"Failed to fetch title for {ticket}: {e}")
+            logger.warning("Failed to fetch title for {}: {}", ticket, e)
             by_ticket[ticket]["title"] = ticket  # Fallback to ticket ID
 
     # Build final list
@@ -255,10 +300,48 @@ def load_team_id_map() -> dict[str, str]:
                 team_id_map[team_name] = team_data["id"]
         return team_id_map
     except Exception as e:
-        logger.error(f"Failed to load team ID map: {e}")
+        logger.error("Failed to load team ID map: {}", e)
         return {}
 
 
+def _build_team_field(recommended: str, team_id_map: dict[str, str]) -> str | None:
+    """Translate a recommended team name into the Jira team field value."""
+    team_id = team_id_map.get(recommended)
+    if not team_id:
+        logger.error("Unknown team name '{}' - not found in team_id_map", recommended)
+    return team_id
+
+
+def _build_components_field(recommended: str, team_id_map: dict[str, str]) -> list[dict]:
+    """Translate comma-separated component names into the Jira components field value."""
+    return [{"name": name.strip()} for name in recommended.split(",")]
+
+
+# Jira field key and value builder for each supported recommendation field
+_FIELD_KEYS: dict[str, str] = {
+    "team": "customfield_12313240",
+    "components": "components",
+}
+_FIELD_BUILDERS: dict[str, Callable[[str, dict[str, str]], Any]] = {
+    "team": _build_team_field,
+    "components": _build_components_field,
+}
+
+
+def _apply_ticket_update(jira, ticket: str, update_fields: dict) -> None:
+    """Apply prepared field updates to a single Jira issue.
+
+    Args:
+        jira: Connected JIRA client
+        ticket: Issue key to update
+        update_fields: Jira field payload for the issue
+    """
+    # PUT by key directly; fetching the issue first would cost an extra round-trip
+    response = jira._session.put(jira._get_url(f"issue/{ticket}"), data=json.dumps({"fields": update_fields}))
+    response.raise_for_status()
+    logger.info("✓ Updated {}: {}", ticket, tuple(update_fields))
+
+
 def apply_recommendations(recommendations: list[dict], token_storage, user_id: str) -> dict:
     """Apply triage recommendations to Jira.
 
@@ -271,6 +354,7 @@ def apply_recommendations(recommendations: list[dict], token_storage, user_id: s
         Dictionary with 'applied' and 'failed' lists
     """
     from jira import JIRA
+    from requests.adapters import HTTPAdapter
 
     team_id_map = load_team_id_map()
 
@@ -293,69 +377,179 @@ def apply_recommendations(recommendations: list[dict], token_storage, user_id: s
     try:
         jira = JIRA(server=jira_token["server_url"], token_auth=jira_token["token"])
     except Exception as e:
-        logger.error(f"Failed to connect to Jira: {e}")
+        logger.error("Failed to connect to Jira: {}", e)
         return {"applied": [], "failed": recommendations}
 
+    # Keep one pooled connection per worker so concurrent updates reuse TCP/TLS connections
+    # (retries are already handled by jira's ResilientSession)
+    pooled_adapter = HTTPAdapter(pool_connections=APPLY_MAX_WORKERS, pool_maxsize=APPLY_MAX_WORKERS)
+    jira._session.mount("https://", pooled_adapter)
+    jira._session.mount("http://", pooled_adapter)
+
     applied = []
     failed = []
 
     # Group by ticket to batch updates
-    by_ticket = {}
+    by_ticket: dict[str, list[dict]] = defaultdict(list)
     for rec in recommendations:
-        ticket = rec["ticket"]
-        if ticket not in by_ticket:
-            by_ticket[ticket] = []
-        by_ticket[ticket].append(rec)
+        by_ticket[rec["ticket"]].append(rec)
 
-    # Apply updates ticket by ticket
-    for ticket, updates in by_ticket.items():
-        try:
-            logger.info(f"Updating {ticket} ({len(updates)} fields)")
-
-            # Prepare update fields
-            update_fields = {}
-
-            for update in updates:
-                field = update["field"]
-                recommended = update["recommended"]
-
-                if field == "team":
-                    team_id = team_id_map.get(recommended)
-                    if team_id:
-                        update_fields["customfield_12313240"] = team_id
-                    else:
-                        logger.error(f"Unknown team name '{recommended}' - not found in team_id_map")
-                        continue
-                elif field == "components":
-                    # Components is a list of component names
-                    component_names = [c.strip() for c in recommended.split(",")]
-                    update_fields["components"] = [{"name": name} for name in component_names]
-
-            # Update issue
-            if update_fields:
-                issue = jira.issue(ticket)
-                issue.update(fields=update_fields)
-                logger.info(f"✓ Updated {ticket}: {list(update_fields.keys())}")
+    # Prepare update fields ticket by ticket, in key order so updates are submitted sorted
+    pending_updates = {}
+    for ticket, updates in sorted(by_ticket.items()):
+        logger.info("Updating {} ({} fields)", ticket, len(updates))
 
-                # Mark all updates for this ticket as applied
-                applied.extend(updates)
-            else:
-                logger.warning(f"No valid fields to update for {ticket}")
-                failed.extend(updates)
+        update_fields = {}
 
-        except Exception as e:
-            logger.error(f"Failed to update {ticket}: {type(e).__name__}")
+        for update in updates:
+            field = update["field"]
+            builder = _FIELD_BUILDERS.get(field)
+            if builder is None:
+                continue
+
+            value = builder(update["recommended"], team_id_map)
+            if value is not None:
+                update_fields[_FIELD_KEYS[field]] = value
+
+        if update_fields:
+            pending_updates[ticket] = update_fields
+        else:
+            logger.warning("No valid fields to update for {}", ticket)
             failed.extend(updates)
 
-    unique_applied = len(set(item["ticket"] for item in applied))
-    unique_failed = len(set(item["ticket"] for item in failed))
+    # Update issues concurrently so Jira round-trips overlap
+    with ThreadPoolExecutor(max_workers=APPLY_MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(_apply_ticket_update, jira, ticket, update_fields): ticket for ticket, update_fields in pending_updates.items()
+        }
+        for future in as_completed(futures):
+            ticket = futures[future]
+            try:
+                future.result()
+                # Mark all updates for this ticket as applied
+                applied.extend(by_ticket[ticket])
+            except Exception as e:
+                logger.error("Failed to update {}: {}", ticket, type(e).__name__)
+                failed.extend(by_ticket[ticket])
+
+    unique_applied = len({item["ticket"] for item in applied})
+    unique_failed = len({item["ticket"] for item in failed})
     logger.info(
-        f"Applied {len(applied)} recommendations to {unique_applied} issues, "
-        f"failed {len(failed)} recommendations on {unique_failed} issues"
+        "Applied {} recommendations to {} issues, failed {} recommendations on {} issues",
+        len(applied),
+        unique_applied,
+        len(failed),
+        unique_failed,
     )
     return {"applied": applied, "failed": failed}
 
 
+def triage_cache_key(user_id: str, prompt: str) -> str:
+    """Build the cache key for an agent triage response.
+
+    The key covers the user, the triage prompt and the current date, so a
+    cached response never outlives the day it was produced.
+
+    Args:
+        user_id: User identifier
+        prompt: Triage prompt sent to the agent
+
+    Returns:
+        Hex SHA-256 digest identifying the triage request
+    """
+    raw = "\0".join((user_id, prompt, date.today().isoformat()))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _connect_triage_cache(db_path: str) -> sqlite3.Connection:
+    """Open the database and make sure the triage cache table exists."""
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE IF NOT EXISTS triage_cache (key TEXT PRIMARY KEY, created_at INTEGER, response TEXT)")
+    return conn
+
+
+def load_cached_response(db_path: str, key: str, ttl: int) -> str | None:
+    """Load a cached agent response if one younger than ttl exists.
+
+    Args:
+        db_path: Database file path
+        key: Cache key from triage_cache_key()
+        ttl: Maximum age in seconds
+
+    Returns:
+        Cached response text, or None on miss or error
+    """
+    try:
+        with closing(_connect_triage_cache(db_path)) as conn:
+            row = conn.execute(
+                "SELECT response FROM triage_cache WHERE key = ? AND created_at >= ?",
+                (key, int(time.time()) - ttl),
+            ).fetchone()
+    except sqlite3.Error as e:
+        logger.warning("Failed to read triage cache: {}", e)
+        return None
+
+    return row[0] if row else None
+
+
+def store_cached_response(db_path: str, key: str, response_text: str) -> None:
+    """Store an agent response in the triage cache.
+
+    Args:
+        db_path: Database file path
+        key: Cache key from triage_cache_key()
+        response_text: Full agent response text
+    """
+    try:
+        with closing(_connect_triage_cache(db_path)) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO triage_cache (key, created_at, response) VALUES (?, ?, ?)",
+                (key, int(time.time()), response_text),
+            )
+    except sqlite3.Error as e:
+        logger.warning("Failed to write triage cache: {}", e)
+
+
+def get_triage_agent(user_id: str, db_path: str):
+    """Get the Jira Triager agent for a user, creating it on first use.
+
+    Agents are kept for the life of the process, so daemon mode opens the
+    database and builds the agent only once.
+
+    Args:
+        user_id: User identifier
+        db_path: Database file path
+
+    Returns:
+        JiraTriager instance
+    """
+    key = (user_id, db_path)
+    agent = _triage_agents.get(key)
+    if agent is not None:
+        return agent
+
+    # Heavy imports are deferred so --help and cache hits skip loading agno and the agent stack
+    from agno.db.sqlite import SqliteDb
+
+    # Import toolkit configs to register token types with global registry
+    from agentllm.agents.toolkit_configs.jira_config import JiraConfig  # noqa: F401
+
+    shared_db = SqliteDb(db_file=db_path)
+
+    # Create Jira Triager agent
+    logger.info("Creating Jira Triager for user {}", user_id)
+    from agentllm.agents.jira_triager import JiraTriager
+
+    agent = JiraTriager(
+        shared_db=shared_db,
+        token_storage=None,  # TokenStorage not needed - JiraConfig will use env var
+        user_id=user_id,
+        temperature=0.2,  # Low temperature for consistency
+    )
+    _triage_agents[key] = agent
+    return agent
+
+
 def run_triage(
     user_id: str,
     db_path: str,
@@ -363,6 +557,9 @@ def run_triage(
     dry_run: bool = False,
     confidence_threshold: int = 80,
     json_output: bool = False,
+    use_cache: bool = True,
+    cache_ttl: int = TRIAGE_CACHE_TTL,
+    session_id: str | None = None,
 ) -> dict:
     """Run automated triage.
 
@@ -373,79 +570,88 @@ def run_triage(
         dry_run: If True, don't apply changes
         confidence_threshold: Minimum confidence for auto-apply (0-100)
         json_output: If True, output JSON instead of human-readable
+        use_cache: If True, reuse a cached agent response for the same user and filter (dry-run only)
+        cache_ttl: Maximum age in seconds of a cached agent response
+        session_id: Agent session identifier (optional, isolates daemon requests)
 
     Returns:
         Results dictionary with metrics and details
     """
-    # Verify JIRA_API_TOKEN is set
+    # Verify JIRA_API_TOKEN is set (main() checks it up front; this guards other callers)
     if not os.getenv("JIRA_API_TOKEN"):
         logger.error("JIRA_API_TOKEN environment variable is required")
-        sys.exit(1)
+        return {
+            "success": False,
+            "error": "JIRA_API_TOKEN environment variable is required",
+            "total": 0,
+            "auto_apply": 0,
+            "applied": 0,
+            "failed": 0,
+        }
 
     logger.info("Using JIRA_API_TOKEN from environment")
 
     # Create minimal database for agent (session storage only, no credentials)
     db_path_obj = Path(db_path)
     db_path_obj.parent.mkdir(parents=True, exist_ok=True)
-    shared_db = SqliteDb(db_file=db_path)
 
     # TokenStorage not needed - JiraConfig will use env var
     token_storage = None
 
-    # Create Jira Triager agent
-    logger.info(f"Creating Jira Triager for user {user_id}")
-    from agentllm.agents.jira_triager import JiraTriager
-
-    agent = JiraTriager(
-        shared_db=shared_db,
-        token_storage=token_storage,
-        user_id=user_id,
-        temperature=0.2,  # Low temperature for consistency
-    )
-
-    # Build triage prompt (use default JQL if none provided)
-    effective_jql = jql_filter or DEFAULT_JQL_FILTER
-    prompt = f"Triage all issues matching this JQL filter: {effective_jql}"
+    # Build triage prompt (use default prompt if no JQL provided)
+    prompt = TRIAGE_PROMPT_TEMPLATE.format(jql=jql_filter) if jql_filter else DEFAULT_TRIAGE_PROMPT
 
     # Only log JQL if using default filter (custom filters may contain customer data)
     if jql_filter is None:
-        logger.info(f"Running triage with default JQL filter")
+        logger.info("Running triage with default JQL filter")
     else:
         logger.info("Running triage with custom JQL filter (not logged for privacy)")
 
-    # Run agent and collect response
-    response_text = ""
-    try:
-        result = agent.run(prompt)
-        # Handle RunOutput object (non-streaming response)
-        if hasattr(result, "content"):
-            response_text = result.content
-        elif hasattr(result, "text"):
-            response_text = result.text
-        else:
-            # Fallback: convert to string
-            response_text = str(result)
+    # Reuse a recent agent response for the same user and filter when available. Only dry runs
+    # use the cache: applying stale recommendations could overwrite fields changed since.
+    use_cache = use_cache and dry_run
+    cache_key = triage_cache_key(user_id, prompt)
+    response_text = load_cached_response(db_path, cache_key, cache_ttl) if use_cache else None
+    cache_hit = response_text is not None
 
-        if not json_output:
-            print(response_text, flush=True)
-    except Exception as e:
-        logger.error(f"Agent execution failed: {e}")
-        return {
-            "success": False,
-            "error": str(e),
-            "total": 0,
-            "auto_apply": 0,
-            "applied": 0,
-            "failed": 0,
-        }
+    if cache_hit:
+        logger.info("Using cached triage response (agent run skipped)")
+    else:
+        agent = get_triage_agent(user_id, db_path)
+
+        # Run agent and collect response
+        try:
+            result = agent.run(prompt, session_id=session_id)
+            # Handle RunOutput object (non-streaming response), falling back to text or str()
+            response_text = getattr(result, "content", None)
+            if response_text is None:
+                response_text = getattr(result, "text", None)
+            if response_text is None:
+                response_text = str(result)
+        except Exception as e:
+            logger.error("Agent execution failed: {}", e)
+            return {
+                "success": False,
+                "error": str(e),
+                "total": 0,
+                "auto_apply": 0,
+                "applied": 0,
+                "failed": 0,
+            }
 
     if not json_output:
-        print("\n")
+        # Single write + flush instead of two print() calls
+        sys.stdout.write(f"{response_text}\n\n\n")
+        sys.stdout.flush()
 
     # Parse recommendations from response
     logger.info("Parsing triage recommendations")
     recommendations = parse_triage_table(response_text)
 
+    # Only cache fresh responses that contain a triage table
+    if use_cache and recommendations and not cache_hit:
+        store_cached_response(db_path, cache_key, response_text)
+
     if not recommendations:
         logger.warning("No recommendations found")
         return {
@@ -461,8 +667,8 @@ def run_triage(
     classified = classify_recommendations(recommendations, confidence_threshold)
 
     # Count unique issues (not fields)
-    unique_total = len(set(item["ticket"] for item in recommendations))
-    unique_auto_apply = len(set(item["ticket"] for item in classified["auto_apply"]))
+    unique_total = len({item["ticket"] for item in recommendations})
+    unique_auto_apply = len({item["ticket"] for item in classified["auto_apply"]})
 
     # Build detailed ticket information with team and component assignments
     auto_apply_items = build_ticket_details(classified["auto_apply"], token_storage, user_id)
@@ -480,16 +686,13 @@ def run_triage(
 
     # Apply all recommendations (if not dry-run)
     if not dry_run and classified["auto_apply"]:
-        unique_apply_count = len(set(item["ticket"] for item in classified["auto_apply"]))
-        logger.info(
-            f"Applying {len(classified['auto_apply'])} recommendations "
-            f"to {unique_apply_count} issues"
-        )
+        unique_apply_count = len({item["ticket"] for item in classified["auto_apply"]})
+        logger.info("Applying {} recommendations to {} issues", len(classified["auto_apply"]), unique_apply_count)
         apply_results = apply_recommendations(classified["auto_apply"], token_storage, user_id)
 
         # Count unique issues (not fields)
-        unique_applied = len(set(item["ticket"] for item in apply_results["applied"]))
-        unique_failed = len(set(item["ticket"] for item in apply_results["failed"]))
+        unique_applied = len({item["ticket"] for item in apply_results["applied"]})
+        unique_failed = len({item["ticket"] for item in apply_results["failed"]})
 
         # Build detailed ticket information with team and component assignments
         applied_items = build_ticket_details(apply_results["applied"], token_storage, user_id)
@@ -500,15 +703,144 @@ def run_triage(
         results["applied_items"] = applied_items
         results["failed_items"] = failed_items
     elif dry_run:
-        unique_auto_apply_count = len(set(item["ticket"] for item in classified["auto_apply"]))
+        unique_auto_apply_count = len({item["ticket"] for item in classified["auto_apply"]})
         logger.info(
-            f"Dry-run mode: Would apply {len(classified['auto_apply'])} recommendations "
-            f"to {unique_auto_apply_count} issues"
+            "Dry-run mode: Would apply {} recommendations to {} issues",
+            len(classified["auto_apply"]),
+            unique_auto_apply_count,
         )
 
     return results
 
 
+def create_daemon_server(socket_path: str, user_id: str, db_path: str, dry_run: bool, use_cache: bool, cache_ttl: int):
+    """Create the Unix socket server used by serve_daemon().
+
+    Each connection sends one JSON request line, for example
+    {"jql": "project=RHIDP", "dry_run": true}, and receives the run_triage()
+    results as JSON before the connection is closed. Requests are handled one
+    at a time so the shared agent is never run concurrently.
+
+    Args:
+        socket_path: Unix socket path to listen on
+        user_id: Default user identifier for requests
+        db_path: Database file path
+        dry_run: If True, every request is a dry run; otherwise the default for requests
+        use_cache: Default response cache mode for requests
+        cache_ttl: Maximum age in seconds of a cached agent response
+
+    Returns:
+        socketserver.UnixStreamServer bound to socket_path
+    """
+    import socketserver
+    import uuid
+
+    class TriageRequestHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            try:
+                request = json.loads(self.rfile.readline())
+                # A daemon started with --dry-run never applies changes, whatever the request asks
+                if dry_run and request.get("dry_run") is False:
+                    logger.warning("Ignoring dry_run=false request: daemon is running in dry-run mode")
+                results = run_triage(
+                    user_id=request.get("user_id", user_id),
+                    db_path=db_path,
+                    jql_filter=request.get("jql"),
+                    dry_run=dry_run or request.get("dry_run", dry_run),
+                    json_output=True,
+                    use_cache=request.get("use_cache", use_cache),
+                    cache_ttl=cache_ttl,
+                    session_id=str(uuid.uuid4()),  # Keep each request's history separate
+                )
+            except Exception as e:
+                logger.error("Daemon request failed: {}", e)
+                results = {"success": False, "error": str(e), "total": 0, "auto_apply": 0, "applied": 0, "failed": 0}
+            self.wfile.write(dumps_results(results).encode("utf-8"))
+
+    socket_file = Path(socket_path)
+    socket_file.parent.mkdir(parents=True, exist_ok=True)
+    socket_file.unlink(missing_ok=True)
+
+    return socketserver.UnixStreamServer(socket_path, TriageRequestHandler)
+
+
+def serve_daemon(socket_path: str, user_id: str, db_path: str, dry_run: bool, use_cache: bool, cache_ttl: int) -> None:
+    """Serve triage requests over a Unix socket, reusing the agent between runs.
+
+    See create_daemon_server() for the request format.
+
+    Args:
+        socket_path: Unix socket path to listen on
+        user_id: Default user identifier for requests
+        db_path: Database file path
+        dry_run: If True, every request is a dry run; otherwise the default for requests
+        use_cache: Default response cache mode for requests
+        cache_ttl: Maximum age in seconds of a cached agent response
+    """
+    socket_file = Path(socket_path)
+
+    with create_daemon_server(socket_path, user_id, db_path, dry_run, use_cache, cache_ttl) as server:
+        logger.info("Triage daemon listening on {}", socket_path)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Triage daemon stopping")
+        finally:
+            socket_file.unlink(missing_ok=True)
+
+
+def send_daemon_request(socket_path: str, request: dict) -> dict:
+    """Send a triage request to a running daemon and wait for its results.
+
+    Args:
+        socket_path: Unix socket path of the daemon
+        request: Request dictionary (jql, dry_run, user_id, use_cache)
+
+    Returns:
+        Results dictionary from the daemon's run_triage(), or a failure result if
+        the daemon cannot be reached
+    """
+    import socket
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(socket_path)
+            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            sock.shutdown(socket.SHUT_WR)
+
+            chunks = []
+            while data := sock.recv(65536):
+                chunks.append(data)
+    except OSError as e:
+        logger.error("Failed to reach triage daemon on {}: {}", socket_path, e)
+        return {
+            "success": False,
+            "error": f"Failed to reach triage daemon on {socket_path}: {e}",
+            "total": 0,
+            "auto_apply": 0,
+            "applied": 0,
+            "failed": 0,
+        }
+
+    return json.loads(b"".join(chunks))
+
+
+def dumps_results(results: dict) -> str:
+    """Serialize triage results as indented JSON.
+
+    Uses orjson when it is installed and falls back to the stdlib encoder.
+
+    Args:
+        results: Results dictionary from run_triage()
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(results, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(results, indent=2)
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Automated Jira triage with confidence-based auto-apply")
@@ -551,6 +883,38 @@ def main():
         help=f"Database file path (default: {DB_PATH})",
     )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always run the agent instead of reusing a cached response; --apply never uses the cache (default: False)",
+    )
+
+    parser.add_argument(
+        "--cache-ttl",
+        type=int,
+        default=TRIAGE_CACHE_TTL,
+        help=f"Maximum age in seconds of a cached agent response (default: {TRIAGE_CACHE_TTL})",
+    )
+
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Stay resident and serve triage requests on --socket, reusing the agent (default: False)",
+    )
+
+    parser.add_argument(
+        "--client",
+        action="store_true",
+        help="Send this run to a daemon listening on --socket instead of running locally (default: False)",
+    )
+
+    parser.add_argument(
+        "--socket",
+        type=str,
+        default=DAEMON_SOCKET_PATH,
+        help=f"Unix socket path for --daemon/--client (default: {DAEMON_SOCKET_PATH})",
+    )
+
     args = parser.parse_args()
 
     # Validate arguments
@@ -558,19 +922,43 @@ def main():
         logger.error("Must specify either --dry-run or --apply")
         sys.exit(1)
 
-    # Run triage
-    results = run_triage(
-        user_id=args.user_id,
-        db_path=args.db_path,
-        jql_filter=args.jql,
-        dry_run=args.dry_run,
-        confidence_threshold=80,  # Not used, but kept for backward compatibility
-        json_output=args.json_output,
-    )
+    # Verify JIRA_API_TOKEN is set before running locally or starting the daemon
+    if not args.client and not os.getenv("JIRA_API_TOKEN"):
+        logger.error("JIRA_API_TOKEN environment variable is required")
+        sys.exit(1)
+
+    if args.daemon:
+        serve_daemon(
+            socket_path=args.socket,
+            user_id=args.user_id,
+            db_path=args.db_path,
+            dry_run=args.dry_run,
+            use_cache=not args.no_cache,
+            cache_ttl=args.cache_ttl,
+        )
+        sys.exit(0)
+
+    # Run triage (in a running daemon, or locally)
+    if args.client:
+        results = send_daemon_request(
+            args.socket,
+            {"jql": args.jql, "dry_run": args.dry_run, "user_id": args.user_id, "use_cache": not args.no_cache},
+        )
+    else:
+        results = run_triage(
+            user_id=args.user_id,
+            db_path=args.db_path,
+            jql_filter=args.jql,
+            dry_run=args.dry_run,
+            confidence_threshold=80,  # Not used, but kept for backward compatibility
+            json_output=args.json_output,
+            use_cache=not args.no_cache,
+            cache_ttl=args.cache_ttl,
+        )
 
     # Output results
     if args.json_output:
-        print(json.dumps(results, indent=2))
+        print(dumps_results(results))
     else:
         print("\n=== Triage Summary ===")
         print(f"Total recommendations: {results['total']}")
@@ -472,17 +472,19 @@ class BaseAgentWrapper(ABC):
 
                     if isinstance(chunk, RunContentEvent):
                         # Handle Gemini native thinking content
-                        if hasattr(chunk, "reasoning_content") and chunk.reasoning_content:
+                        # (content and reasoning_content are dataclass fields, no hasattr probing needed)
+                        reasoning_content = chunk.reasoning_content
+                        if reasoning_content:
                             if reasoning_start_time is None:
                                 import time
 
                                 reasoning_start_time = time.time()
                                 logger.info("💭 Reasoning started")
 
-                            reasoning_content_parts.append(chunk.reasoning_content)
+                            reasoning_content_parts.append(reasoning_content)
                             continue
 
-                        content = chunk.content if hasattr(chunk, "content") else str(chunk)
+                        content = chunk.content
 
                         if not content:
                             continue
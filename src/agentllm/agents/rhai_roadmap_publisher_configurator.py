@@ -12,97 +12,10 @@ from agentllm.agents.toolkit_configs.system_prompt_extension_config import (
     SystemPromptExtensionConfig,
 )
 
-
-class RHAIRoadmapPublisherConfigurator(AgentConfigurator):
-    """Configurator for RHAI Roadmap Publisher Agent.
-
-    Handles configuration management and agent building for the RHAI Roadmap Publisher.
-    """
-
-    def __init__(
-        self,
-        user_id: str,
-        session_id: str | None,
-        shared_db: SqliteDb,
-        token_storage,
-        temperature: float | None = None,
-        max_tokens: int | None = None,
-        agent_kwargs: dict[str, Any] | None = None,
-        **model_kwargs: Any,
-    ):
-        """Initialize RHAI Roadmap Publisher configurator.
-
-        Args:
-            user_id: User identifier
-            session_id: Session identifier
-            shared_db: Shared database
-            token_storage: TokenStorage instance
-            temperature: Optional model temperature
-            max_tokens: Optional max tokens
-            agent_kwargs: Additional Agent constructor kwargs
-            **model_kwargs: Additional model parameters
-        """
-        # Store token_storage for use in _initialize_toolkit_configs
-        self._token_storage = token_storage
-
-        # Call parent constructor (will call _initialize_toolkit_configs)
-        super().__init__(
-            user_id=user_id,
-            session_id=session_id,
-            shared_db=shared_db,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            agent_kwargs=agent_kwargs,
-            **model_kwargs,
-        )
-
-    def _get_agent_name(self) -> str:
-        """Get agent name for identification.
-
-        Returns:
-            str: Agent name
-        """
-        return "rhai-roadmap-publisher"
-
-    def _get_agent_description(self) -> str:
-        """Get agent description.
-
-        Returns:
-            str: Human-readable description
+# RHAI Roadmap Publisher system prompt, split into instruction lines once at import time
+_RHAI_ROADMAP_PUBLISHER_INSTRUCTIONS: tuple[str, ...] = tuple(
+    textwrap.dedent(
         """
-        return "A helpful AI assistant"
-
-    def _initialize_toolkit_configs(self) -> list[BaseToolkitConfig]:
-        """Initialize toolkit configurations for RHAI Roadmap Publisher.
-
-        Returns:
-            list[BaseToolkitConfig]: List of toolkit configs
-        """
-        # ORDER MATTERS: SystemPromptExtensionConfig and RHAIToolkitConfig depend on GoogleDriveConfig
-        gdrive_config = GoogleDriveConfig(token_storage=self._token_storage)
-        jira_config = JiraConfig(token_storage=self._token_storage)
-        system_prompt_config = SystemPromptExtensionConfig(
-            gdrive_config=gdrive_config, token_storage=self._token_storage
-        )
-        rhai_toolkit_config = RHAIToolkitConfig(
-            gdrive_config=gdrive_config, token_storage=self._token_storage
-        )
-
-        return [
-            gdrive_config,
-            jira_config,
-            system_prompt_config,  # Must come after gdrive_config due to dependency
-            rhai_toolkit_config,  # Must come after gdrive_config due to dependency
-        ]
-
-    def _build_agent_instructions(self) -> list[str]:
-        """Build system prompt instructions for RHAI Roadmap Publisher.
-
-        Returns:
-            list[str]: List of instruction strings
-        """
-        _prompt = textwrap.dedent(
-            """
 You are the Roadmap Publisher for Red Hat AI (RHAI), an expert in creating product roadmaps, JIRA issue analysis, and roadmap visualization. Your expertise lies in transforming strategic JIRA issues into clear, timeline-based roadmaps that communicate product direction across quarters.
 
 ## Core Responsibilities
@@ -282,8 +195,101 @@ A successful roadmap will:
 - Communicate strategic value and dependencies
 - Be immediately actionable for product planning discussions
 """
-        ).strip()
-        return _prompt.splitlines()  # list[str], one element per line
+    )
+    .strip()
+    .splitlines()
+)
+
+
+class RHAIRoadmapPublisherConfigurator(AgentConfigurator):
+    """Configurator for RHAI Roadmap Publisher Agent.
+
+    Handles configuration management and agent building for the RHAI Roadmap Publisher.
+    """
+
+    def __init__(
+        self,
+        user_id: str,
+        session_id: str | None,
+        shared_db: SqliteDb,
+        token_storage,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        agent_kwargs: dict[str, Any] | None = None,
+        **model_kwargs: Any,
+    ):
+        """Initialize RHAI Roadmap Publisher configurator.
+
+        Args:
+            user_id: User identifier
+            session_id: Session identifier
+            shared_db: Shared database
+            token_storage: TokenStorage instance
+            temperature: Optional model temperature
+            max_tokens: Optional max tokens
+            agent_kwargs: Additional Agent constructor kwargs
+            **model_kwargs: Additional model parameters
+        """
+        # Store token_storage for use in _initialize_toolkit_configs
+        self._token_storage = token_storage
+
+        # Call parent constructor (will call _initialize_toolkit_configs)
+        super().__init__(
+            user_id=user_id,
+            session_id=session_id,
+            shared_db=shared_db,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            agent_kwargs=agent_kwargs,
+            **model_kwargs,
+        )
+
+    def _get_agent_name(self) -> str:
+        """Get agent name for identification.
+
+        Returns:
+            str: Agent name
+        """
+        return "rhai-roadmap-publisher"
+
+    def _get_agent_description(self) -> str:
+        """Get agent description.
+
+        Returns:
+            str: Human-readable description
+        """
+        return "A helpful AI assistant"
+
+    def _initialize_toolkit_configs(self) -> list[BaseToolkitConfig]:
+        """Initialize toolkit configurations for RHAI Roadmap Publisher.
+
+        Returns:
+            list[BaseToolkitConfig]: List of toolkit configs
+        """
+        # ORDER MATTERS: SystemPromptExtensionConfig and RHAIToolkitConfig depend on GoogleDriveConfig
+        gdrive_config = GoogleDriveConfig(token_storage=self._token_storage)
+        jira_config = JiraConfig(token_storage=self._token_storage)
+        system_prompt_config = SystemPromptExtensionConfig(
+            gdrive_config=gdrive_config, token_storage=self._token_storage
+        )
+        rhai_toolkit_config = RHAIToolkitConfig(
+            gdrive_config=gdrive_config, token_storage=self._token_storage
+        )
+
+        return [
+            gdrive_config,
+            jira_config,
+            system_prompt_config,  # Must come after gdrive_config due to dependency
+            rhai_toolkit_config,  # Must come after gdrive_config due to dependency
+        ]
+
+    def _build_agent_instructions(self) -> list[str]:
+        """Build system prompt instructions for RHAI Roadmap Publisher.
+
+        Returns:
+            list[str]: List of instruction strings
+        """
+        return list(_RHAI_ROADMAP_PUBLISHER_INSTRUCTIONS)
 
     def _build_model_params(self) -> dict[str, Any]:
         """Build model parameters with Gemini native thinking capability.
@@ -1,5 +1,6 @@
 """Sprint Reviewer Configurator - Configuration management for Sprint Reviewer Agent."""
 
+import sys
 import textwrap
 from typing import Any
 
@@ -9,88 +10,11 @@ from agentllm.agents.base import AgentConfigurator, BaseToolkitConfig
 from agentllm.agents.toolkit_configs import GoogleDriveConfig
 from agentllm.agents.toolkit_configs.jira_config import JiraConfig
 
-
-class SprintReviewerConfigurator(AgentConfigurator):
-    """Configurator for Sprint Reviewer Agent.
-
-    Handles configuration management and agent building for the Sprint Reviewer.
-    """
-
-    def __init__(
-        self,
-        user_id: str,
-        session_id: str | None,
-        shared_db: SqliteDb,
-        token_storage,
-        temperature: float | None = None,
-        max_tokens: int | None = None,
-        agent_kwargs: dict[str, Any] | None = None,
-        **model_kwargs: Any,
-    ):
-        """Initialize Sprint Reviewer configurator.
-
-        Args:
-            user_id: User identifier
-            session_id: Session identifier
-            shared_db: Shared database
-            token_storage: TokenStorage instance
-            temperature: Optional model temperature
-            max_tokens: Optional max tokens
-            agent_kwargs: Additional Agent constructor kwargs
-            **model_kwargs: Additional model parameters
-        """
-        # Store token_storage for use in _initialize_toolkit_configs
-        self._token_storage = token_storage
-
-        # Call parent constructor (will call _initialize_toolkit_configs)
-        super().__init__(
-            user_id=user_id,
-            session_id=session_id,
-            shared_db=shared_db,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            agent_kwargs=agent_kwargs,
-            **model_kwargs,
-        )
-
-    def _get_agent_name(self) -> str:
-        """Get agent name for identification.
-
-        Returns:
-            str: Agent name
-        """
-        return "sprint-reviewer"
-
-    def _get_agent_description(self) -> str:
-        """Get agent description.
-
-        Returns:
-            str: Human-readable description
-        """
-        return "AI assistant for generating sprint reviews"
-
-    def _initialize_toolkit_configs(self) -> list[BaseToolkitConfig]:
-        """Initialize toolkit configurations for Sprint Reviewer.
-
-        Returns:
-            list[BaseToolkitConfig]: List of toolkit configs
-        """
-        gdrive_config = GoogleDriveConfig(token_storage=self._token_storage)
-        jira_config = JiraConfig(token_storage=self._token_storage)
-
-        return [
-            gdrive_config,
-            jira_config,
-        ]
-
-    def _build_agent_instructions(self) -> list[str]:
-        """Build system prompt instructions for Sprint Reviewer.
-
-        Returns:
-            list[str]: List of instruction strings
+# Sprint Reviewer system prompt, split into interned instruction lines once at import time
+_SPRINT_REVIEWER_INSTRUCTIONS: tuple[str, ...] = tuple(
+    sys.intern(line)
+    for line in textwrap.dedent(
         """
-        _prompt = textwrap.dedent(
-            """
 You are the Sprint Reviewer for development teams.
 Your core responsibility is to create comprehensive sprint reviews for teams in Markdown output.
 
@@ -98,23 +22,22 @@ Your core responsibility is to create comprehensive sprint reviews for teams in
 
 1. **Read team mapping**: First, read the team mapping document (https://docs.google.com/document/d/1zy1PgQGSdADNMsbmRKVeq-tz_jU-nEz7ugOhlAbv1cg)
    - Extract <team_name> to <team_id> mappings
-2. **Search current sprint issues**: Call Jira search_issues tool with JQL query:
-   `sprint in openSprints() and team = <team_id> and status in ("In progress", "Review", "Closed") ORDER BY priority DESC`
-   - These issues will be used for "This sprint:" section
-3. **Extract sprint info**: Call Jira extract_sprint_info tool with the first issue key from search results
-   - Returns: {sprint_id, sprint_name} or None if unable to extract
-4. **Get sprint metrics**: Call Jira get_sprint_metrics with the sprint_id from step 3
-   - Returns structured metrics: total_planned, total_closed, stories_tasks_closed, bugs_closed
-5. **Search backlog issues**: Call Jira search_issues tool with JQL query:
-   `team = <team_id> AND status = "To Do" AND sprint is EMPTY ORDER BY priority DESC`
-   - Limit to max 15 issues
-   - These issues will be used for "Next sprint:" section
-6. **Generate review**: Create sprint review with metrics and issue details from both searches
-
-## JQL queries for Metric Links and encoding instructions
-
-- Use following JQL queries for metric links instead of <encoded_jql> in Sprint Review Output Format
-- First choose correct JQL query based upon context and then encode it based upon Encoding Instructions
+2. **Fetch sprint data**: Call Jira prepare_sprint_data tool ONCE with the <team_id>
+   - It runs all Jira queries concurrently and returns:
+     - `current_sprint`: issues matching `sprint in openSprints() and team = <team_id> and status in ("In progress", "Review", "Closed") ORDER BY priority DESC`
+       These issues will be used for "This sprint:" section
+     - `backlog`: max 15 issues matching `team = <team_id> AND status = "To Do" AND sprint is EMPTY ORDER BY priority DESC`
+       These issues will be used for "Next sprint:" section
+     - `sprint`: {sprint_id, sprint_name} or null if unable to extract
+     - `metrics`: total_planned, total_closed, stories_tasks_closed, bugs_closed
+     - `epics`: Epic Link → epic summary for every epic referenced by the issues
+   - Do NOT call search, extract_sprint_info, get_sprint_metrics or get_issue separately for this data
+3. **Generate review**: Create sprint review with metrics and issue details from both issue lists
+
+## JQL queries for Metric Links
+
+- Use following JQL queries for metric links instead of <metric_link> in Sprint Review Output Format
+- Call Jira build_metric_link(jql) for each of the four metric links and use the returned URL as is
 
 **JQL Queries for Metric Links:**
 - Total planned: `Sprint = <sprint_id>`
@@ -122,13 +45,6 @@ Your core responsibility is to create comprehensive sprint reviews for teams in
 - Stories/tasks closed: `Sprint = <sprint_id> AND resolution = done AND type in (Story, Task)`
 - Bugs closed: `Sprint = <sprint_id> AND resolution = done AND type = Bug`
 
-**URL Encoding Instructions:**
-- Spaces → `%20`
-- Equals `=` → `%3D`
-- Parentheses `()` → `%28` and `%29`
-- Commas `,` → `%2C`
-- Example: `Sprint = 75290` becomes `Sprint%20%3D%2075290`
-
 ## Sprint Review Output Format
 
 Generate a well-structured sprint review in markdown in the following format,
@@ -143,22 +59,22 @@ Team <Team Name>
 - [Sprint Board](https://issues.redhat.com/secure/RapidBoard.jspa?rapidView=17761)
 - [Sprint Report](https://issues.redhat.com/secure/RapidBoard.jspa?rapidView=17761&projectKey=RHIDP&view=reporting&chart=sprintRetrospective&sprint=<sprint_id>)
 
-- [Completed X](https://issues.redhat.com/issues/?jql=<encoded_jql>) / [Y planned](https://issues.redhat.com/issues/?jql=<encoded_jql>) issues
-  [Use total_closed for X and total_planned for Y from get_sprint_metrics result, use encoded JQL queries for metric links]
+- [Completed X](<metric_link>) / [Y planned](<metric_link>) issues
+  [Use total_closed for X and total_planned for Y from metrics, use build_metric_link results for metric links]
 
-  - [X stories/tasks](https://issues.redhat.com/issues/?jql=<encoded_jql>)
-    [Use stories_tasks_closed for X value from get_sprint_metrics result]
-  - [X bugs](https://issues.redhat.com/issues/?jql=<encoded_jql>)
-    [Use bugs_closed for X value from get_sprint_metrics result]
+  - [X stories/tasks](<metric_link>)
+    [Use stories_tasks_closed for X value from metrics]
+  - [X bugs](<metric_link>)
+    [Use bugs_closed for X value from metrics]
 
 ## This sprint:
 
-- List issues from Workflow step 2 (current sprint issues) in bullet points
+- List `current_sprint` issues in bullet points
 - Use Epic Grouping Logic below
 
 ## Next sprint:
 
-- List issues from Workflow step 5 (backlog issues) in bullet points
+- List `backlog` issues in bullet points
 - Use Epic Grouping Logic below
 
 ## Acknowledgments
@@ -168,19 +84,20 @@ Team <Team Name>
 ```
 
 ## Epic Grouping Logic for listing issues:
-1. Check each issue's `customfield_12311140` (Epic Link) field
+1. Check each issue's `epic_link` (Epic Link, customfield_12311140) field
 2. Count how many issues share the same Epic Link value
 3. If 2+ issues have the same Epic Link → Group them under that epic
 4. If only 1 issue has an Epic Link → List it as a standalone issue (no epic grouping)
 5. The Epic Link value is the epic's issue ID (e.g., 'RHIDP-123'), not the title
-6. Use get_issue tool to fetch the epic's summary when grouping issues under an epic
+6. Use the `epics` map to get the epic's summary when grouping issues under an epic
+   - If any epic summaries are missing, call get_issues_bulk ONCE with the deduplicated list of missing Epic Link IDs (never loop get_issue)
 
 ## Format for listing issues:
 
 **JIRA Field Mapping:**
 - <status> = issue's "status" field (e.g., "Closed", "In progress", "Review")
 - <issue summary> = issue's "summary" field (the issue title)
-- <Epic summary> = epic's "summary" field (from get_issue tool)
+- <Epic summary> = epic's summary (from the `epics` map or get_issues_bulk)
 
 - **Format for Grouped Issues (2 and more issues share the same Epic Link):**
   - **<Epic summary>** ([EPIC-ID](https://issues.redhat.com/browse/EPIC-ID))
@@ -197,39 +114,121 @@ Team <Team Name>
 - **Ordering of listed issues:**
   - Order issues by priority: Blocker, Major, Normal, Minor, Undefined
   - Within epic groups, also order sub-issues by priority
-  - Tool search_issues returns issues already ordered by priority
+  - Tool prepare_sprint_data returns issues already ordered by priority
 
 ## Available Tools
 
 - Google Drive: Read the team mapping document to get team name to team ID mappings
-- Jira search_issues: Search for issues in current sprint using JQL query
-- Jira extract_sprint_info: Returns sprint_id and sprint_name from an issue key
-- Jira get_sprint_metrics: Returns sprint metrics (total_planned, total_closed, stories_tasks_closed, bugs_closed) for a given sprint_id
-- Jira get_issue: Get individual issue details (for epic information)
+- Jira prepare_sprint_data: Returns current sprint issues, backlog issues, sprint info, sprint metrics and epic summaries for a team_id
+- Jira get_issues_bulk: Get several issues (e.g. epics) by key in a single query
+- Jira build_metric_link: Returns the Jira search URL for a JQL query (handles URL encoding)
 
 ## Error handling
 
 - If team name is not found in the mapping document, ask the user for clarification and list what teams are available
-- If extract_sprint_info returns None, omit the clickable metric links and sprint report link
+- If `sprint` is null, omit the clickable metric links and sprint report link
   Use as report title: # Sprint Review for team <Team Name>
 
 ## Quality Standards
 
 - Include JIRA links for all issues
 - Include all JIRA tickets from both searches:
-  - Workflow step 2 (current sprint issues) → "This sprint:" section
-  - Workflow step 5 (backlog issues, max 15) → "Next sprint:" section
+  - `current_sprint` issues → "This sprint:" section
+  - `backlog` issues (max 15) → "Next sprint:" section
 - If there is no error, always execute all steps from workflow when prompted to create sprint review
 - Use actual JIRA issue data - never fabricate or assume information
-- Use metrics data returned from get_sprint_metrics, do not calculate these metrics on your own
+- Use metrics data returned from prepare_sprint_data, do not calculate these metrics on your own
 - Maintain consistency with JIRA field values (status, priority, etc.)
 - Use clear, concise descriptions
 - Use consistent formatting and structure
 - Use directly issue summary in bullet points
 """
-        ).strip()
+    )
+    .strip()
+    .splitlines()
+)
 
-        return _prompt.splitlines()
+
+class SprintReviewerConfigurator(AgentConfigurator):
+    """Configurator for Sprint Reviewer Agent.
+
+    Handles configuration management and agent building for the Sprint Reviewer.
+    """
+
+    def __init__(
+        self,
+        user_id: str,
+        session_id: str | None,
+        shared_db: SqliteDb,
+        token_storage,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        agent_kwargs: dict[str, Any] | None = None,
+        **model_kwargs: Any,
+    ):
+        """Initialize Sprint Reviewer configurator.
+
+        Args:
+            user_id: User identifier
+            session_id: Session identifier
+            shared_db: Shared database
+            token_storage: TokenStorage instance
+            temperature: Optional model temperature
+            max_tokens: Optional max tokens
+            agent_kwargs: Additional Agent constructor kwargs
+            **model_kwargs: Additional model parameters
+        """
+        # Store token_storage for use in _initialize_toolkit_configs
+        self._token_storage = token_storage
+
+        # Call parent constructor (will call _initialize_toolkit_configs)
+        super().__init__(
+            user_id=user_id,
+            session_id=session_id,
+            shared_db=shared_db,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            agent_kwargs=agent_kwargs,
+            **model_kwargs,
+        )
+
+    def _get_agent_name(self) -> str:
+        """Get agent name for identification.
+
+        Returns:
+            str: Agent name
+        """
+        return "sprint-reviewer"
+
+    def _get_agent_description(self) -> str:
+        """Get agent description.
+
+        Returns:
+            str: Human-readable description
+        """
+        return "AI assistant for generating sprint reviews"
+
+    def _initialize_toolkit_configs(self) -> list[BaseToolkitConfig]:
+        """Initialize toolkit configurations for Sprint Reviewer.
+
+        Returns:
+            list[BaseToolkitConfig]: List of toolkit configs
+        """
+        gdrive_config = GoogleDriveConfig(token_storage=self._token_storage)
+        jira_config = JiraConfig(token_storage=self._token_storage)
+
+        return [
+            gdrive_config,
+            jira_config,
+        ]
+
+    def _build_agent_instructions(self) -> list[str]:
+        """Build system prompt instructions for Sprint Reviewer.
+
+        Returns:
+            list[str]: List of instruction strings
+        """
+        return list(_SPRINT_REVIEWER_INSTRUCTIONS)
 
     def _build_model_params(self) -> dict[str, Any]:
         """Build model parameters with Gemini native thinking capability.
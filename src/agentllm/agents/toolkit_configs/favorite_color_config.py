@@ -10,10 +10,22 @@ from typing import Any
 
 from loguru import logger
 
-from agentllm.utils.logging import safe_log_content
+from agentllm.utils.logging import lazy_safe_log_content
 
 from .base import BaseToolkitConfig
 
+# Color extraction patterns, compiled once and tried in order
+_COLOR_PATTERNS = (
+    # "my favorite color is X"
+    (re.compile(r"(?:my\s+)?favorite\s+color\s+(?:is|=|:)\s+(\w+)", re.IGNORECASE), "my favorite color is X"),
+    # "I like X" or "I love X"
+    (re.compile(r"I\s+(?:like|love|prefer)\s+(\w+)", re.IGNORECASE), "I like/love X"),
+    # "set color to X" or "configure color X"
+    (re.compile(r"(?:set|configure)\s+color\s+(?:to\s+)?(\w+)", re.IGNORECASE), "set color to X"),
+    # "color: X" or "color = X"
+    (re.compile(r"color\s*[:=]\s*(\w+)", re.IGNORECASE), "color: X"),
+)
+
 
 class FavoriteColorConfig(BaseToolkitConfig):
     """
@@ -124,7 +136,7 @@ class FavoriteColorConfig(BaseToolkitConfig):
         """
         logger.debug("=" * 80)
         logger.info(f">>> extract_and_store_config() STARTED - user_id={user_id}")
-        logger.debug(safe_log_content(message, "Message to analyze"))
+        logger.debug(lazy_safe_log_content(message, "Message to analyze"))
 
         # Try to extract color using regex patterns
         color = self._extract_color_from_message(message)
@@ -190,37 +202,12 @@ class FavoriteColorConfig(BaseToolkitConfig):
         """
         logger.debug("_extract_color_from_message() called")
 
-        # Pattern 1: "my favorite color is X"
-        pattern1 = r"(?:my\s+)?favorite\s+color\s+(?:is|=|:)\s+(\w+)"
-        match = re.search(pattern1, message, re.IGNORECASE)
-        if match:
-            color = match.group(1).lower()
-            logger.debug(f"Pattern 1 matched: '{color}' (my favorite color is X)")
-            return color
-
-        # Pattern 2: "I like X" or "I love X"
-        pattern2 = r"I\s+(?:like|love|prefer)\s+(\w+)"
-        match = re.search(pattern2, message, re.IGNORECASE)
-        if match:
-            color = match.group(1).lower()
-            logger.debug(f"Pattern 2 matched: '{color}' (I like/love X)")
-            return color
-
-        # Pattern 3: "set color to X" or "configure color X"
-        pattern3 = r"(?:set|configure)\s+color\s+(?:to\s+)?(\w+)"
-        match = re.search(pattern3, message, re.IGNORECASE)
-        if match:
-            color = match.group(1).lower()
-            logger.debug(f"Pattern 3 matched: '{color}' (set color to X)")
-            return color
-
-        # Pattern 4: "color: X" or "color = X"
-        pattern4 = r"color\s*[:=]\s*(\w+)"
-        match = re.search(pattern4, message, re.IGNORECASE)
-        if match:
-            color = match.group(1).lower()
-            logger.debug(f"Pattern 4 matched: '{color}' (color: X)")
-            return color
+        for pattern, description in _COLOR_PATTERNS:
+            match = pattern.search(message)
+            if match:
+                color = match.group(1).lower()
+                logger.debug(f"Pattern matched: '{color}' ({description})")
+                return color
 
         logger.debug("No color pattern matched")
         return None
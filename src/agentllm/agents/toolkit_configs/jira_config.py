@@ -69,6 +69,9 @@ class JiraConfig(BaseToolkitConfig):
         create_issue: bool = False,
         extract_sprint_info: bool = True,
         get_sprint_metrics: bool = True,
+        get_issues_bulk: bool = True,
+        build_metric_link: bool = True,
+        prepare_sprint_data: bool = True,
         update_issue: bool = False,
     ):
         """Initialize JIRA configuration.
@@ -88,6 +91,9 @@ class JiraConfig(BaseToolkitConfig):
             create_issue: Enable create_issue tool (default: False)
             extract_sprint_info: Enable extract_sprint_info tool (default: True)
             get_sprint_metrics: Enable get_sprint_metrics tool (default: True)
+            get_issues_bulk: Enable get_issues_bulk tool (default: True)
+            build_metric_link: Enable build_metric_link tool (default: True)
+            prepare_sprint_data: Enable prepare_sprint_data tool (default: True)
             update_issue: Enable update_issue tool (default: False)
         """
         super().__init__(token_storage)
@@ -106,6 +112,9 @@ class JiraConfig(BaseToolkitConfig):
             "create_issue": create_issue,
             "extract_sprint_info": extract_sprint_info,
             "get_sprint_metrics": get_sprint_metrics,
+            "get_issues_bulk": get_issues_bulk,
+            "build_metric_link": build_metric_link,
+            "prepare_sprint_data": prepare_sprint_data,
             "update_issue": update_issue,
         }
 
@@ -15,7 +15,7 @@ from loguru import logger
 from agentllm.agents.base import AgentRegistry
 from agentllm.db import TokenStorage
 from agentllm.db.encryption import EncryptionKeyMissingError
-from agentllm.utils.logging import safe_log_content
+from agentllm.utils.logging import lazy_safe_log_content, safe_log_content
 
 # Configure logging for our custom handler using loguru
 # Remove default handler
@@ -237,7 +237,7 @@ class AgnoCustomLLM(CustomLLM):
             ModelResponse object
         """
         logger.info(f"_build_response() called for model={model}, content_length={len(content)}")
-        logger.debug(safe_log_content(content, "Content being added to response"))
+        logger.debug(lazy_safe_log_content(content, "Content being added to response"))
 
         message = Message(role="assistant", content=content)
         logger.debug(f"Created Message object: role={message.role}, content_length={len(message.content) if message.content else 0}")
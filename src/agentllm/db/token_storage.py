@@ -8,6 +8,7 @@ in their respective agent toolkit configs and registered with the global registr
 All sensitive tokens are encrypted at rest using Fernet symmetric encryption.
 """
 
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -25,6 +26,11 @@ if TYPE_CHECKING:
 # Base for demo-specific tables (not managed by registry)
 Base = declarative_base()
 
+# Token types whose deserialized value get_token() keeps in memory per user
+_CACHED_TOKEN_TYPES = frozenset({"gdrive"})
+# Shorter than the 60-minute Google access token lifetime
+_TOKEN_CACHE_TTL_SECONDS = 55 * 60
+
 
 class FavoriteColor(Base):
     """Table for storing user favorite colors (demo agent)."""
@@ -99,6 +105,9 @@ class TokenStorage:
         self._registry = registry or get_global_registry()
         logger.debug(f"Using token registry with {len(self._registry.list_types())} registered types: {self._registry.list_types()}")
 
+        # In-process cache for _CACHED_TOKEN_TYPES: (token_type, user_id) -> (stored_at, row version, token)
+        self._token_cache: dict[tuple[str, str], tuple[float, tuple[Any, ...], Any]] = {}
+
         # Create tables
         self._create_tables()
 
@@ -205,6 +214,8 @@ class TokenStorage:
             >>> storage.upsert_token("jira", "user123", token="abc", server_url="https://jira.com")
             >>> storage.upsert_token("github", "user123", token="ghp_xyz", server_url="https://api.github.com")
         """
+        self._token_cache.pop((token_type, user_id), None)
+
         try:
             config = self._registry.get(token_type)
 
@@ -265,7 +276,51 @@ class TokenStorage:
             >>> jira_data = storage.get_token("jira", "user123")
             >>> print(jira_data["token"])  # Decrypted token
             >>> gdrive_creds = storage.get_token("gdrive", "user123")  # Returns Credentials object
+
+        Note:
+            Tokens of _CACHED_TOKEN_TYPES (Google Drive credentials) are served from an
+            in-memory cache for up to 55 minutes, as long as the stored row is unchanged.
+            Other processes sharing the database (e.g. the OAuth callback server) may
+            rewrite the row, so every cache hit re-reads its id and updated_at first.
         """
+        if token_type not in _CACHED_TOKEN_TYPES:
+            return self._load_token(token_type, user_id)
+
+        cache_key = (token_type, user_id)
+        # Read the version before the token so a concurrent write can only make the entry look stale
+        version = self._token_version(token_type, user_id)
+        if version is None:
+            self._token_cache.pop(cache_key, None)
+            return self._load_token(token_type, user_id)
+
+        cached = self._token_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < _TOKEN_CACHE_TTL_SECONDS and cached[1] == version:
+            return cached[2]
+
+        token = self._load_token(token_type, user_id)
+
+        if token is not None:
+            self._token_cache[cache_key] = (time.monotonic(), version, token)
+        else:
+            self._token_cache.pop(cache_key, None)
+
+        return token
+
+    def _token_version(self, token_type: str, user_id: str) -> tuple[Any, ...] | None:
+        """Return (id, updated_at) of the stored token row, or None if missing or unreadable."""
+        try:
+            model = self._registry.get(token_type).model
+
+            with self.Session() as sess:
+                row = sess.query(model.id, model.updated_at).filter_by(user_id=user_id).first()
+                return tuple(row) if row else None
+
+        except Exception as e:
+            logger.error(f"Error checking {token_type} token version for user {user_id}: {e}")
+            return None
+
+    def _load_token(self, token_type: str, user_id: str) -> dict[str, Any] | Any | None:
+        """Read, decrypt and deserialize a token from the database (see get_token)."""
         try:
             config = self._registry.get(token_type)
 
@@ -324,6 +379,8 @@ class TokenStorage:
             >>> storage.delete_token("jira", "user123")
             >>> storage.delete_token("github", "user123")
         """
+        self._token_cache.pop((token_type, user_id), None)
+
         try:
             config = self._registry.get(token_type)
 
@@ -52,6 +52,8 @@ class OAuthProvider(ABC):
 class GoogleDriveProvider(OAuthProvider):
     """Google Drive OAuth provider implementation."""
 
+    PROVIDER_NAME = "google"
+
     def __init__(self, token_storage: TokenStorage):
         """Initialize Google Drive OAuth provider.
 
@@ -61,6 +63,7 @@ class GoogleDriveProvider(OAuthProvider):
         self.token_storage = token_storage
         self._client_id = os.environ.get("GDRIVE_CLIENT_ID")
         self._client_secret = os.environ.get("GDRIVE_CLIENT_SECRET")
+        self._configured = bool(self._client_id and self._client_secret)
         self._scopes = [
             "https://www.googleapis.com/auth/drive.readonly",
             "https://www.googleapis.com/auth/documents.readonly",
@@ -70,11 +73,11 @@ class GoogleDriveProvider(OAuthProvider):
 
     def get_provider_name(self) -> str:
         """Get the provider name."""
-        return "google"
+        return self.PROVIDER_NAME
 
     def is_configured(self) -> bool:
-        """Check if Google Drive OAuth credentials are configured."""
-        return bool(self._client_id and self._client_secret)
+        """Check if Google Drive OAuth credentials are configured (resolved once at construction)."""
+        return self._configured
 
     def exchange_code_for_token(self, code: str, state: str, redirect_uri: str) -> tuple[bool, str]:
         """Exchange authorization code for Google Drive access token.
@@ -171,6 +174,8 @@ class GoogleDriveProvider(OAuthProvider):
 class GitHubProvider(OAuthProvider):
     """GitHub OAuth provider implementation."""
 
+    PROVIDER_NAME = "github"
+
     def __init__(self, token_storage: TokenStorage):
         """Initialize GitHub OAuth provider.
 
@@ -180,14 +185,15 @@ class GitHubProvider(OAuthProvider):
         self.token_storage = token_storage
         self._client_id = os.environ.get("GITHUB_CLIENT_ID")
         self._client_secret = os.environ.get("GITHUB_CLIENT_SECRET")
+        self._configured = bool(self._client_id and self._client_secret)
 
     def get_provider_name(self) -> str:
         """Get the provider name."""
-        return "github"
+        return self.PROVIDER_NAME
 
     def is_configured(self) -> bool:
-        """Check if GitHub OAuth credentials are configured."""
-        return bool(self._client_id and self._client_secret)
+        """Check if GitHub OAuth credentials are configured (resolved once at construction)."""
+        return self._configured
 
     def exchange_code_for_token(self, code: str, state: str, redirect_uri: str) -> tuple[bool, str]:
         """Exchange authorization code for GitHub access token.
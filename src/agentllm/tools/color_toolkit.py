@@ -5,9 +5,82 @@ This toolkit demonstrates simple tool creation without external API dependencies
 All tools use pure Python logic and extensive logging.
 """
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 from agno.tools import Toolkit
 from loguru import logger
 
+# Accepted tool arguments
+_VALID_PALETTES = ("complementary", "analogous", "monochromatic")
+_VALID_THEMES = ("bold", "elegant", "playful")
+
+# Color theory mappings (simplified)
+_COMPLEMENTARY_COLORS: Mapping[str, str] = MappingProxyType(
+    {
+        "red": "green",
+        "green": "red",
+        "blue": "orange",
+        "orange": "blue",
+        "yellow": "purple",
+        "purple": "yellow",
+        "pink": "green",
+        "black": "white",
+        "white": "black",
+        "brown": "blue",
+    }
+)
+
+_ANALOGOUS_COLORS: Mapping[str, tuple[str, str]] = MappingProxyType(
+    {
+        "red": ("orange", "pink"),
+        "orange": ("red", "yellow"),
+        "yellow": ("orange", "green"),
+        "green": ("yellow", "blue"),
+        "blue": ("green", "purple"),
+        "purple": ("blue", "pink"),
+        "pink": ("purple", "red"),
+        "black": ("brown", "purple"),
+        "white": ("yellow", "pink"),
+        "brown": ("orange", "red"),
+    }
+)
+
+# Hex code mappings for colors
+_COLOR_HEX_CODES: Mapping[str, str] = MappingProxyType(
+    {
+        "red": "#FF0000",
+        "green": "#00FF00",
+        "blue": "#0000FF",
+        "orange": "#FFA500",
+        "yellow": "#FFFF00",
+        "purple": "#800080",
+        "pink": "#FFC0CB",
+        "black": "#000000",
+        "white": "#FFFFFF",
+        "brown": "#A52A2A",
+        "gray": "#808080",
+        "silver": "#C0C0C0",
+        "darkseagreen4": "#698B69",
+    }
+)
+
+# Color mood mappings for intelligent scheme design
+_COLOR_MOODS: Mapping[str, Mapping[str, int]] = MappingProxyType(
+    {
+        "red": {"energy": 9, "warmth": 8, "calm": 2, "professional": 5, "creativity": 7},
+        "blue": {"energy": 3, "warmth": 2, "calm": 9, "professional": 9, "creativity": 6},
+        "green": {"energy": 5, "warmth": 4, "calm": 8, "professional": 7, "creativity": 5},
+        "yellow": {"energy": 8, "warmth": 9, "calm": 3, "professional": 4, "creativity": 9},
+        "purple": {"energy": 6, "warmth": 5, "calm": 6, "professional": 6, "creativity": 9},
+        "orange": {"energy": 9, "warmth": 9, "calm": 2, "professional": 4, "creativity": 8},
+        "pink": {"energy": 6, "warmth": 7, "calm": 5, "professional": 4, "creativity": 8},
+        "black": {"energy": 4, "warmth": 1, "calm": 5, "professional": 10, "creativity": 5},
+        "white": {"energy": 5, "warmth": 3, "calm": 7, "professional": 8, "creativity": 6},
+        "brown": {"energy": 3, "warmth": 6, "calm": 6, "professional": 7, "creativity": 4},
+    }
+)
+
 
 class ColorTools(Toolkit):
     """
@@ -27,67 +100,29 @@ class ColorTools(Toolkit):
         Args:
             favorite_color: User's configured favorite color
         """
-        logger.debug("=" * 80)
-        logger.info(f"ColorTools.__init__() called with favorite_color={favorite_color}")
+        logger.info("ColorTools.__init__() called with favorite_color={}", favorite_color)
 
         self.favorite_color = favorite_color
 
-        # Color theory mappings (simplified)
-        self._complementary_colors = {
-            "red": "green",
-            "green": "red",
-            "blue": "orange",
-            "orange": "blue",
-            "yellow": "purple",
-            "purple": "yellow",
-            "pink": "green",
-            "black": "white",
-            "white": "black",
-            "brown": "blue",
-        }
-
-        self._analogous_colors = {
-            "red": ["orange", "pink"],
-            "orange": ["red", "yellow"],
-            "yellow": ["orange", "green"],
-            "green": ["yellow", "blue"],
-            "blue": ["green", "purple"],
-            "purple": ["blue", "pink"],
-            "pink": ["purple", "red"],
-            "black": ["brown", "purple"],
-            "white": ["yellow", "pink"],
-            "brown": ["orange", "red"],
-        }
-
-        # Hex code mappings for colors
-        self._color_hex_codes = {
-            "red": "#FF0000",
-            "green": "#00FF00",
-            "blue": "#0000FF",
-            "orange": "#FFA500",
-            "yellow": "#FFFF00",
-            "purple": "#800080",
-            "pink": "#FFC0CB",
-            "black": "#000000",
-            "white": "#FFFFFF",
-            "brown": "#A52A2A",
-            "gray": "#808080",
-            "silver": "#C0C0C0",
-            "darkseagreen4": "#698B69",
+        # Palettes and theme wrappers only depend on favorite_color, so build them once
+        self._palettes = {
+            "complementary": self._generate_complementary_palette(),
+            "analogous": self._generate_analogous_palette(),
+            "monochromatic": self._generate_monochromatic_palette(),
         }
-
-        # Color mood mappings for intelligent scheme design
-        self._color_moods = {
-            "red": {"energy": 9, "warmth": 8, "calm": 2, "professional": 5, "creativity": 7},
-            "blue": {"energy": 3, "warmth": 2, "calm": 9, "professional": 9, "creativity": 6},
-            "green": {"energy": 5, "warmth": 4, "calm": 8, "professional": 7, "creativity": 5},
-            "yellow": {"energy": 8, "warmth": 9, "calm": 3, "professional": 4, "creativity": 9},
-            "purple": {"energy": 6, "warmth": 5, "calm": 6, "professional": 6, "creativity": 9},
-            "orange": {"energy": 9, "warmth": 9, "calm": 2, "professional": 4, "creativity": 8},
-            "pink": {"energy": 6, "warmth": 7, "calm": 5, "professional": 4, "creativity": 8},
-            "black": {"energy": 4, "warmth": 1, "calm": 5, "professional": 10, "creativity": 5},
-            "white": {"energy": 5, "warmth": 3, "calm": 7, "professional": 8, "creativity": 6},
-            "brown": {"energy": 3, "warmth": 6, "calm": 6, "professional": 7, "creativity": 4},
+        self._themes = {
+            "bold": (
+                f"**[{favorite_color.upper()} THEMED]**",
+                f"_(Presented in a bold {favorite_color} style)_",
+            ),
+            "elegant": (
+                f"*~ {favorite_color.title()} Edition ~*",
+                f"_(Elegantly styled with {favorite_color} accents)_",
+            ),
+            "playful": (
+                f"🎨✨ {favorite_color.title()} Fun! ✨🎨",
+                f"_(Playfully themed in {favorite_color})_",
+            ),
         }
 
         # Build tools list
@@ -100,9 +135,8 @@ class ColorTools(Toolkit):
         # Initialize parent Toolkit with tools
         super().__init__(name="color_tools", tools=tools)
 
-        logger.info(f"✅ ColorTools initialized with {len(tools)} tools")
-        logger.debug(f"Registered tools: {[t.__name__ for t in tools]}")
-        logger.debug("=" * 80)
+        logger.info("✅ ColorTools initialized with {} tools", len(tools))
+        logger.debug("Registered tools: {}", [t.__name__ for t in tools])
 
     def generate_color_palette(self, palette_type: str = "complementary") -> str:
         """
@@ -120,52 +154,29 @@ class ColorTools(Toolkit):
         Returns:
             Formatted color palette description
         """
-        logger.debug("=" * 80)
         logger.info(">>> generate_color_palette() called")
-        logger.info(f"Parameters: palette_type={palette_type}, favorite_color={self.favorite_color}")
+        logger.info("Parameters: palette_type={}, favorite_color={}", palette_type, self.favorite_color)
 
         palette_type = palette_type.lower()
 
         # Validate palette type
-        valid_types = ["complementary", "analogous", "monochromatic"]
-        if palette_type not in valid_types:
-            error_msg = f"Invalid palette_type '{palette_type}'. Must be one of: {', '.join(valid_types)}"
-            logger.warning(error_msg)
-            logger.info("<<< generate_color_palette() FINISHED (error)")
-            logger.debug("=" * 80)
-            return f"❌ Error: {error_msg}"
-
-        logger.debug(f"✅ Palette type '{palette_type}' is valid")
-
-        # Generate palette based on type
-        try:
-            if palette_type == "complementary":
-                palette = self._generate_complementary_palette()
-            elif palette_type == "analogous":
-                palette = self._generate_analogous_palette()
-            else:  # monochromatic
-                palette = self._generate_monochromatic_palette()
+        if palette_type not in _VALID_PALETTES:
+            return f"❌ Error: Invalid palette_type '{palette_type}'. Must be one of: {', '.join(_VALID_PALETTES)}"
 
-            logger.info(f"✅ Generated {palette_type} palette: {palette}")
-            logger.info("<<< generate_color_palette() FINISHED (success)")
-            logger.debug("=" * 80)
+        palette = self._palettes[palette_type]
 
-            return palette
+        logger.info("✅ Generated {} palette: {}", palette_type, palette)
+        logger.info("<<< generate_color_palette() FINISHED (success)")
 
-        except Exception as e:
-            error_msg = f"Failed to generate palette: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            logger.info("<<< generate_color_palette() FINISHED (exception)")
-            logger.debug("=" * 80)
-            return f"❌ Error: {error_msg}"
+        return palette
 
     def _generate_complementary_palette(self) -> str:
         """Generate complementary color palette with hex codes."""
         logger.debug("_generate_complementary_palette() called")
 
-        complement = self._complementary_colors.get(self.favorite_color, "gray")
-        base_hex = self._color_hex_codes.get(self.favorite_color, "#808080")
-        complement_hex = self._color_hex_codes.get(complement, "#808080")
+        complement = _COMPLEMENTARY_COLORS.get(self.favorite_color, "gray")
+        base_hex = _COLOR_HEX_CODES.get(self.favorite_color, "#808080")
+        complement_hex = _COLOR_HEX_CODES.get(complement, "#808080")
 
         palette = (
             f"**Complementary Color Palette**\n\n"
@@ -175,14 +186,14 @@ class ColorTools(Toolkit):
             f"Complementary colors are opposite each other on the color wheel."
         )
 
-        logger.debug(f"Generated palette with complement: {complement} ({complement_hex})")
+        logger.debug("Generated palette with complement: {} ({})", complement, complement_hex)
         return palette
 
     def _generate_analogous_palette(self) -> str:
         """Generate analogous color palette."""
         logger.debug("_generate_analogous_palette() called")
 
-        analogous = self._analogous_colors.get(self.favorite_color, ["gray", "silver"])
+        analogous = _ANALOGOUS_COLORS.get(self.favorite_color, ("gray", "silver"))
 
         palette = (
             f"**Analogous Color Palette**\n\n"
@@ -193,7 +204,7 @@ class ColorTools(Toolkit):
             f"Analogous colors are next to each other on the color wheel."
         )
 
-        logger.debug(f"Generated palette with analogous colors: {analogous}")
+        logger.debug("Generated palette with analogous colors: {}", analogous)
         return palette
 
     def _generate_monochromatic_palette(self) -> str:
@@ -230,50 +241,23 @@ class ColorTools(Toolkit):
         Returns:
             Formatted text with color theme description
         """
-        logger.debug("=" * 80)
         logger.info(">>> format_text_with_theme() called")
-        logger.info(f"Parameters: text='{text[:50]}...', theme_style={theme_style}, favorite_color={self.favorite_color}")
+        logger.info("Parameters: text='{}...', theme_style={}, favorite_color={}", text[:50], theme_style, self.favorite_color)
 
         theme_style = theme_style.lower()
 
         # Validate theme style
-        valid_styles = ["bold", "elegant", "playful"]
-        if theme_style not in valid_styles:
-            error_msg = f"Invalid theme_style '{theme_style}'. Must be one of: {', '.join(valid_styles)}"
-            logger.warning(error_msg)
-            logger.info("<<< format_text_with_theme() FINISHED (error)")
-            logger.debug("=" * 80)
-            return f"❌ Error: {error_msg}"
+        if theme_style not in _VALID_THEMES:
+            return f"❌ Error: Invalid theme_style '{theme_style}'. Must be one of: {', '.join(_VALID_THEMES)}"
 
-        logger.debug(f"✅ Theme style '{theme_style}' is valid")
+        prefix, suffix = self._themes[theme_style]
+        formatted = f"{prefix}\n\n{text}\n\n{suffix}"
 
-        try:
-            # Create themed description
-            if theme_style == "bold":
-                prefix = f"**[{self.favorite_color.upper()} THEMED]**"
-                suffix = f"_(Presented in a bold {self.favorite_color} style)_"
-            elif theme_style == "elegant":
-                prefix = f"*~ {self.favorite_color.title()} Edition ~*"
-                suffix = f"_(Elegantly styled with {self.favorite_color} accents)_"
-            else:  # playful
-                prefix = f"🎨✨ {self.favorite_color.title()} Fun! ✨🎨"
-                suffix = f"_(Playfully themed in {self.favorite_color})_"
-
-            formatted = f"{prefix}\n\n{text}\n\n{suffix}"
-
-            logger.info(f"✅ Formatted text with {theme_style} theme")
-            logger.debug(f"Result length: {len(formatted)} characters")
-            logger.info("<<< format_text_with_theme() FINISHED (success)")
-            logger.debug("=" * 80)
-
-            return formatted
+        logger.info("✅ Formatted text with {} theme", theme_style)
+        logger.debug("Result length: {} characters", len(formatted))
+        logger.info("<<< format_text_with_theme() FINISHED (success)")
 
-        except Exception as e:
-            error_msg = f"Failed to format text: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            logger.info("<<< format_text_with_theme() FINISHED (exception)")
-            logger.debug("=" * 80)
-            return f"❌ Error: {error_msg}"
+        return formatted
 
     def design_color_scheme_for_purpose(self, purpose: str) -> str:
         """
@@ -297,9 +281,8 @@ class ColorTools(Toolkit):
         Returns:
             Detailed color scheme recommendation with reasoning
         """
-        logger.debug("=" * 80)
         logger.info(">>> design_color_scheme_for_purpose() called")
-        logger.info(f"Parameters: purpose='{purpose}', favorite_color={self.favorite_color}")
+        logger.info("Parameters: purpose='{}', favorite_color={}", purpose, self.favorite_color)
 
         try:
             # This tool is designed to be complex enough to trigger reasoning
@@ -329,7 +312,12 @@ class ColorTools(Toolkit):
             )
 
             logger.debug(
-                f"Mood analysis: energy={requires_energy}, calm={requires_calm}, warmth={requires_warmth}, professional={requires_professional}, creativity={requires_creativity}"
+                "Mood analysis: energy={}, calm={}, warmth={}, professional={}, creativity={}",
+                requires_energy,
+                requires_calm,
+                requires_warmth,
+                requires_professional,
+                requires_creativity,
             )
 
             # Build mood profile
@@ -342,7 +330,7 @@ class ColorTools(Toolkit):
             }
 
             # Evaluate how well the favorite color matches the requirements
-            favorite_scores = self._color_moods.get(self.favorite_color, {})
+            favorite_scores = _COLOR_MOODS.get(self.favorite_color, {})
 
             # Calculate overall match score for favorite color
             favorite_match_score = sum(
@@ -354,7 +342,7 @@ class ColorTools(Toolkit):
 
             # Find best alternative colors for comparison
             best_alternatives = []
-            for color, scores in self._color_moods.items():
+            for color, scores in _COLOR_MOODS.items():
                 if color == self.favorite_color:
                     continue
                 match_score = sum(
@@ -365,8 +353,8 @@ class ColorTools(Toolkit):
             best_alternatives.sort(key=lambda x: x[1], reverse=True)
             top_alternative = best_alternatives[0] if best_alternatives else (None, 0)
 
-            logger.debug(f"Favorite color match score: {favorite_match_score}")
-            logger.debug(f"Top alternative: {top_alternative[0]} with score {top_alternative[1]}")
+            logger.debug("Favorite color match score: {}", favorite_match_score)
+            logger.debug("Top alternative: {} with score {}", top_alternative[0], top_alternative[1])
 
             # Build color scheme recommendation
             # Primary color: use favorite if it's a reasonable match, otherwise use best alternative
@@ -384,12 +372,12 @@ class ColorTools(Toolkit):
             # Supporting colors: build a harmonious palette
             if use_favorite_as_primary:
                 # Use analogous colors of favorite
-                supporting = self._analogous_colors.get(self.favorite_color, ["gray", "silver"])[:1]
-                accent = self._complementary_colors.get(self.favorite_color, "gray")
+                supporting = _ANALOGOUS_COLORS.get(self.favorite_color, ("gray", "silver"))[:1]
+                accent = _COMPLEMENTARY_COLORS.get(self.favorite_color, "gray")
             else:
                 # Include favorite as accent to honor preference
                 supporting = [self.favorite_color]
-                accent = self._complementary_colors.get(primary_color, "gray")
+                accent = _COMPLEMENTARY_COLORS.get(primary_color, "gray")
 
             # Build detailed response
             response = f"""**Color Scheme Design for: "{purpose}"**
@@ -415,8 +403,8 @@ class ColorTools(Toolkit):
 """
 
             # Add mood analysis for favorite color
-            if self.favorite_color in self._color_moods:
-                scores = self._color_moods[self.favorite_color]
+            if self.favorite_color in _COLOR_MOODS:
+                scores = _COLOR_MOODS[self.favorite_color]
                 response += "Mood Characteristics (1-10 scale):\n"
                 for mood, score in scores.items():
                     bar = "█" * score + "░" * (10 - score)
@@ -432,7 +420,6 @@ class ColorTools(Toolkit):
 
             logger.info("✅ Successfully designed color scheme")
             logger.info("<<< design_color_scheme_for_purpose() FINISHED (success)")
-            logger.debug("=" * 80)
 
             return response
 
@@ -440,5 +427,4 @@ class ColorTools(Toolkit):
             error_msg = f"Failed to design color scheme: {str(e)}"
             logger.error(error_msg, exc_info=True)
             logger.info("<<< design_color_scheme_for_purpose() FINISHED (exception)")
-            logger.debug("=" * 80)
             return f"❌ Error: {error_msg}"
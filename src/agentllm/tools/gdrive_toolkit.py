@@ -12,6 +12,14 @@ from loguru import logger
 
 from .gdrive_utils import GoogleDriveExporter
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Upper bound on characters returned per document, to keep huge exports out of the prompt
+DEFAULT_MAX_CHARS = 200_000
+
 
 class GoogleDriveTools(Toolkit):
     """Toolkit for retrieving content from Google Drive documents.
@@ -36,12 +44,13 @@ class GoogleDriveTools(Toolkit):
 
         tools: list[Any] = [
             self.get_document_content,
+            self.get_documents_content,
             self.get_user_info,
         ]
 
         super().__init__(name="gdrive_tools", tools=tools, **kwargs)
 
-    def get_document_content(self, url_or_id: str) -> str:
+    def get_document_content(self, url_or_id: str, max_chars: int = DEFAULT_MAX_CHARS) -> str:
         """Get content from a Google Drive document.
 
         Automatically handles different document types:
@@ -51,6 +60,8 @@ class GoogleDriveTools(Toolkit):
 
         Args:
             url_or_id: Google Drive URL or document ID
+            max_chars: Maximum number of characters to return (default: 200000).
+                Longer documents are truncated and a note is appended.
 
         Returns:
             Document content as string, or error message if retrieval fails
@@ -65,6 +76,11 @@ class GoogleDriveTools(Toolkit):
                 return f"Failed to retrieve document content: {url_or_id}"
 
             logger.info(f"Successfully retrieved document content ({len(content)} characters)")
+
+            if len(content) > max_chars:
+                logger.warning(f"Truncating document {url_or_id} from {len(content)} to {max_chars} characters")
+                content = f"{content[:max_chars]}\n\n[Truncated: document exceeds {max_chars} characters]"
+
             return content
 
         except Exception as e:
@@ -72,6 +88,29 @@ class GoogleDriveTools(Toolkit):
             logger.error(error_msg)
             return error_msg
 
+    def get_documents_content(self, url_or_ids: list[str]) -> str:
+        """Get content from several Google Drive documents in a single tool call.
+
+        Use this instead of calling get_document_content repeatedly when more than
+        one document is needed. Each document is converted like get_document_content.
+
+        Args:
+            url_or_ids: Google Drive URLs or document IDs
+
+        Returns:
+            JSON object mapping each requested URL/ID to its content, or to an
+            error message if that document could not be retrieved
+        """
+        logger.info(f"Retrieving {len(url_or_ids)} Google Drive documents")
+
+        # Drive's batch endpoint does not support media exports, so the documents are
+        # fetched over the exporter's single authorized session instead.
+        results = {url_or_id: self.get_document_content(url_or_id) for url_or_id in dict.fromkeys(url_or_ids)}
+
+        if orjson is not None:
+            return orjson.dumps(results, option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(results, indent=2)
+
     def get_user_info(self) -> str:
         """Get information about the currently authenticated Google user.
 
@@ -92,6 +131,8 @@ class GoogleDriveTools(Toolkit):
                 }
             }
 
+            if orjson is not None:
+                return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
             return json.dumps(result, indent=2)
 
         except Exception as e:
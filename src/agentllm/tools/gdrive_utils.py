@@ -10,6 +10,7 @@ from typing import Any, Literal, cast
 from urllib.parse import parse_qs, urlparse
 
 import google.auth.transport.requests
+import requests
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
@@ -19,6 +20,9 @@ from html_to_markdown import convert_to_markdown
 from loguru import logger
 from pydantic import BaseModel, Field, field_validator
 
+# Drive v3 export endpoint, used directly over a pooled AuthorizedSession
+DRIVE_EXPORT_URL = "https://www.googleapis.com/drive/v3/files/{document_id}/export"
+
 
 class DocumentType(Enum):
     """Google Drive document types."""
@@ -171,6 +175,7 @@ class GoogleDriveExporter:
         """
         self.config = config or GoogleDriveExporterConfig()
         self._service = None
+        self._session: google.auth.transport.requests.AuthorizedSession | None = None
         self._processed_docs: set[str] = set()
         self.download_callback = download_callback
         self._credentials = credentials  # Store pre-authenticated credentials
@@ -183,6 +188,13 @@ class GoogleDriveExporter:
             self._service = build("drive", "v3", credentials=creds)
         return self._service
 
+    @property
+    def session(self) -> google.auth.transport.requests.AuthorizedSession:
+        """Get the authorized HTTP session, reusing its connection pool across calls."""
+        if self._session is None:
+            self._session = google.auth.transport.requests.AuthorizedSession(self._authenticate())
+        return self._session
+
     def _authenticate(self) -> Credentials:
         """Authenticate with Google Drive API.
 
@@ -297,7 +309,9 @@ class GoogleDriveExporter:
             return url_or_id
         else:
             logger.error(f"❌ Invalid document ID format: {url_or_id}")
-            raise ValueError(f"Invalid document ID format. Must contain only alphanumeric characters, hyphens, and underscores: {url_or_id}")
+            raise ValueError(
+                f"Invalid document ID format. Must contain only alphanumeric characters, hyphens, and underscores: {url_or_id}"
+            )
 
     def detect_document_type(self, url_or_id: str) -> DocumentType:
         """Detect the type of Google Drive document from URL.
@@ -993,31 +1007,22 @@ class GoogleDriveExporter:
                 if doc_type != DocumentType.DOCUMENT:
                     logger.warning(f"Markdown not supported for {doc_type.value}")
                     return None
-                request = self.service.files().export_media(fileId=document_id, mimeType="text/html")
+                mime_type = "text/html"
             else:
-                request = self.service.files().export_media(fileId=document_id, mimeType=export_format.mime_type)
+                mime_type = export_format.mime_type
 
-            fh = io.BytesIO()
-            downloader = MediaIoBaseDownload(fh, request)
-            done = False
-
-            while not done:
-                status, done = downloader.next_chunk()
-                if status:
-                    progress = int(status.progress() * 100)
-                    logger.debug(f"Download progress: {progress}%")
+            response = self.session.get(DRIVE_EXPORT_URL.format(document_id=document_id), params={"mimeType": mime_type})
+            response.raise_for_status()
+            content = response.content.decode("utf-8")
 
             # Handle markdown conversion
             if format_key == "md":
-                html_content = fh.getvalue().decode("utf-8")
-                markdown_content = convert_to_markdown(html_content)
-                return markdown_content
-            else:
-                # Return as string for text-based formats
-                return fh.getvalue().decode("utf-8")
+                return convert_to_markdown(content)
+            # Return as string for text-based formats
+            return content
 
-        except HttpError as error:
-            if "The requested conversion is not supported" in str(error):
+        except requests.HTTPError as error:
+            if "The requested conversion is not supported" in error.response.text:
                 logger.warning(f"Format {format_key} not supported for this document type")
             else:
                 logger.error(f"Failed to export {format_key}: {error}")
@@ -7,6 +7,7 @@ import re
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any
+from urllib.parse import quote
 
 from agno.tools import Toolkit
 from loguru import logger
@@ -17,6 +18,12 @@ try:
 except ImportError:
     raise ImportError("`jira` not installed. Please install using `pip install jira`") from None
 
+# JQL `key in (...)` lists are chunked to stay within Jira query limits
+BULK_KEYS_PER_QUERY = 100
+BULK_ISSUE_FIELDS = "summary,status,priority,customfield_12311140"
+# Issue keys accepted by get_issues_bulk; anything else would be pasted into JQL unchecked
+ISSUE_KEY_RE = re.compile(r"^[A-Z][A-Z0-9_]*-\d+$")
+
 
 class JiraCommentData(BaseModel):
     """Pydantic model for Jira comment data."""
@@ -111,6 +118,9 @@ class JiraTools(Toolkit):
         create_issue: bool = False,
         extract_sprint_info: bool = True,
         get_sprint_metrics: bool = True,
+        get_issues_bulk: bool = True,
+        build_metric_link: bool = True,
+        prepare_sprint_data: bool = True,
         update_issue: bool = False,
         **kwargs,
     ):
@@ -132,6 +142,9 @@ class JiraTools(Toolkit):
             create_issue: Include create_issue tool (default: False)
             extract_sprint_info: Include extract_sprint_info tool (default: True)
             get_sprint_metrics: Include get_sprint_metrics tool (default: True)
+            get_issues_bulk: Include get_issues_bulk tool (default: True)
+            build_metric_link: Include build_metric_link tool (default: True)
+            prepare_sprint_data: Include prepare_sprint_data tool (default: True)
             update_issue: Include update_issue tool (default: False)
             **kwargs: Additional arguments passed to parent Toolkit
         """
@@ -163,6 +176,12 @@ class JiraTools(Toolkit):
             tools.append(self.extract_sprint_info)
         if get_sprint_metrics:
             tools.append(self.get_sprint_metrics)
+        if get_issues_bulk:
+            tools.append(self.get_issues_bulk)
+        if build_metric_link:
+            tools.append(self.build_metric_link)
+        if prepare_sprint_data:
+            tools.append(self.prepare_sprint_data)
         if update_issue:
             tools.append(self.update_issue)
 
@@ -1171,6 +1190,146 @@ class JiraTools(Toolkit):
             logger.error(error_msg)
             return json.dumps({"error": error_msg})
 
+    def get_issues_bulk(self, keys: list[str]) -> str:
+        """Get several Jira issues by key with a single JQL query instead of one get_issue call per key.
+
+        Use this to fetch e.g. epic summaries for a list of Epic Links. Keys are queried with
+        `key in (...)`, in chunks of 100 to stay within JQL limits.
+
+        Args:
+            keys: Issue keys to fetch (e.g., ["RHIDP-100", "RHIDP-200"]). Duplicates are ignored,
+                and strings that are not issue keys are reported in not_found without being queried.
+
+        Returns:
+            JSON string with:
+            {
+                "issues": {
+                    "RHIDP-100": {"key": "RHIDP-100", "summary": "...", "status": "...", "priority": "...", "epic_link": null},
+                    ...
+                },
+                "not_found": ["RHIDP-999"]
+            }
+        """
+        try:
+            unique_keys = list(dict.fromkeys(keys))
+            valid_keys = [key for key in unique_keys if ISSUE_KEY_RE.match(key)]
+            if len(valid_keys) < len(unique_keys):
+                logger.warning(f"Skipping {len(unique_keys) - len(valid_keys)} invalid issue keys in bulk fetch")
+            logger.debug(f"Fetching {len(valid_keys)} issues in bulk")
+            jira = self._get_jira_client()
+
+            issues = {}
+            for start in range(0, len(valid_keys), BULK_KEYS_PER_QUERY):
+                chunk = valid_keys[start : start + BULK_KEYS_PER_QUERY]
+                jql = f"key in ({','.join(chunk)})"
+                # Without validate_query=False, Jira rejects the whole query if any one key does not exist
+                for issue in jira.search_issues(jql, maxResults=len(chunk), fields=BULK_ISSUE_FIELDS, validate_query=False):
+                    issues[issue.key] = {
+                        "key": issue.key,
+                        "summary": issue.fields.summary,
+                        "status": issue.fields.status.name,
+                        "priority": issue.fields.priority.name if issue.fields.priority else "Unknown",
+                        "epic_link": getattr(issue.fields, "customfield_12311140", None),
+                    }
+
+            not_found = [key for key in unique_keys if key not in issues]
+            logger.info(f"Bulk fetch returned {len(issues)} of {len(unique_keys)} issues")
+
+            return json.dumps({"issues": issues, "not_found": not_found}, indent=2)
+
+        except Exception as e:
+            error_msg = f"Error fetching issues in bulk for keys {keys}: {str(e)}"
+            logger.error(error_msg)
+            return json.dumps({"error": error_msg})
+
+    def build_metric_link(self, jql: str) -> str:
+        """Build a Jira issue search URL for a JQL query.
+
+        Use this for metric links instead of URL-encoding JQL by hand.
+
+        Args:
+            jql: JQL query string (e.g., "Sprint = 75290 AND resolution = done")
+
+        Returns:
+            URL with the JQL fully encoded, e.g.
+            "https://issues.redhat.com/issues/?jql=Sprint%20%3D%2075290%20AND%20resolution%20%3D%20done"
+        """
+        return f"{self._server_url.rstrip('/')}/issues/?jql={quote(jql, safe='')}"
+
+    def _get_sprint_data(self, issue_key: str) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+        """Resolve sprint info from an issue and fetch its metrics (used in parallel execution)."""
+        sprint = json.loads(self.extract_sprint_info(issue_key))
+        if not sprint:
+            return None, None
+        return sprint, json.loads(self.get_sprint_metrics(sprint["sprint_id"]))
+
+    def prepare_sprint_data(self, team_id: str) -> str:
+        """Fetch all Jira data needed for a team's sprint review in one call.
+
+        Runs the independent Jira round-trips concurrently instead of one tool call at a time:
+        - Phase 1 (parallel): current sprint issues and backlog issues (max 15)
+        - Phase 2 (parallel): sprint info + sprint metrics, and the summaries of all
+          distinct Epic Links found in phase 1 (one get_issues_bulk query)
+
+        Args:
+            team_id: The team ID to prepare the sprint review for (e.g., "4267")
+
+        Returns:
+            JSON string with:
+            {
+                "team_id": "4267",
+                "sprint": {"sprint_id": "75290", "sprint_name": "..."} or null,
+                "metrics": {get_sprint_metrics result} or null,
+                "current_sprint": {get_issues_detailed result, ordered by priority},
+                "backlog": {get_issues_detailed result, ordered by priority},
+                "epics": {"RHIDP-100": "Epic summary", ...}
+            }
+        """
+        try:
+            logger.debug(f"Preparing sprint data for team_id={team_id}")
+            current_jql = (
+                f'sprint in openSprints() and team = {team_id} and status in ("In progress", "Review", "Closed") ORDER BY priority DESC'
+            )
+            backlog_jql = f'team = {team_id} AND status = "To Do" AND sprint is EMPTY ORDER BY priority DESC'
+            fields = "key,summary,status,type,priority,epic_link"
+
+            logger.info(f"Fetching sprint data for team {team_id}")
+            prepare_start = time.time()
+
+            with ThreadPoolExecutor(max_workers=10) as executor:
+                current_future = executor.submit(self.get_issues_detailed, current_jql, fields, 50, False)
+                backlog_future = executor.submit(self.get_issues_detailed, backlog_jql, fields, 15, False)
+                current = json.loads(current_future.result())
+                backlog = json.loads(backlog_future.result())
+
+                current_issues = current.get("issues", [])
+                epic_keys = {issue["epic_link"] for issue in current_issues + backlog.get("issues", []) if issue.get("epic_link")}
+
+                sprint_future = executor.submit(self._get_sprint_data, current_issues[0]["key"]) if current_issues else None
+                epics_future = executor.submit(self.get_issues_bulk, sorted(epic_keys)) if epic_keys else None
+
+                epic_issues = json.loads(epics_future.result()).get("issues", {}) if epics_future else {}
+                epics = {key: issue["summary"] for key, issue in epic_issues.items()}
+                sprint, metrics = sprint_future.result() if sprint_future else (None, None)
+
+            prepare_elapsed = time.time() - prepare_start
+            logger.info(f"Sprint data for team {team_id} fetched in {prepare_elapsed:.2f}s ({len(epic_keys)} epics)")
+
+            result = {
+                "team_id": team_id,
+                "sprint": sprint,
+                "metrics": metrics,
+                "current_sprint": current,
+                "backlog": backlog,
+                "epics": epics,
+            }
+            return json.dumps(result, indent=2)
+
+        except Exception as e:
+            error_msg = f"Error preparing sprint data for team_id={team_id}: {str(e)}"
+            logger.error(error_msg)
+            return json.dumps({"error": error_msg})
+
     def update_issue(
         self,
         *,  # Force all parameters to be keyword-only
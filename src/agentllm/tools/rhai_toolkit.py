@@ -1,7 +1,12 @@
 """Red Hat AI (RHAI) Toolkit."""
 
+import csv
+import hashlib
+import io
 import os
-from datetime import date
+import threading
+import time
+from datetime import date, datetime
 from typing import Any
 
 from agno.tools import Toolkit
@@ -11,6 +16,13 @@ from pydantic import BaseModel, Field
 
 from agentllm.tools.gdrive_utils import GoogleDriveExporter
 
+# Fallback release_date formats tried when the value is not ISO 8601:
+# - "Thu Nov-13-2025" (weekday month-day-year)
+# - "2025-11-13" (ISO)
+# - "13/11/2025" (day/month/year)
+# - "11/13/2025" (month/day/year)
+_RELEASE_DATE_FORMATS = ("%a %b-%d-%Y", "%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y")
+
 
 class RHAIRelease(BaseModel):
     """Data model for a Red Hat AI release."""
@@ -31,6 +43,12 @@ class CantParseReleasesError(Exception):
 class RHAITools(Toolkit):
     """Toolkit for Red Hat AI (RHAI)."""
 
+    # Parsed releases per credentials and document URL, shared by all toolkit instances:
+    # (credentials identity, doc_url) -> (fetched_at, releases)
+    _cache: dict[tuple[str, str], tuple[float, list[RHAIRelease]]] = {}
+    _cache_lock = threading.Lock()
+    _CACHE_TTL = 300.0
+
     def __init__(
         self,
         credentials: Credentials,
@@ -44,6 +62,8 @@ class RHAITools(Toolkit):
         """
         # Create exporter with pre-authenticated credentials (no file storage needed)
         self.exporter = GoogleDriveExporter(credentials=credentials)
+        # Releases read with one user's credentials are never served to another user
+        self._cache_identity = self._credentials_identity(credentials)
 
         tools: list[Any] = [
             self.get_releases,
@@ -63,12 +83,23 @@ class RHAITools(Toolkit):
         Raises:
             ValueError: If AGENTLLM_RHAI_ROADMAP_PUBLISHER_RELEASE_SHEET is not set
             CantParseReleasesError: If document cannot be retrieved or parsed
+
+        Note:
+            Results are cached per credentials and document URL for 5 minutes across all
+            RHAITools instances.
         """
         # Get document URL from environment
         doc_url = os.getenv("AGENTLLM_RHAI_ROADMAP_PUBLISHER_RELEASE_SHEET")
         if not doc_url:
             raise ValueError("Environment variable AGENTLLM_RHAI_ROADMAP_PUBLISHER_RELEASE_SHEET must be set")
 
+        cache_key = (self._cache_identity, doc_url)
+        with RHAITools._cache_lock:
+            entry = RHAITools._cache.get(cache_key)
+        if entry and time.monotonic() - entry[0] < RHAITools._CACHE_TTL:
+            logger.debug(f"Returning {len(entry[1])} cached RHAI releases for: {doc_url}")
+            return list(entry[1])
+
         try:
             # Fetch document content
             logger.info(f"Fetching RHAI releases from: {doc_url}")
@@ -78,60 +109,19 @@ class RHAITools(Toolkit):
             if content is None:
                 raise CantGetReleasesError("Document content is None")
 
-            # Parse tab-separated values
-            releases: list[RHAIRelease] = []
-            lines = content.strip().split("\n")
+            # Parse CSV rows one at a time instead of splitting the whole document up front
+            reader = csv.reader(io.StringIO(content))
 
             # Skip header line (first line)
-            for i, line in enumerate(lines[1:], start=2):
-                # Split by , character (CSV format)
-                parts = line.split(",")
-
-                # Skip lines with insufficient columns
-                if len(parts) < 3:
-                    logger.warning(f"Skipping line {i}: insufficient columns (expected 3, got {len(parts)})")
-                    continue
-
-                # Extract fields (take first 3 columns, ignore extras)
-                release_date_str = parts[2].strip()
-
-                # Try parsing the date string into a datetime.date.
-                # Accept ISO format first, then a few common alternatives.
-                try:
-                    # Try ISO 8601 first (YYYY-MM-DD)
-                    release_date_obj = date.fromisoformat(release_date_str)
-                except ValueError:
-                    from datetime import datetime
-
-                    parsed = None
-                    # Try multiple date formats:
-                    # - "Thu Nov-13-2025" (weekday month-day-year)
-                    # - "2025-11-13" (ISO)
-                    # - "13/11/2025" (day/month/year)
-                    # - "11/13/2025" (month/day/year)
-                    for fmt in ("%a %b-%d-%Y", "%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y"):
-                        try:
-                            parsed = datetime.strptime(release_date_str, fmt).date()
-                            break
-                        except ValueError:
-                            continue
-
-                    if parsed is None:
-                        logger.warning(f"Skipping line {i}: cannot parse release_date '{release_date_str}'")
-                        continue
-
-                    release_date_obj = parsed
-
-                release = RHAIRelease(
-                    release=parts[0],
-                    details=parts[1],
-                    release_date=release_date_obj,
-                )
-                releases.append(release)
+            next(reader, None)
+            releases = [release for parts in reader if (release := self._parse_release_row(parts, reader.line_num)) is not None]
 
             logger.info(f"Successfully parsed {len(releases)} releases")
             logger.debug(f"Parsed releases: {releases}")
-            return releases
+
+            with RHAITools._cache_lock:
+                RHAITools._cache[cache_key] = (time.monotonic(), releases)
+            return list(releases)
 
         except CantGetReleasesError as e:
             # Re-raise as CantParseReleasesError for consistency with tests
@@ -139,3 +129,61 @@ class RHAITools(Toolkit):
         except Exception as e:
             logger.error(f"Error fetching/parsing releases: {e}")
             raise CantParseReleasesError(f"Failed to parse releases: {e}") from e
+
+    @staticmethod
+    def _credentials_identity(credentials: Credentials) -> str:
+        """Identify the OAuth client and grant behind credentials without keeping the token itself."""
+        secret = str(getattr(credentials, "refresh_token", None) or getattr(credentials, "token", None) or "")
+        return f"{getattr(credentials, 'client_id', None)}:{hashlib.sha256(secret.encode('utf-8')).hexdigest()}"
+
+    @staticmethod
+    def _parse_release_row(parts: list[str], line_num: int) -> RHAIRelease | None:
+        """Build a release from one CSV row, or return None if the row should be skipped.
+
+        Args:
+            parts: Fields of the CSV row
+            line_num: Line number of the row, used in warnings
+
+        Returns:
+            RHAIRelease, or None for blank or malformed rows
+        """
+        # Silently skip blank rows (common trailing rows in Sheets exports)
+        if not any(field.strip() for field in parts):
+            return None
+
+        # Skip lines with insufficient columns
+        if len(parts) < 3:
+            logger.warning(f"Skipping line {line_num}: insufficient columns (expected 3, got {len(parts)})")
+            return None
+
+        # Extract fields (take first 3 columns, ignore extras)
+        release_name, details, release_date_str = parts[0], parts[1], parts[2].strip()
+
+        # Try parsing the date string into a datetime.date.
+        # Accept ISO format first, then a few common alternatives.
+        try:
+            # Try ISO 8601 first (YYYY-MM-DD)
+            release_date_obj = date.fromisoformat(release_date_str)
+        except ValueError:
+            for fmt in _RELEASE_DATE_FORMATS:
+                try:
+                    release_date_obj = datetime.strptime(release_date_str, fmt).date()
+                    break
+                except ValueError:
+                    continue
+            else:
+                logger.warning(f"Skipping line {line_num}: cannot parse release_date '{release_date_str}'")
+                return None
+
+        # Fields are already str/date here, so skip pydantic validation
+        return RHAIRelease.model_construct(
+            release=release_name,
+            details=details,
+            release_date=release_date_obj,
+        )
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Drop all cached releases so the next get_releases call refetches the document."""
+        with cls._cache_lock:
+            cls._cache.clear()
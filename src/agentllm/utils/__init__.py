@@ -2,6 +2,7 @@
 
 from agentllm.utils.logging import (
     is_development_mode,
+    lazy_safe_log_content,
     log_metadata_only,
     safe_log_content,
     safe_log_dict,
@@ -11,6 +12,7 @@ from agentllm.utils.logging import (
 
 __all__ = [
     "is_development_mode",
+    "lazy_safe_log_content",
     "log_metadata_only",
     "safe_log_content",
     "safe_log_dict",
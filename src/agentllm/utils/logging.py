@@ -2,7 +2,8 @@
 
 This module provides utilities to safely log content based on environment:
 - Development mode (LOG_LEVEL=DEBUG): Logs full content for debugging
-- Production mode (LOG_LEVEL=INFO or higher): Logs only metadata (length, type)
+- Production mode (LOG_LEVEL=INFO or higher): Logs only metadata (length, type);
+  the length is len(content), i.e. the item count for containers
 
 Usage:
     from agentllm.utils.logging import safe_log_content, is_development_mode
@@ -11,21 +12,34 @@ Usage:
     # Safe logging of message content
     logger.debug(safe_log_content(message, "User message"))
 
+    # Lazy variant: formatting only runs if the DEBUG record is emitted
+    logger.debug(lazy_safe_log_content(message, "User message"))
+
     # Check if in development mode
     if is_development_mode():
         logger.debug(f"Full data: {data}")
     else:
         logger.info(f"Data length: {len(data)}")
+
+The environment-dependent helpers (safe_log_content, safe_log_dict,
+sanitize_for_logging) are specialized once at import time. Tests that change
+LOG_LEVEL must call is_development_mode.cache_clear() and then
+importlib.reload(agentllm.utils.logging).
 """
 
+import functools
 import os
+from collections.abc import Callable
 from typing import Any
 
 
+@functools.cache
 def is_development_mode() -> bool:
     """Check if we're running in development mode.
 
     Development mode is determined by LOG_LEVEL=DEBUG environment variable.
+    The result is cached since LOG_LEVEL does not change at runtime; see the
+    module docstring for resetting it in tests.
 
     Returns:
         bool: True if in development mode (DEBUG level), False otherwise
@@ -34,118 +48,140 @@ def is_development_mode() -> bool:
     return log_level == "DEBUG"
 
 
-def safe_log_content(
-    content: Any,
-    label: str = "Content",
-) -> str:
-    """Safely format content for logging based on environment.
+# Resolved once at import; selects the helper implementations bound below
+_IS_DEV = is_development_mode()
 
-    In development mode (LOG_LEVEL=DEBUG):
-        - Returns full content with label
 
-    In production mode:
-        - Returns only metadata (type, length) - NO actual content
+def _content_len(content: Any) -> int:
+    """Return the length of content, only stringifying values that have no len()."""
+    try:
+        return len(content)
+    except TypeError:
+        return len(str(content))
 
-    Args:
-        content: The content to log (string, dict, list, etc.)
-        label: Human-readable label for the content
 
-    Returns:
-        str: Formatted log message safe for current environment
+@functools.lru_cache(maxsize=256)
+def _metadata_prefix(label: str, type_name: str) -> str:
+    """Return the constant '<label> (type=<type>, len=' prefix, cached per label/type pair."""
+    return f"{label} (type={type_name}, len="
 
-    Examples:
-        >>> safe_log_content("Hello World", "Message")
-        # Development: "Message (full): Hello World"
-        # Production: "Message (type=str, len=11)"
-    """
-    if content is None:
-        return f"{label}: None"
 
-    content_str = str(content)
-    content_type = type(content).__name__
-    content_len = len(content_str)
+@functools.lru_cache(maxsize=64)
+def _redacted_prefix(type_name: str) -> str:
+    """Return the constant '<redacted: type=<type>, len=' prefix, cached per type."""
+    return f"<redacted: type={type_name}, len="
 
-    if is_development_mode():
-        # Development mode: Log full content
-        return f"{label} (full): {content_str}"
-    else:
-        # Production mode: Log only metadata (NO content)
-        return f"{label} (type={content_type}, len={content_len})"
 
+def _dev_safe_log_content(content: Any, label: str = "Content") -> str:
+    """Development safe_log_content: full content with label."""
+    if content is None:
+        return f"{label}: None"
+    return f"{label} (full): {content}"
 
-def safe_log_message(message: str, label: str = "Message") -> str:
-    """Safely format a message for logging (convenience wrapper for safe_log_content).
 
-    Args:
-        message: The message to log
-        label: Human-readable label for the message
+def _prod_safe_log_content(content: Any, label: str = "Content") -> str:
+    """Production safe_log_content: only metadata (type, length), without stringifying content."""
+    if content is None:
+        return f"{label}: None"
+    return _metadata_prefix(label, type(content).__name__) + str(_content_len(content)) + ")"
 
-    Returns:
-        str: Formatted log message safe for current environment
-    """
-    return safe_log_content(message, label)
 
+def _dev_safe_log_dict(data: dict, label: str = "Data") -> str:
+    """Development safe_log_dict: full dictionary with keys and values."""
+    if data is None:
+        return f"{label}: None"
+    if not isinstance(data, dict):
+        return _dev_safe_log_content(data, label)
+    return f"{label} (full): {data}"
 
-def safe_log_dict(data: dict, label: str = "Data") -> str:
-    """Safely format a dictionary for logging.
 
-    In development mode:
-        - Returns full dictionary with keys and values
+def _prod_safe_log_dict(data: dict, label: str = "Data") -> str:
+    """Production safe_log_dict: only the keys."""
+    if data is None:
+        return f"{label}: None"
+    if not isinstance(data, dict):
+        return _prod_safe_log_content(data, label)
+    keys = list(data.keys())
+    return f"{label} (keys={len(keys)}): {keys}"
 
-    In production mode:
-        - Returns only keys and value types
 
-    Args:
-        data: The dictionary to log
-        label: Human-readable label for the data
+def _dev_sanitize_for_logging(value: Any) -> str:
+    """Development sanitize_for_logging: the value as a string."""
+    return str(value)
 
-    Returns:
-        str: Formatted log message safe for current environment
 
-    Examples:
-        >>> safe_log_dict({"token": "abc123", "user": "john"}, "Config")
-        # Development: "Config (full): {'token': 'abc123', 'user': 'john'}"
-        # Production: "Config (keys): ['token', 'user']"
+def _prod_sanitize_for_logging(value: Any) -> str:
+    """Production sanitize_for_logging: a redacted type/length description."""
+    if value is None:
+        return "None"
+    return _redacted_prefix(type(value).__name__) + str(_content_len(value)) + ">"
+
+
+# Bind each helper to its environment-specific implementation once, so log
+# calls run straight-line code with no per-call mode check.
+#
+# safe_log_content(content, label="Content"):
+#     Development: "Message (full): Hello World"
+#     Production:  "Message (type=str, len=11)"
+# safe_log_dict(data, label="Data"):
+#     Development: "Config (full): {'token': 'abc123', 'user': 'john'}"
+#     Production:  "Config (keys=2): ['token', 'user']"
+# sanitize_for_logging(value):
+#     Development: "secret_token_12345"
+#     Production:  "<redacted: type=str, len=18>"
+if _IS_DEV:
+    safe_log_content = _dev_safe_log_content
+    safe_log_dict = _dev_safe_log_dict
+    sanitize_for_logging = _dev_sanitize_for_logging
+else:
+    safe_log_content = _prod_safe_log_content
+    safe_log_dict = _prod_safe_log_dict
+    sanitize_for_logging = _prod_sanitize_for_logging
+
+
+class _LazyLog:
+    """Defer building a log message until the record is actually emitted.
+
+    Loguru only calls ``str()`` on the message after the level check, so
+    records filtered out by the active log level never pay for formatting.
     """
-    if data is None:
-        return f"{label}: None"
 
-    if not isinstance(data, dict):
-        return safe_log_content(data, label)
+    __slots__ = ("_fn",)
 
-    if is_development_mode():
-        # Development mode: Log full dictionary
-        return f"{label} (full): {data}"
-    else:
-        # Production mode: Log only keys
-        keys = list(data.keys())
-        return f"{label} (keys={len(keys)}): {keys}"
+    def __init__(self, fn: Callable[[], str]) -> None:
+        self._fn = fn
 
+    def __str__(self) -> str:
+        return self._fn()
 
-def sanitize_for_logging(value: Any) -> str:
-    """Sanitize a value for safe logging (strips sensitive data in production).
 
-    This function is useful when you need to log a value but want to ensure
-    no sensitive data is leaked in production.
+def lazy_safe_log_content(content: Any, label: str = "Content") -> _LazyLog:
+    """Lazily format content for logging (deferred variant of safe_log_content).
+
+    Prefer this at DEBUG log sites, e.g.
+    ``logger.debug(lazy_safe_log_content(message, "User message"))``.
 
     Args:
-        value: The value to sanitize
+        content: The content to log (string, dict, list, etc.)
+        label: Human-readable label for the content
 
     Returns:
-        str: Sanitized string representation
-
-    Examples:
-        >>> sanitize_for_logging("secret_token_12345")
-        # Development: "secret_token_12345"
-        # Production: "<redacted: type=str, len=18>"
+        _LazyLog: Object whose str() is the safe_log_content result
     """
-    if value is None:
-        return "None"
+    return _LazyLog(lambda: safe_log_content(content, label))
 
-    if is_development_mode():
-        return str(value)
-    else:
-        return f"<redacted: type={type(value).__name__}, len={len(str(value))}>"
+
+def safe_log_message(message: str, label: str = "Message") -> str:
+    """Safely format a message for logging (convenience wrapper for safe_log_content).
+
+    Args:
+        message: The message to log
+        label: Human-readable label for the message
+
+    Returns:
+        str: Formatted log message safe for current environment
+    """
+    return safe_log_content(message, label)
 
 
 def log_metadata_only(content: Any, label: str = "Content") -> str:
@@ -168,7 +204,4 @@ def log_metadata_only(content: Any, label: str = "Content") -> str:
     if content is None:
         return f"{label}: None"
 
-    content_type = type(content).__name__
-    content_len = len(str(content))
-
-    return f"{label} (type={content_type}, len={content_len})"
+    return _metadata_prefix(label, type(content).__name__) + str(_content_len(content)) + ")"
@@ -5,6 +5,9 @@ to all test modules.
 """
 
 import os
+from unittest.mock import Mock
+
+import pytest
 
 
 def pytest_configure(config):
@@ -66,3 +69,23 @@ def pytest_report_header(config):
         headers.append(f"AGNO_SHOW_TOOL_CALLS: {os.environ.get('AGNO_SHOW_TOOL_CALLS', 'false')}")
 
     return headers
+
+
+@pytest.fixture(scope="module")
+def oauth_token_storage():
+    """Mock TokenStorage shared by the OAuth provider tests in a module.
+
+    spec_set limits the mock to TokenStorage's real attributes, so tests fail on misspelled calls.
+    """
+    from agentllm.db.token_storage import TokenStorage
+
+    storage = Mock(spec_set=TokenStorage)
+    storage.upsert_token.return_value = True
+    return storage
+
+
+@pytest.fixture
+def reset_token_storage(oauth_token_storage):
+    """Reset the shared OAuth TokenStorage mock, for tests that assert on or mutate it."""
+    oauth_token_storage.reset_mock()
+    oauth_token_storage.upsert_token.return_value = True
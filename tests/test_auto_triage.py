@@ -0,0 +1,447 @@
+"""
+Tests for the automated Jira triage script (scripts/auto_triage.py).
+
+This test suite covers:
+- Parsing the triage table from agent responses
+- Caching agent responses between runs
+- Daemon request handling over a Unix socket
+- Applying recommendations to Jira
+"""
+
+import importlib.util
+import json
+import os
+import tempfile
+import threading
+from datetime import date
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+SCRIPT_PATH = Path(__file__).parent.parent / "scripts" / "auto_triage.py"
+
+
+@pytest.fixture(scope="module")
+def auto_triage():
+    """Load scripts/auto_triage.py as a module without leaking its environment setup."""
+    spec = importlib.util.spec_from_file_location("auto_triage", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    with patch.dict(os.environ):
+        spec.loader.exec_module(module)
+    return module
+
+
+HEADER = "| Ticket | Summary | Field | Current | Recommended | Confidence | Action |\n|---|---|---|---|---|---|---|\n"
+
+
+class TestParseTriageTable:
+    """Tests for parse_triage_table()."""
+
+    def test_parses_new_rows(self, auto_triage):
+        """Rows with action NEW become recommendations."""
+        response = "Results:\n\n" + HEADER + "| RHIDP-1 | Login fails | Team | - | RHDH Security | 90% | NEW |\n"
+
+        recommendations = auto_triage.parse_triage_table(response)
+
+        assert recommendations == [
+            {
+                "ticket": "RHIDP-1",
+                "field": "team",
+                "current": "-",
+                "recommended": "RHDH Security",
+                "confidence": 90,
+                "action": "NEW",
+            }
+        ]
+
+    def test_no_table_returns_empty(self, auto_triage):
+        """Responses without a triage table yield no recommendations."""
+        assert auto_triage.parse_triage_table("Nothing to triage today.") == []
+
+    def test_continuation_rows_inherit_ticket(self, auto_triage):
+        """Rows with an empty ticket column belong to the previous ticket."""
+        response = (
+            HEADER + "| RHIDP-1 | Login fails | Team | - | RHDH Security | 90% | NEW |\n" + "| | | Components | - | RBAC | 80% | NEW |\n"
+        )
+
+        recommendations = auto_triage.parse_triage_table(response)
+
+        assert [(rec["ticket"], rec["field"]) for rec in recommendations] == [("RHIDP-1", "team"), ("RHIDP-1", "components")]
+
+    def test_skips_non_new_actions(self, auto_triage):
+        """APPEND and SKIP rows are not returned."""
+        response = (
+            HEADER
+            + "| RHIDP-1 | Login fails | Team | RHDH Security | RHDH Security | 90% | SKIP |\n"
+            + "| RHIDP-2 | Crash | Components | RBAC | RBAC, Keycloak | 70% | APPEND |\n"
+        )
+
+        assert auto_triage.parse_triage_table(response) == []
+
+    @pytest.mark.parametrize("trailing", ["   ", " \r", " (verified)", " <- check this"])
+    def test_accepts_trailing_text_after_last_pipe(self, auto_triage, trailing):
+        """Text after the closing pipe does not drop the row."""
+        response = HEADER + f"| RHIDP-1 | Login fails | Team | - | RHDH Security | 90% | NEW |{trailing}\n"
+
+        recommendations = auto_triage.parse_triage_table(response)
+
+        assert [rec["ticket"] for rec in recommendations] == ["RHIDP-1"]
+
+    def test_skips_rows_with_missing_columns(self, auto_triage):
+        """Rows with too few columns are skipped without ending the table."""
+        response = (
+            HEADER + "| RHIDP-1 | Login fails | Team | - | 90% | NEW |\n" + "| RHIDP-2 | Crash | Team | - | RHDH Plugins | 85% | NEW |\n"
+        )
+
+        recommendations = auto_triage.parse_triage_table(response)
+
+        assert [rec["ticket"] for rec in recommendations] == ["RHIDP-2"]
+
+    def test_stops_at_end_of_table(self, auto_triage):
+        """Lines after the table are not parsed as rows."""
+        response = (
+            HEADER
+            + "| RHIDP-1 | Login fails | Team | - | RHDH Security | 90% | NEW |\n"
+            + "\n"
+            + "| RHIDP-2 | Crash | Team | - | RHDH Plugins | 85% | NEW |\n"
+        )
+
+        recommendations = auto_triage.parse_triage_table(response)
+
+        assert [rec["ticket"] for rec in recommendations] == ["RHIDP-1"]
+
+    def test_missing_confidence_defaults_to_zero(self, auto_triage):
+        """A confidence column without a percentage parses as 0."""
+        response = HEADER + "| RHIDP-1 | Login fails | Team | - | RHDH Security | high | NEW |"
+
+        recommendations = auto_triage.parse_triage_table(response)
+
+        assert recommendations[0]["confidence"] == 0
+
+
+TRIAGE_RESPONSE = HEADER + "| RHIDP-1 | Login fails | Team | - | RHDH Security | 90% | NEW |\n"
+
+
+@pytest.fixture
+def db_path(tmp_path) -> str:
+    """Provide a fresh database path for the triage cache."""
+    return str(tmp_path / "sessions.db")
+
+
+@pytest.fixture
+def triage_agent(auto_triage):
+    """Replace the Jira Triager agent and Jira lookups used by run_triage()."""
+    agent = MagicMock()
+    agent.run.return_value = MagicMock(content=TRIAGE_RESPONSE)
+    with (
+        patch.dict(os.environ, {"JIRA_API_TOKEN": "test-token"}),
+        patch.object(auto_triage, "get_triage_agent", return_value=agent),
+        patch.object(auto_triage, "build_ticket_details", return_value=[]),
+        patch.object(auto_triage, "apply_recommendations", return_value={"applied": [], "failed": []}),
+    ):
+        yield agent
+
+
+class TestTriageCache:
+    """Tests for the agent response cache."""
+
+    def test_cache_key_is_stable(self, auto_triage):
+        """The same user, prompt and day produce the same key."""
+        assert auto_triage.triage_cache_key("user", "prompt") == auto_triage.triage_cache_key("user", "prompt")
+
+    @pytest.mark.parametrize(
+        "other",
+        [("other-user", "prompt"), ("user", "other prompt")],
+        ids=["user", "prompt"],
+    )
+    def test_cache_key_changes_with_request(self, auto_triage, other):
+        """Different users or prompts get different keys."""
+        assert auto_triage.triage_cache_key("user", "prompt") != auto_triage.triage_cache_key(*other)
+
+    def test_cache_key_changes_with_date(self, auto_triage):
+        """Keys from different days differ, so entries never outlive their day."""
+        with patch.object(auto_triage, "date") as mock_date:
+            mock_date.today.return_value = date(2025, 1, 1)
+            first = auto_triage.triage_cache_key("user", "prompt")
+            mock_date.today.return_value = date(2025, 1, 2)
+            second = auto_triage.triage_cache_key("user", "prompt")
+
+        assert first != second
+
+    def test_load_hit(self, auto_triage, db_path):
+        """A stored response is returned within the TTL."""
+        auto_triage.store_cached_response(db_path, "key", "response")
+
+        assert auto_triage.load_cached_response(db_path, "key", ttl=60) == "response"
+
+    def test_load_miss(self, auto_triage, db_path):
+        """Unknown keys are a miss."""
+        auto_triage.store_cached_response(db_path, "key", "response")
+
+        assert auto_triage.load_cached_response(db_path, "other-key", ttl=60) is None
+
+    def test_load_expired(self, auto_triage, db_path):
+        """Entries older than the TTL are a miss."""
+        with patch.object(auto_triage.time, "time", return_value=1_000_000):
+            auto_triage.store_cached_response(db_path, "key", "response")
+        with patch.object(auto_triage.time, "time", return_value=1_000_061):
+            assert auto_triage.load_cached_response(db_path, "key", ttl=60) is None
+
+    def test_store_replaces_entry(self, auto_triage, db_path):
+        """Storing under an existing key replaces the response."""
+        auto_triage.store_cached_response(db_path, "key", "old")
+        auto_triage.store_cached_response(db_path, "key", "new")
+
+        assert auto_triage.load_cached_response(db_path, "key", ttl=60) == "new"
+
+    def test_dry_run_reuses_cached_response(self, auto_triage, triage_agent, db_path):
+        """A second dry run is served from the cache without running the agent."""
+        first = auto_triage.run_triage("user", db_path, dry_run=True, json_output=True)
+        second = auto_triage.run_triage("user", db_path, dry_run=True, json_output=True)
+
+        assert triage_agent.run.call_count == 1
+        assert first["total"] == second["total"] == 1
+
+    def test_no_cache_always_runs_agent(self, auto_triage, triage_agent, db_path):
+        """use_cache=False (--no-cache) neither reads nor writes the cache."""
+        auto_triage.run_triage("user", db_path, dry_run=True, json_output=True, use_cache=False)
+        auto_triage.run_triage("user", db_path, dry_run=True, json_output=True, use_cache=False)
+
+        assert triage_agent.run.call_count == 2
+        key = auto_triage.triage_cache_key("user", auto_triage.DEFAULT_TRIAGE_PROMPT)
+        assert auto_triage.load_cached_response(db_path, key, ttl=60) is None
+
+    def test_apply_run_skips_cache(self, auto_triage, triage_agent, db_path):
+        """Apply runs always ask the agent and never serve from the cache."""
+        key = auto_triage.triage_cache_key("user", auto_triage.DEFAULT_TRIAGE_PROMPT)
+        auto_triage.store_cached_response(db_path, key, "| stale |")
+
+        auto_triage.run_triage("user", db_path, dry_run=False, json_output=True)
+
+        triage_agent.run.assert_called_once()
+        assert auto_triage.load_cached_response(db_path, key, ttl=60) == "| stale |"
+
+    def test_unparseable_response_not_cached(self, auto_triage, triage_agent, db_path):
+        """Responses without triage rows are not stored."""
+        triage_agent.run.return_value = MagicMock(content="I could not reach Jira.")
+
+        auto_triage.run_triage("user", db_path, dry_run=True, json_output=True)
+
+        key = auto_triage.triage_cache_key("user", auto_triage.DEFAULT_TRIAGE_PROMPT)
+        assert auto_triage.load_cached_response(db_path, key, ttl=60) is None
+
+
+@pytest.fixture
+def socket_path():
+    """Provide a short Unix socket path (tmp_path can exceed the socket path limit)."""
+    with tempfile.TemporaryDirectory() as socket_dir:
+        yield os.path.join(socket_dir, "triage.sock")
+
+
+def send_one_request(auto_triage, socket_path: str, request: dict, dry_run: bool = True) -> dict:
+    """Start a daemon server, serve a single request on a thread and return its response."""
+    with auto_triage.create_daemon_server(socket_path, "user", "unused.db", dry_run, False, 60) as server:
+        thread = threading.Thread(target=server.handle_request)
+        thread.start()
+        try:
+            return auto_triage.send_daemon_request(socket_path, request)
+        finally:
+            thread.join(timeout=5)
+
+
+class TestDaemon:
+    """Tests for daemon mode request handling."""
+
+    def test_request_round_trip(self, auto_triage, socket_path):
+        """A request is passed to run_triage() and its results are returned as JSON."""
+        results = {"success": True, "total": 1, "auto_apply": 1, "applied": 0, "failed": 0}
+        with patch.object(auto_triage, "run_triage", return_value=results) as mock_run:
+            response = send_one_request(auto_triage, socket_path, {"jql": "project=RHIDP", "user_id": "alice"})
+
+        assert response == results
+        kwargs = mock_run.call_args.kwargs
+        assert kwargs["jql_filter"] == "project=RHIDP"
+        assert kwargs["user_id"] == "alice"
+        assert kwargs["json_output"] is True
+
+    def test_request_error_returns_failure(self, auto_triage, socket_path):
+        """Errors in a request are reported to the client instead of stopping the daemon."""
+        with patch.object(auto_triage, "run_triage", side_effect=RuntimeError("agent crashed")):
+            response = send_one_request(auto_triage, socket_path, {"jql": "project=RHIDP"})
+
+        assert response["success"] is False
+        assert response["error"] == "agent crashed"
+
+    def test_missing_jira_token_returns_failure(self, auto_triage, socket_path):
+        """A missing JIRA_API_TOKEN fails the request without exiting the process."""
+        with patch.dict(os.environ, clear=True):
+            response = send_one_request(auto_triage, socket_path, {})
+
+        assert response["success"] is False
+        assert "JIRA_API_TOKEN" in response["error"]
+
+    @pytest.mark.parametrize("requested", [None, True, False])
+    def test_dry_run_daemon_forces_dry_run(self, auto_triage, socket_path, requested):
+        """A daemon started with --dry-run ignores requests to apply."""
+        request = {} if requested is None else {"dry_run": requested}
+        with patch.object(auto_triage, "run_triage", return_value={"success": True}) as mock_run:
+            send_one_request(auto_triage, socket_path, request, dry_run=True)
+
+        assert mock_run.call_args.kwargs["dry_run"] is True
+
+    @pytest.mark.parametrize(("requested", "expected"), [(None, False), (True, True), (False, False)])
+    def test_apply_daemon_uses_request_dry_run(self, auto_triage, socket_path, requested, expected):
+        """A daemon started with --apply honours the request's dry_run flag."""
+        request = {} if requested is None else {"dry_run": requested}
+        with patch.object(auto_triage, "run_triage", return_value={"success": True}) as mock_run:
+            send_one_request(auto_triage, socket_path, request, dry_run=False)
+
+        assert mock_run.call_args.kwargs["dry_run"] is expected
+
+    def test_client_without_daemon_returns_failure(self, auto_triage, socket_path):
+        """A client with no daemon listening gets a failure result instead of a traceback."""
+        response = auto_triage.send_daemon_request(socket_path, {"jql": "project=RHIDP"})
+
+        assert response["success"] is False
+        assert socket_path in response["error"]
+
+    def test_main_client_without_daemon_exits_with_error(self, auto_triage, socket_path):
+        """--client exits with status 1 when the daemon cannot be reached."""
+        with (
+            patch.object(auto_triage.sys, "argv", ["auto_triage.py", "--client", "--dry-run", "--json-output", "--socket", socket_path]),
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            auto_triage.main()
+
+        assert exc_info.value.code == 1
+
+    def test_main_checks_jira_token_before_starting_daemon(self, auto_triage):
+        """The daemon is not started when JIRA_API_TOKEN is missing."""
+        with (
+            patch.dict(os.environ, clear=True),
+            patch.object(auto_triage.sys, "argv", ["auto_triage.py", "--daemon", "--dry-run"]),
+            patch.object(auto_triage, "serve_daemon") as mock_serve,
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            auto_triage.main()
+
+        assert exc_info.value.code == 1
+        mock_serve.assert_not_called()
+
+
+JIRA_URL = "https://jira.example.com/rest/api/2/{path}"
+TEAM_IDS = {"RHDH Security": "4267", "RHDH Plugins": "4268"}
+
+
+def make_recommendation(ticket: str, field: str, recommended: str) -> dict:
+    """Build a parsed recommendation as returned by parse_triage_table()."""
+    return {"ticket": ticket, "field": field, "current": "", "recommended": recommended, "confidence": 90, "action": "NEW"}
+
+
+@pytest.fixture
+def jira_client(auto_triage):
+    """Replace the JIRA client, team config and credentials used by apply_recommendations()."""
+    client = MagicMock()
+    client._get_url.side_effect = lambda path: JIRA_URL.format(path=path)
+    with (
+        patch.dict(os.environ, {"JIRA_API_TOKEN": "test-token"}),
+        patch("jira.JIRA", return_value=client),
+        patch.object(auto_triage, "load_team_id_map", return_value=TEAM_IDS),
+    ):
+        yield client
+
+
+def put_payloads(jira_client) -> dict[str, dict]:
+    """Map each PUT URL sent through the Jira session to its decoded JSON body."""
+    return {call.args[0]: json.loads(call.kwargs["data"]) for call in jira_client._session.put.call_args_list}
+
+
+class TestApplyRecommendations:
+    """Tests for apply_recommendations()."""
+
+    def test_puts_fields_per_ticket(self, auto_triage, jira_client):
+        """Each ticket gets one PUT with its team and components fields."""
+        recommendations = [
+            make_recommendation("RHIDP-2", "team", "RHDH Plugins"),
+            make_recommendation("RHIDP-1", "team", "RHDH Security"),
+            make_recommendation("RHIDP-1", "components", "RBAC, Keycloak Provider"),
+        ]
+
+        results = auto_triage.apply_recommendations(recommendations, None, "user")
+
+        assert put_payloads(jira_client) == {
+            JIRA_URL.format(path="issue/RHIDP-1"): {
+                "fields": {
+                    "customfield_12313240": "4267",
+                    "components": [{"name": "RBAC"}, {"name": "Keycloak Provider"}],
+                }
+            },
+            JIRA_URL.format(path="issue/RHIDP-2"): {"fields": {"customfield_12313240": "4268"}},
+        }
+        assert sorted(results["applied"], key=lambda rec: (rec["ticket"], rec["field"])) == sorted(
+            recommendations, key=lambda rec: (rec["ticket"], rec["field"])
+        )
+        assert results["failed"] == []
+
+    def test_mounts_pooled_adapter(self, auto_triage, jira_client):
+        """The Jira session gets a connection pool sized for the update workers."""
+        auto_triage.apply_recommendations([make_recommendation("RHIDP-1", "team", "RHDH Security")], None, "user")
+
+        mounted = {call.args[0]: call.args[1] for call in jira_client._session.mount.call_args_list}
+        assert set(mounted) == {"https://", "http://"}
+        assert mounted["https://"]._pool_maxsize == auto_triage.APPLY_MAX_WORKERS
+
+    def test_failed_put_counts_only_that_ticket(self, auto_triage, jira_client):
+        """A ticket whose PUT raises is failed; the other tickets are still applied."""
+
+        def put(url, data):
+            if url.endswith("RHIDP-2"):
+                raise RuntimeError("HTTP 500")
+            return MagicMock()
+
+        jira_client._session.put.side_effect = put
+        recommendations = [
+            make_recommendation("RHIDP-1", "team", "RHDH Security"),
+            make_recommendation("RHIDP-2", "team", "RHDH Plugins"),
+            make_recommendation("RHIDP-3", "components", "RBAC"),
+        ]
+
+        results = auto_triage.apply_recommendations(recommendations, None, "user")
+
+        assert sorted(rec["ticket"] for rec in results["applied"]) == ["RHIDP-1", "RHIDP-3"]
+        assert [rec["ticket"] for rec in results["failed"]] == ["RHIDP-2"]
+
+    def test_unknown_team_fails_without_put(self, auto_triage, jira_client):
+        """A ticket whose only update is an unknown team is failed and never sent to Jira."""
+        recommendations = [
+            make_recommendation("RHIDP-1", "team", "No Such Team"),
+            make_recommendation("RHIDP-2", "team", "RHDH Plugins"),
+        ]
+
+        results = auto_triage.apply_recommendations(recommendations, None, "user")
+
+        assert list(put_payloads(jira_client)) == [JIRA_URL.format(path="issue/RHIDP-2")]
+        assert results["failed"] == [recommendations[0]]
+        assert results["applied"] == [recommendations[1]]
+
+    def test_unknown_field_is_ignored(self, auto_triage, jira_client):
+        """Fields without a Jira mapping are left out of the update payload."""
+        recommendations = [
+            make_recommendation("RHIDP-1", "team", "RHDH Security"),
+            make_recommendation("RHIDP-1", "priority", "Major"),
+        ]
+
+        auto_triage.apply_recommendations(recommendations, None, "user")
+
+        assert put_payloads(jira_client) == {JIRA_URL.format(path="issue/RHIDP-1"): {"fields": {"customfield_12313240": "4267"}}}
+
+    def test_missing_token_fails_everything(self, auto_triage, jira_client):
+        """Without JIRA_API_TOKEN nothing is sent and every recommendation fails."""
+        recommendations = [make_recommendation("RHIDP-1", "team", "RHDH Security")]
+
+        with patch.dict(os.environ, clear=True):
+            results = auto_triage.apply_recommendations(recommendations, None, "user")
+
+        jira_client._session.put.assert_not_called()
+        assert results == {"applied": [], "failed": recommendations}
@@ -31,6 +31,11 @@ if "GOOGLE_API_KEY" not in os.environ and "GEMINI_API_KEY" in os.environ:
     os.environ["GOOGLE_API_KEY"] = os.environ["GEMINI_API_KEY"]
 
 
+def _content(response) -> str:
+    """Return the response content as a string (or the response itself if it has no content)."""
+    return str(getattr(response, "content", response))
+
+
 # Test fixtures
 @pytest.fixture
 def shared_db() -> SqliteDb:
@@ -93,9 +98,10 @@ class TestFavoriteColorConfiguration:
         response = agent.run("Hello!", user_id=user_id)
 
         # Should get config prompt, not agent response
-        content = str(response.content) if hasattr(response, "content") else str(response)
-        assert "favorite color" in content.lower()
-        assert "demo agent" in content.lower()
+        content = _content(response)
+        lowered = content.lower()
+        assert "favorite color" in lowered
+        assert "demo agent" in lowered
 
     def test_color_extraction_simple_pattern(self, shared_db: SqliteDb, token_storage: TokenStorageType):
         """Test extraction of color from 'my favorite color is X' pattern."""
@@ -106,9 +112,10 @@ class TestFavoriteColorConfiguration:
         response = agent.run("My favorite color is blue", user_id=user_id)
 
         # Should get confirmation
-        content = str(response.content) if hasattr(response, "content") else str(response)
-        assert "blue" in content.lower()
-        assert "✅" in content or "configured" in content.lower()
+        content = _content(response)
+        lowered = content.lower()
+        assert "blue" in lowered
+        assert "✅" in content or "configured" in lowered
 
         # Verify color is stored
         color_config = agent.toolkit_configs[0]
@@ -122,9 +129,10 @@ class TestFavoriteColorConfiguration:
 
         response = agent.run("I like green", user_id=user_id)
 
-        content = str(response.content) if hasattr(response, "content") else str(response)
-        assert "green" in content.lower()
-        assert "✅" in content or "configured" in content.lower()
+        content = _content(response)
+        lowered = content.lower()
+        assert "green" in lowered
+        assert "✅" in content or "configured" in lowered
 
     def test_color_extraction_set_color_pattern(self, shared_db: SqliteDb, token_storage: TokenStorageType):
         """Test extraction from 'set color to X' pattern."""
@@ -133,9 +141,10 @@ class TestFavoriteColorConfiguration:
 
         response = agent.run("set color to red", user_id=user_id)
 
-        content = str(response.content) if hasattr(response, "content") else str(response)
-        assert "red" in content.lower()
-        assert "✅" in content or "configured" in content.lower()
+        content = _content(response)
+        lowered = content.lower()
+        assert "red" in lowered
+        assert "✅" in content or "configured" in lowered
 
     def test_color_extraction_color_equals_pattern(self, shared_db: SqliteDb, token_storage: TokenStorageType):
         """Test extraction from 'color = X' pattern."""
@@ -144,9 +153,25 @@ class TestFavoriteColorConfiguration:
 
         response = agent.run("color: yellow", user_id=user_id)
 
-        content = str(response.content) if hasattr(response, "content") else str(response)
-        assert "yellow" in content.lower()
-        assert "✅" in content or "configured" in content.lower()
+        content = _content(response)
+        lowered = content.lower()
+        assert "yellow" in lowered
+        assert "✅" in content or "configured" in lowered
+
+    @pytest.mark.parametrize(
+        ("message", "expected"),
+        [
+            ("Hi! My favorite color is Blue", "blue"),
+            ("favorite color: green", "green"),
+            ("I love purple", "purple"),
+            ("please configure color orange", "orange"),
+            ("color=pink", "pink"),
+            ("Hello there", None),
+        ],
+    )
+    def test_extract_color_from_message_patterns(self, message: str, expected: str | None):
+        """Test each extraction pattern directly, without running the agent."""
+        assert FavoriteColorConfig()._extract_color_from_message(message) == expected
 
     def test_invalid_color_rejected(self, shared_db: SqliteDb, token_storage: TokenStorageType):
         """Test that invalid colors are rejected with error message."""
@@ -155,9 +180,10 @@ class TestFavoriteColorConfiguration:
 
         response = agent.run("My favorite color is magenta", user_id=user_id)
 
-        content = str(response.content) if hasattr(response, "content") else str(response)
-        assert "❌" in content or "error" in content.lower() or "invalid" in content.lower()
-        assert "magenta" in content.lower()
+        content = _content(response)
+        lowered = content.lower()
+        assert "❌" in content or "error" in lowered or "invalid" in lowered
+        assert "magenta" in lowered
 
     def test_multiple_users_isolated(self, shared_db: SqliteDb, token_storage: TokenStorageType):
         """Test that different users have isolated configurations."""
@@ -204,9 +230,10 @@ class TestAgentExecution:
         response = agent.run("What is your purpose?", user_id=user_id)
 
         # Should get a real response from the agent
-        content = str(response.content) if hasattr(response, "content") else str(response)
+        content = _content(response)
+        lowered = content.lower()
         assert len(content) > 0
-        assert "demo" in content.lower() or "showcase" in content.lower()
+        assert "demo" in lowered or "showcase" in lowered
 
     @pytest.mark.asyncio
     async def test_async_run_non_streaming(self, configured_agent: tuple[DemoAgent, str]):
@@ -216,7 +243,7 @@ class TestAgentExecution:
         response = await agent.arun("Tell me about yourself", user_id=user_id, stream=False)
 
         # Should get a real response
-        content = str(response.content) if hasattr(response, "content") else str(response)
+        content = _content(response)
         assert len(content) > 0
 
     @pytest.mark.asyncio
@@ -276,10 +303,11 @@ class TestColorTools:
 
         response = agent.run("Generate a complementary color palette for me", user_id=user_id)
 
-        content = str(response.content) if hasattr(response, "content") else str(response)
+        content = _content(response)
+        lowered = content.lower()
         assert len(content) > 0
         # Should mention colors or palette
-        assert "color" in content.lower() or "palette" in content.lower()
+        assert "color" in lowered or "palette" in lowered
 
     def test_text_formatting_tool(self, configured_agent: tuple[DemoAgent, str]):
         """Test that agent can use text formatting tool."""
@@ -287,7 +315,7 @@ class TestColorTools:
 
         response = agent.run("Format the text 'Hello World' with a bold theme", user_id=user_id)
 
-        content = str(response.content) if hasattr(response, "content") else str(response)
+        content = _content(response)
         assert len(content) > 0
 
 
@@ -321,9 +349,10 @@ class TestErrorHandling:
 
         response = agent.run("Hello", user_id=None)
 
-        content = str(response.content) if hasattr(response, "content") else str(response)
-        assert "❌" in content or "error" in content.lower()
-        assert "user id" in content.lower()
+        content = _content(response)
+        lowered = content.lower()
+        assert "❌" in content or "error" in lowered
+        assert "user id" in lowered
 
     @pytest.mark.asyncio
     async def test_arun_without_user_id(self, shared_db: SqliteDb, token_storage: TokenStorageType):
@@ -332,7 +361,7 @@ class TestErrorHandling:
 
         response = await agent.arun("Hello", user_id=None, stream=False)
 
-        content = str(response.content) if hasattr(response, "content") else str(response)
+        content = _content(response)
         assert "❌" in content or "error" in content.lower()
 
     def test_empty_message(self, shared_db: SqliteDb, token_storage: TokenStorageType):
@@ -343,7 +372,7 @@ class TestErrorHandling:
         # Should still prompt for configuration
         response = agent.run("", user_id=user_id)
 
-        content = str(response.content) if hasattr(response, "content") else str(response)
+        content = _content(response)
         assert "favorite color" in content.lower()
 
 
@@ -0,0 +1,139 @@
+"""
+Tests for the Google Drive Toolkit.
+
+This test suite covers:
+- get_document_content() retrieval and error handling
+- Truncation of long documents with max_chars
+- get_documents_content() batch retrieval
+"""
+
+import json
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from google.oauth2.credentials import Credentials
+
+from agentllm.tools.gdrive_toolkit import DEFAULT_MAX_CHARS, GoogleDriveTools
+
+TRUNCATION_NOTE = "\n\n[Truncated: document exceeds {max_chars} characters]"
+
+
+@pytest.fixture
+def mock_exporter():
+    """Provide a mock GoogleDriveExporter used by the toolkit."""
+    with patch("agentllm.tools.gdrive_toolkit.GoogleDriveExporter") as mock_exporter_class:
+        exporter = MagicMock()
+        mock_exporter_class.return_value = exporter
+        yield exporter
+
+
+@pytest.fixture
+def toolkit(mock_exporter) -> GoogleDriveTools:
+    """Provide a GoogleDriveTools instance backed by the mock exporter."""
+    return GoogleDriveTools(credentials=Mock(spec=Credentials))
+
+
+class TestGetDocumentContent:
+    """Tests for get_document_content()."""
+
+    def test_returns_content(self, toolkit, mock_exporter):
+        """Document content is returned unchanged."""
+        mock_exporter.get_document_content_as_string.return_value = "# Title"
+
+        assert toolkit.get_document_content("doc123") == "# Title"
+        mock_exporter.get_document_content_as_string.assert_called_once_with("doc123", format_key=None)
+
+    def test_missing_content_returns_error_message(self, toolkit, mock_exporter):
+        """A failed export is reported as a message instead of raising."""
+        mock_exporter.get_document_content_as_string.return_value = None
+
+        assert toolkit.get_document_content("doc123") == "Failed to retrieve document content: doc123"
+
+    def test_exception_returns_error_message(self, toolkit, mock_exporter):
+        """Exporter errors are reported as a message instead of raising."""
+        mock_exporter.get_document_content_as_string.side_effect = RuntimeError("quota exceeded")
+
+        assert toolkit.get_document_content("doc123") == "Error retrieving document doc123: quota exceeded"
+
+    @pytest.mark.parametrize("length", [9, 10], ids=["under_limit", "at_limit"])
+    def test_content_within_max_chars_not_truncated(self, toolkit, mock_exporter, length):
+        """Content up to and including max_chars is returned in full."""
+        mock_exporter.get_document_content_as_string.return_value = "x" * length
+
+        assert toolkit.get_document_content("doc123", max_chars=10) == "x" * length
+
+    def test_content_over_max_chars_truncated(self, toolkit, mock_exporter):
+        """Content longer than max_chars is cut and a note is appended."""
+        mock_exporter.get_document_content_as_string.return_value = "x" * 11
+
+        content = toolkit.get_document_content("doc123", max_chars=10)
+
+        assert content == "x" * 10 + TRUNCATION_NOTE.format(max_chars=10)
+
+    def test_default_max_chars(self, toolkit, mock_exporter):
+        """Without max_chars, documents are capped at DEFAULT_MAX_CHARS."""
+        mock_exporter.get_document_content_as_string.return_value = "x" * (DEFAULT_MAX_CHARS + 1)
+
+        content = toolkit.get_document_content("doc123")
+
+        assert content == "x" * DEFAULT_MAX_CHARS + TRUNCATION_NOTE.format(max_chars=DEFAULT_MAX_CHARS)
+
+
+class TestGetDocumentsContent:
+    """Tests for get_documents_content()."""
+
+    def test_returns_json_map_of_contents(self, toolkit, mock_exporter):
+        """The result maps each requested URL/ID to its content, in request order."""
+        mock_exporter.get_document_content_as_string.side_effect = lambda url_or_id, format_key: f"content of {url_or_id}"
+
+        result = json.loads(toolkit.get_documents_content(["doc1", "https://docs.google.com/document/d/doc2/edit"]))
+
+        assert result == {
+            "doc1": "content of doc1",
+            "https://docs.google.com/document/d/doc2/edit": "content of https://docs.google.com/document/d/doc2/edit",
+        }
+        assert list(result) == ["doc1", "https://docs.google.com/document/d/doc2/edit"]
+
+    def test_duplicates_fetched_once(self, toolkit, mock_exporter):
+        """Repeated URLs/IDs are fetched and returned once."""
+        mock_exporter.get_document_content_as_string.return_value = "content"
+
+        result = json.loads(toolkit.get_documents_content(["doc1", "doc1"]))
+
+        assert result == {"doc1": "content"}
+        mock_exporter.get_document_content_as_string.assert_called_once()
+
+    def test_failed_document_does_not_fail_batch(self, toolkit, mock_exporter):
+        """A document that cannot be retrieved gets an error message; the others still return content."""
+
+        def export(url_or_id, format_key):
+            if url_or_id == "bad":
+                raise RuntimeError("permission denied")
+            if url_or_id == "missing":
+                return None
+            return f"content of {url_or_id}"
+
+        mock_exporter.get_document_content_as_string.side_effect = export
+
+        result = json.loads(toolkit.get_documents_content(["doc1", "bad", "missing", "doc2"]))
+
+        assert result == {
+            "doc1": "content of doc1",
+            "bad": "Error retrieving document bad: permission denied",
+            "missing": "Failed to retrieve document content: missing",
+            "doc2": "content of doc2",
+        }
+
+    def test_empty_request_returns_empty_map(self, toolkit, mock_exporter):
+        """No URLs/IDs returns an empty JSON object without calling the exporter."""
+        assert json.loads(toolkit.get_documents_content([])) == {}
+        mock_exporter.get_document_content_as_string.assert_not_called()
+
+    def test_stdlib_json_fallback(self, toolkit, mock_exporter):
+        """Without orjson, the same JSON map is produced by the stdlib encoder."""
+        mock_exporter.get_document_content_as_string.return_value = "content"
+
+        with patch("agentllm.tools.gdrive_toolkit.orjson", None):
+            result = json.loads(toolkit.get_documents_content(["doc1"]))
+
+        assert result == {"doc1": "content"}
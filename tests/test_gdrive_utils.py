@@ -0,0 +1,113 @@
+"""
+Tests for the Google Drive exporter utilities.
+
+This test suite covers:
+- Exporting document content as a string over the authorized session
+- Error handling for failed exports
+"""
+
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+import requests
+from google.oauth2.credentials import Credentials
+
+from agentllm.tools.gdrive_utils import DRIVE_EXPORT_URL, GoogleDriveExporter
+
+DOC_URL = "https://docs.google.com/document/d/doc123/edit"
+SHEET_URL = "https://docs.google.com/spreadsheets/d/sheet123/edit"
+
+
+@pytest.fixture
+def mock_credentials() -> Credentials:
+    """Provide mock Google OAuth2 credentials."""
+    creds = Mock(spec=Credentials)
+    creds.expired = False
+    return creds
+
+
+@pytest.fixture
+def exporter(mock_credentials) -> GoogleDriveExporter:
+    """Provide an exporter whose HTTP session is a mock."""
+    exporter = GoogleDriveExporter(credentials=mock_credentials)
+    exporter._session = MagicMock()
+    return exporter
+
+
+def make_response(content: bytes = b"", status_code: int = 200, text: str = "") -> requests.Response:
+    """Build a requests.Response with the given body and status."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content or text.encode("utf-8")
+    return response
+
+
+class TestGetDocumentContentAsString:
+    """Tests for GoogleDriveExporter.get_document_content_as_string()."""
+
+    def test_document_exported_as_markdown(self, exporter):
+        """Documents are fetched as HTML from the export endpoint and converted to markdown."""
+        exporter._session.get.return_value = make_response(b"<h1>Title</h1><p>Body</p>")
+
+        content = exporter.get_document_content_as_string(DOC_URL)
+
+        exporter._session.get.assert_called_once_with(DRIVE_EXPORT_URL.format(document_id="doc123"), params={"mimeType": "text/html"})
+        assert "Title" in content
+        assert "<h1>" not in content
+
+    def test_spreadsheet_exported_as_csv(self, exporter):
+        """Spreadsheets default to CSV and are returned as-is."""
+        exporter._session.get.return_value = make_response(b"a,b\n1,2\n")
+
+        content = exporter.get_document_content_as_string(SHEET_URL)
+
+        exporter._session.get.assert_called_once_with(DRIVE_EXPORT_URL.format(document_id="sheet123"), params={"mimeType": "text/csv"})
+        assert content == "a,b\n1,2\n"
+
+    def test_unsupported_conversion_returns_none(self, exporter):
+        """A 400 for an unsupported conversion is reported as a missing format."""
+        exporter._session.get.return_value = make_response(status_code=400, text="The requested conversion is not supported.")
+
+        with patch("agentllm.tools.gdrive_utils.logger") as mock_logger:
+            assert exporter.get_document_content_as_string(DOC_URL, "txt") is None
+
+        mock_logger.warning.assert_called_once()
+        mock_logger.error.assert_not_called()
+
+    def test_http_error_returns_none(self, exporter):
+        """Other HTTP errors are logged and return None."""
+        exporter._session.get.return_value = make_response(status_code=404, text="File not found")
+
+        with patch("agentllm.tools.gdrive_utils.logger") as mock_logger:
+            assert exporter.get_document_content_as_string(DOC_URL, "txt") is None
+
+        mock_logger.error.assert_called_once()
+
+    def test_connection_error_returns_none(self, exporter):
+        """Transport errors return None instead of raising."""
+        exporter._session.get.side_effect = requests.ConnectionError("connection reset")
+
+        assert exporter.get_document_content_as_string(DOC_URL, "txt") is None
+
+
+class TestSession:
+    """Tests for the exporter's authorized session."""
+
+    def test_session_created_once_per_exporter(self, mock_credentials):
+        """The session is built lazily and reused by the same exporter."""
+        exporter = GoogleDriveExporter(credentials=mock_credentials)
+
+        with patch("google.auth.transport.requests.AuthorizedSession") as mock_session_cls:
+            first = exporter.session
+            second = exporter.session
+
+        assert first is second
+        mock_session_cls.assert_called_once_with(mock_credentials)
+
+    def test_sessions_not_shared_between_exporters(self, mock_credentials):
+        """Each exporter owns its session, so it is released with the exporter."""
+        with patch("google.auth.transport.requests.AuthorizedSession", side_effect=lambda creds: MagicMock()):
+            first = GoogleDriveExporter(credentials=mock_credentials).session
+            second = GoogleDriveExporter(credentials=mock_credentials).session
+
+        assert first is not second
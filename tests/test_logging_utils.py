@@ -0,0 +1,176 @@
+"""
+Tests for the safe logging utilities.
+
+This test suite covers:
+- safe_log_content(), safe_log_dict() and sanitize_for_logging() output in
+  development (LOG_LEVEL=DEBUG) and production mode
+- Deferred formatting with lazy_safe_log_content()
+"""
+
+import importlib
+from unittest.mock import patch
+
+import pytest
+from loguru import logger
+
+import agentllm.utils.logging as logging_utils
+
+
+def _reload_logging_utils():
+    """Re-resolve the development mode flag and rebind the helpers."""
+    logging_utils.is_development_mode.cache_clear()
+    return importlib.reload(logging_utils)
+
+
+@pytest.fixture
+def dev_logging(monkeypatch):
+    """Provide the logging utilities specialized for development mode."""
+    monkeypatch.setenv("LOG_LEVEL", "DEBUG")
+    yield _reload_logging_utils()
+    monkeypatch.undo()
+    _reload_logging_utils()
+
+
+@pytest.fixture
+def prod_logging(monkeypatch):
+    """Provide the logging utilities specialized for production mode."""
+    monkeypatch.setenv("LOG_LEVEL", "INFO")
+    yield _reload_logging_utils()
+    monkeypatch.undo()
+    _reload_logging_utils()
+
+
+class TestDevelopmentMode:
+    """Tests for helper output with LOG_LEVEL=DEBUG."""
+
+    def test_is_development_mode(self, dev_logging):
+        """LOG_LEVEL=DEBUG selects development mode."""
+        assert dev_logging.is_development_mode() is True
+
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            ("Hello World", "Message (full): Hello World"),
+            ({"a": 1}, "Message (full): {'a': 1}"),
+            (None, "Message: None"),
+        ],
+    )
+    def test_safe_log_content(self, dev_logging, content, expected):
+        """Full content is logged with its label."""
+        assert dev_logging.safe_log_content(content, "Message") == expected
+
+    def test_safe_log_dict(self, dev_logging):
+        """Full dictionaries are logged with keys and values."""
+        data = {"token": "abc123", "user": "john"}
+
+        assert dev_logging.safe_log_dict(data, "Config") == "Config (full): {'token': 'abc123', 'user': 'john'}"
+
+    def test_safe_log_dict_non_dict(self, dev_logging):
+        """Non-dict values fall back to safe_log_content."""
+        assert dev_logging.safe_log_dict(["a"], "Config") == "Config (full): ['a']"
+        assert dev_logging.safe_log_dict(None, "Config") == "Config: None"
+
+    def test_sanitize_for_logging(self, dev_logging):
+        """Values are logged as-is."""
+        assert dev_logging.sanitize_for_logging("secret_token_12345") == "secret_token_12345"
+        assert dev_logging.sanitize_for_logging(None) == "None"
+
+
+class TestProductionMode:
+    """Tests for helper output with LOG_LEVEL above DEBUG."""
+
+    def test_is_development_mode(self, prod_logging):
+        """LOG_LEVEL=INFO selects production mode."""
+        assert prod_logging.is_development_mode() is False
+
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            ("Hello World", "Message (type=str, len=11)"),
+            (b"bytes", "Message (type=bytes, len=5)"),
+            # Containers report their item count, not the length of their repr
+            ({"token": "abc123", "user": "john"}, "Message (type=dict, len=2)"),
+            (["a", "b", "c"], "Message (type=list, len=3)"),
+            # Values without len() fall back to the length of their string form
+            (12345, "Message (type=int, len=5)"),
+            (None, "Message: None"),
+        ],
+    )
+    def test_safe_log_content(self, prod_logging, content, expected):
+        """Only the type and length are logged, never the content."""
+        assert prod_logging.safe_log_content(content, "Message") == expected
+
+    def test_safe_log_content_does_not_stringify_sized_content(self, prod_logging):
+        """Content with a length is measured without calling str() on it."""
+
+        class Payload:
+            def __len__(self):
+                return 42
+
+            def __str__(self):
+                raise AssertionError("content was stringified")
+
+        assert prod_logging.safe_log_content(Payload(), "Payload") == "Payload (type=Payload, len=42)"
+
+    def test_safe_log_dict(self, prod_logging):
+        """Only dictionary keys are logged."""
+        data = {"token": "abc123", "user": "john"}
+
+        assert prod_logging.safe_log_dict(data, "Config") == "Config (keys=2): ['token', 'user']"
+
+    def test_safe_log_dict_non_dict(self, prod_logging):
+        """Non-dict values fall back to safe_log_content."""
+        assert prod_logging.safe_log_dict("secret", "Config") == "Config (type=str, len=6)"
+        assert prod_logging.safe_log_dict(None, "Config") == "Config: None"
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("secret_token_12345", "<redacted: type=str, len=18>"),
+            ({"token": "abc123"}, "<redacted: type=dict, len=1>"),
+            (None, "None"),
+        ],
+    )
+    def test_sanitize_for_logging(self, prod_logging, value, expected):
+        """Values are replaced by a redacted type/length description."""
+        assert prod_logging.sanitize_for_logging(value) == expected
+
+    def test_log_metadata_only(self, prod_logging):
+        """log_metadata_only matches the production safe_log_content output."""
+        assert prod_logging.log_metadata_only("Hello World", "Message") == "Message (type=str, len=11)"
+
+
+class TestLazySafeLogContent:
+    """Tests for lazy_safe_log_content()."""
+
+    @pytest.fixture
+    def info_sink(self):
+        """Capture log messages emitted at INFO level and above."""
+        messages = []
+        handler_id = logger.add(messages.append, level="INFO", format="{message}")
+        yield messages
+        logger.remove(handler_id)
+
+    def test_formats_only_when_converted(self, prod_logging):
+        """Creating the lazy message does not format anything."""
+        with patch.object(prod_logging, "safe_log_content", return_value="formatted") as mock_format:
+            lazy = prod_logging.lazy_safe_log_content("Hello World", "Message")
+            mock_format.assert_not_called()
+
+            assert str(lazy) == "formatted"
+
+        mock_format.assert_called_once_with("Hello World", "Message")
+
+    def test_filtered_record_is_never_formatted(self, prod_logging, info_sink):
+        """Records below every handler's level are dropped without formatting."""
+        with patch.object(prod_logging, "safe_log_content", return_value="formatted") as mock_format:
+            logger.trace(prod_logging.lazy_safe_log_content("Hello World", "Message"))
+
+        mock_format.assert_not_called()
+        assert info_sink == []
+
+    def test_emitted_record_is_formatted(self, prod_logging, info_sink):
+        """Emitted records contain the safe_log_content output."""
+        logger.info(prod_logging.lazy_safe_log_content("Hello World", "Message"))
+
+        assert [message.strip() for message in info_sink] == ["Message (type=str, len=11)"]
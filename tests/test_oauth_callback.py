@@ -9,14 +9,17 @@ These tests cover:
 - State token expiration
 """
 
-import os
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import DEFAULT, MagicMock, Mock, patch
 
+import jwt
 import pytest
 import requests
 from google.auth.exceptions import GoogleAuthError
 
+from agentllm.oauth_callback import providers as _providers_mod
+from agentllm.oauth_callback import state_validation
 from agentllm.oauth_callback.providers import GitHubProvider, GoogleDriveProvider, ProviderRegistry
 from agentllm.oauth_callback.state_validation import (
     StateTokenError,
@@ -26,6 +29,63 @@ from agentllm.oauth_callback.state_validation import (
     validate_state_token,
 )
 
+
+@dataclass(frozen=True, slots=True)
+class _FakeCreds:
+    """Plain stand-in for the Google credentials returned by the OAuth flow."""
+
+    token: str = "access_token_123"
+    refresh_token: str = "refresh_token_123"
+    expiry: datetime = field(default_factory=lambda: datetime.now(UTC) + timedelta(hours=1))
+    scopes: tuple[str, ...] = ("https://www.googleapis.com/auth/drive.readonly",)
+
+
+# State token for "test_user" valid until 2100, signed once and reused by the provider tests
+_SHARED_STATE_TOKEN = jwt.encode(
+    {"user_id": "test_user", "exp": 4_102_444_800, "iat": 0},
+    state_validation._STATE_SECRET_KEY_BYTES,
+    algorithm="HS256",
+)
+
+# State token for "test_user" that expired at the epoch, signed once with the real secret
+_EXPIRED_STATE_TOKEN = jwt.encode(
+    {"user_id": "test_user", "exp": 0, "iat": 0},
+    state_validation._STATE_SECRET_KEY_BYTES,
+    algorithm="HS256",
+)
+
+# Read-only GitHub API responses shared by the GitHub provider tests
+_GH_OK_TOKEN_RESP = Mock(
+    json=lambda: {"access_token": "gho_test_token_123", "token_type": "bearer", "scope": "repo,user"},
+    raise_for_status=Mock(),
+)
+_GH_OK_USER_RESP = Mock(json=lambda: {"login": "testuser", "id": 12345}, raise_for_status=Mock())
+_GH_ERROR_TOKEN_RESP = Mock(
+    json=lambda: {"error": "bad_verification_code", "error_description": "The code passed is incorrect or expired."},
+    raise_for_status=Mock(),
+)
+
+
+@pytest.fixture(scope="class")
+def provider_patches(request):
+    """Patch Flow and requests in the providers module once per test class.
+
+    The mocks are exposed as ``self.mock_flow_class`` and ``self.mock_requests``.
+    """
+    with patch.multiple(_providers_mod, Flow=DEFAULT, requests=DEFAULT) as mocks:
+        mocks["requests"].exceptions = requests.exceptions
+        request.cls.mock_flow_class = mocks["Flow"]
+        request.cls.mock_requests = mocks["requests"]
+        yield mocks
+
+
+@pytest.fixture
+def reset_provider_patches(provider_patches):
+    """Clear return values, side effects and calls on the class-wide provider mocks."""
+    for mock in provider_patches.values():
+        mock.reset_mock(return_value=True, side_effect=True)
+
+
 # ============================================================================
 # State Token Validation Tests
 # ============================================================================
@@ -48,6 +108,31 @@ class TestStateTokenValidation:
         validated_user_id = validate_state_token(token)
         assert validated_user_id == user_id
 
+    def test_generate_state_token_reuses_token_within_bucket(self):
+        """Test repeated generation for a user within one time bucket returns the same token."""
+        with patch("agentllm.oauth_callback.state_validation.time.time", side_effect=[1_000_050.0, 1_000_079.0, 1_000_080.0]):
+            first = generate_state_token("bucket_user")
+            second = generate_state_token("bucket_user")
+            third = generate_state_token("bucket_user")
+
+        assert first == second
+        assert third != first
+
+    def test_validate_state_token_verifies_signature_once(self):
+        """Test repeat validations reuse the cached verification but still enforce expiry."""
+        token = generate_state_token("cached_validation_user")
+
+        with patch.object(state_validation, "_decode_verified", wraps=state_validation._decode_verified) as mock_verify:
+            assert validate_state_token(token) == "cached_validation_user"
+            assert validate_state_token(token) == "cached_validation_user"
+
+        assert mock_verify.call_count == 1
+
+        exp = jwt.decode(token, options={"verify_signature": False})["exp"]
+        with patch("agentllm.oauth_callback.state_validation.time.time", return_value=exp + 1):
+            with pytest.raises(StateTokenExpiredError):
+                validate_state_token(token)
+
     def test_validate_invalid_state_token(self):
         """Test validation fails with invalid token."""
         invalid_token = "invalid.jwt.token"
@@ -59,40 +144,42 @@ class TestStateTokenValidation:
 
     def test_validate_expired_state_token(self):
         """Test validation fails with expired token."""
-        import jwt
-
-        # Get the secret key from the state_validation module
-        from agentllm.oauth_callback import state_validation
-
-        secret_key = state_validation._STATE_SECRET_KEY
-
-        # Create an expired token (expired 1 hour ago)
-        expiry = datetime.now(UTC) - timedelta(hours=1)
-        payload = {
-            "user_id": "test_user",
-            "exp": expiry,
-            "iat": datetime.now(UTC) - timedelta(hours=2),
-        }
-
-        expired_token = jwt.encode(payload, secret_key, algorithm="HS256")
+        expired_token = _EXPIRED_STATE_TOKEN
 
         with pytest.raises(StateTokenExpiredError) as exc_info:
             validate_state_token(expired_token)
 
         assert "expired" in str(exc_info.value).lower()
 
-    def test_validate_malformed_state_token(self):
-        """Test validation fails with malformed token."""
-        malformed_tokens = [
+    @pytest.mark.parametrize(
+        ("key", "algorithm", "payload"),
+        [
+            (b"wrong_secret_wrong_secret_wrong_secret", "HS256", {"user_id": "test_user", "exp": 4_102_444_800, "iat": 0}),
+            (None, "HS512", {"user_id": "test_user", "exp": 4_102_444_800, "iat": 0}),
+            (None, "HS256", {"exp": 4_102_444_800}),
+        ],
+        ids=["bad-signature", "wrong-alg", "missing-claims"],
+    )
+    def test_validate_rejects_tampered_state_token(self, key, algorithm, payload):
+        """Test validation rejects tokens with a foreign signature, algorithm or claim set."""
+        token = jwt.encode(payload, key or state_validation._STATE_SECRET_KEY_BYTES, algorithm=algorithm)
+
+        with pytest.raises(StateTokenInvalidError):
+            validate_state_token(token)
+
+    @pytest.mark.parametrize(
+        "token",
+        [
             "",
             "not-a-jwt",
             "a.b",  # Too few parts
             "a.b.c.d",  # Too many parts
-        ]
-
-        for token in malformed_tokens:
-            with pytest.raises(StateTokenError):
-                validate_state_token(token)
+        ],
+    )
+    def test_validate_malformed_state_token(self, token):
+        """Test validation fails with malformed token."""
+        with pytest.raises(StateTokenError):
+            validate_state_token(token)
 
 
 # ============================================================================
@@ -100,27 +187,18 @@ class TestStateTokenValidation:
 # ============================================================================
 
 
+@pytest.mark.usefixtures("provider_patches", "reset_provider_patches", "reset_token_storage")
 class TestGoogleDriveProvider:
     """Tests for Google Drive OAuth provider."""
 
-    @pytest.fixture
-    def mock_token_storage(self):
-        """Mock TokenStorage for testing."""
-        storage = MagicMock()
-        storage.upsert_token.return_value = True
-        return storage
-
-    @pytest.fixture
-    def gdrive_provider(self, mock_token_storage):
-        """Google Drive provider with mocked dependencies."""
-        with patch.dict(
-            os.environ,
-            {
-                "GDRIVE_CLIENT_ID": "test_client_id",
-                "GDRIVE_CLIENT_SECRET": "test_client_secret",
-            },
-        ):
-            return GoogleDriveProvider(token_storage=mock_token_storage)
+    @pytest.fixture(scope="class")
+    def gdrive_provider(self, oauth_token_storage):
+        """Google Drive provider with mocked dependencies, built once per class (read-only in tests)."""
+        # Class-scoped fixtures can't use the function-scoped monkeypatch fixture
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv("GDRIVE_CLIENT_ID", "test_client_id")
+            mp.setenv("GDRIVE_CLIENT_SECRET", "test_client_secret")
+            return GoogleDriveProvider(token_storage=oauth_token_storage)
 
     def test_provider_name(self, gdrive_provider):
         """Test provider returns correct name."""
@@ -130,138 +208,110 @@ class TestGoogleDriveProvider:
         """Test provider is configured when credentials are set."""
         assert gdrive_provider.is_configured() is True
 
-    def test_is_not_configured_without_credentials(self, mock_token_storage):
+    def test_is_not_configured_without_credentials(self, oauth_token_storage, monkeypatch):
         """Test provider is not configured when credentials are missing."""
-        with patch.dict(os.environ, {}, clear=True):
-            provider = GoogleDriveProvider(token_storage=mock_token_storage)
-            assert provider.is_configured() is False
+        monkeypatch.delenv("GDRIVE_CLIENT_ID", raising=False)
+        monkeypatch.delenv("GDRIVE_CLIENT_SECRET", raising=False)
 
-    def test_successful_oauth_flow(self, gdrive_provider, mock_token_storage):
+        provider = GoogleDriveProvider(token_storage=oauth_token_storage)
+        assert provider.is_configured() is False
+
+    def test_successful_oauth_flow(self, gdrive_provider, oauth_token_storage):
         """Test successful Google Drive OAuth code exchange."""
         user_id = "test_user"
-        state_token = generate_state_token(user_id)
+        state_token = _SHARED_STATE_TOKEN
         code = "test_auth_code"
         redirect_uri = "http://localhost:8501/callback"
 
         # Mock the OAuth flow
-        mock_credentials = MagicMock()
-        mock_credentials.token = "access_token_123"
-        mock_credentials.refresh_token = "refresh_token_123"
-        mock_credentials.expiry = datetime.now(UTC) + timedelta(hours=1)
-        mock_credentials.scopes = ["https://www.googleapis.com/auth/drive.readonly"]
-
-        with patch("agentllm.oauth_callback.providers.Flow") as mock_flow_class:
-            mock_flow = MagicMock()
-            mock_flow.credentials = mock_credentials
-            mock_flow_class.from_client_config.return_value = mock_flow
-
-            success, message = gdrive_provider.exchange_code_for_token(code, state_token, redirect_uri)
-
-            assert success is True
-            assert "Successfully authenticated" in message
-            assert user_id in message
-            mock_token_storage.upsert_token.assert_called_once_with(
-                "gdrive",
-                user_id=user_id,
-                credentials=mock_credentials,
-            )
-
-    def test_oauth_flow_with_invalid_state_token(self, gdrive_provider):
-        """Test OAuth flow fails with invalid state token (CSRF protection)."""
-        invalid_state = "invalid_state_token"
-        code = "test_auth_code"
-        redirect_uri = "http://localhost:8501/callback"
-
-        success, message = gdrive_provider.exchange_code_for_token(code, invalid_state, redirect_uri)
-
-        assert success is False
-        assert "Invalid authorization request" in message or "Authorization failed" in message
-
-    def test_oauth_flow_with_expired_state_token(self, gdrive_provider):
-        """Test OAuth flow fails with expired state token."""
-        import jwt
-
-        # Get the secret key from the state_validation module
-        from agentllm.oauth_callback import state_validation
-
-        secret_key = state_validation._STATE_SECRET_KEY
-
-        # Create expired token
-        expiry = datetime.now(UTC) - timedelta(hours=1)
-        payload = {
-            "user_id": "test_user",
-            "exp": expiry,
-            "iat": datetime.now(UTC) - timedelta(hours=2),
-        }
-        expired_token = jwt.encode(payload, secret_key, algorithm="HS256")
-
+        mock_credentials = _FakeCreds()
+
+        mock_flow_class = self.mock_flow_class
+        mock_flow = MagicMock()
+        mock_flow.credentials = mock_credentials
+        mock_flow_class.from_client_config.return_value = mock_flow
+
+        success, message = gdrive_provider.exchange_code_for_token(code, state_token, redirect_uri)
+
+        assert success is True
+        assert "Successfully authenticated" in message
+        assert user_id in message
+        oauth_token_storage.upsert_token.assert_called_once_with(
+            "gdrive",
+            user_id=user_id,
+            credentials=mock_credentials,
+        )
+
+    @pytest.mark.parametrize(
+        ("state_token", "expected_message"),
+        [
+            ("invalid_state_token", "Invalid authorization request"),  # CSRF protection
+            (_EXPIRED_STATE_TOKEN, "Authorization expired"),
+        ],
+        ids=["invalid", "expired"],
+    )
+    def test_oauth_flow_with_bad_state_token(self, gdrive_provider, state_token, expected_message):
+        """Test OAuth flow fails with an invalid or expired state token."""
         code = "test_auth_code"
         redirect_uri = "http://localhost:8501/callback"
 
-        success, message = gdrive_provider.exchange_code_for_token(code, expired_token, redirect_uri)
+        success, message = gdrive_provider.exchange_code_for_token(code, state_token, redirect_uri)
 
         assert success is False
-        assert "expired" in message.lower() or "try again" in message.lower()
+        assert expected_message in message
 
     def test_oauth_flow_with_invalid_code(self, gdrive_provider):
         """Test OAuth flow fails with invalid authorization code."""
-        user_id = "test_user"
-        state_token = generate_state_token(user_id)
+        state_token = _SHARED_STATE_TOKEN
         invalid_code = "invalid_code"
         redirect_uri = "http://localhost:8501/callback"
 
-        with patch("agentllm.oauth_callback.providers.Flow") as mock_flow_class:
-            mock_flow = MagicMock()
-            mock_flow.fetch_token.side_effect = GoogleAuthError("Invalid authorization code")
-            mock_flow_class.from_client_config.return_value = mock_flow
+        mock_flow_class = self.mock_flow_class
+        mock_flow = MagicMock()
+        mock_flow.fetch_token.side_effect = GoogleAuthError("Invalid authorization code")
+        mock_flow_class.from_client_config.return_value = mock_flow
 
-            success, message = gdrive_provider.exchange_code_for_token(invalid_code, state_token, redirect_uri)
+        success, message = gdrive_provider.exchange_code_for_token(invalid_code, state_token, redirect_uri)
 
-            assert success is False
-            assert "Google authentication failed" in message or "try again" in message.lower()
+        assert success is False
+        assert "Google authentication failed" in message or "try again" in message.lower()
 
     def test_oauth_flow_with_network_timeout(self, gdrive_provider):
         """Test OAuth flow handles network timeouts."""
-        user_id = "test_user"
-        state_token = generate_state_token(user_id)
+        state_token = _SHARED_STATE_TOKEN
         code = "test_auth_code"
         redirect_uri = "http://localhost:8501/callback"
 
-        with patch("agentllm.oauth_callback.providers.Flow") as mock_flow_class:
-            mock_flow = MagicMock()
-            mock_flow.fetch_token.side_effect = requests.exceptions.Timeout("Request timed out")
-            mock_flow_class.from_client_config.return_value = mock_flow
+        mock_flow_class = self.mock_flow_class
+        mock_flow = MagicMock()
+        mock_flow.fetch_token.side_effect = requests.exceptions.Timeout("Request timed out")
+        mock_flow_class.from_client_config.return_value = mock_flow
 
-            success, message = gdrive_provider.exchange_code_for_token(code, state_token, redirect_uri)
+        success, message = gdrive_provider.exchange_code_for_token(code, state_token, redirect_uri)
 
-            assert success is False
-            assert "timed out" in message.lower() or "try again" in message.lower()
+        assert success is False
+        assert "timed out" in message.lower() or "try again" in message.lower()
 
-    def test_oauth_flow_with_database_failure(self, gdrive_provider, mock_token_storage):
+    def test_oauth_flow_with_database_failure(self, gdrive_provider, oauth_token_storage):
         """Test OAuth flow handles database storage failures."""
-        user_id = "test_user"
-        state_token = generate_state_token(user_id)
+        state_token = _SHARED_STATE_TOKEN
         code = "test_auth_code"
         redirect_uri = "http://localhost:8501/callback"
 
         # Mock successful OAuth but failed database storage
-        mock_credentials = MagicMock()
-        mock_credentials.token = "access_token_123"
-        mock_credentials.refresh_token = "refresh_token_123"
-        mock_credentials.expiry = datetime.now(UTC) + timedelta(hours=1)
-        mock_credentials.scopes = ["https://www.googleapis.com/auth/drive.readonly"]
+        mock_credentials = _FakeCreds()
 
-        mock_token_storage.upsert_token.return_value = False
+        oauth_token_storage.upsert_token.return_value = False
 
-        with patch("agentllm.oauth_callback.providers.Flow") as mock_flow_class:
-            mock_flow = MagicMock()
-            mock_flow.credentials = mock_credentials
-            mock_flow_class.from_client_config.return_value = mock_flow
+        mock_flow_class = self.mock_flow_class
+        mock_flow = MagicMock()
+        mock_flow.credentials = mock_credentials
+        mock_flow_class.from_client_config.return_value = mock_flow
 
-            success, message = gdrive_provider.exchange_code_for_token(code, state_token, redirect_uri)
+        success, message = gdrive_provider.exchange_code_for_token(code, state_token, redirect_uri)
 
-            assert success is False
-            assert "Failed to save credentials" in message
+        assert success is False
+        assert "Failed to save credentials" in message
 
 
 # ============================================================================
@@ -269,27 +319,18 @@ class TestGoogleDriveProvider:
 # ============================================================================
 
 
+@pytest.mark.usefixtures("provider_patches", "reset_provider_patches", "reset_token_storage")
 class TestGitHubProvider:
     """Tests for GitHub OAuth provider."""
 
-    @pytest.fixture
-    def mock_token_storage(self):
-        """Mock TokenStorage for testing."""
-        storage = MagicMock()
-        storage.upsert_token.return_value = True
-        return storage
-
-    @pytest.fixture
-    def github_provider(self, mock_token_storage):
-        """GitHub provider with mocked dependencies."""
-        with patch.dict(
-            os.environ,
-            {
-                "GITHUB_CLIENT_ID": "test_client_id",
-                "GITHUB_CLIENT_SECRET": "test_client_secret",
-            },
-        ):
-            return GitHubProvider(token_storage=mock_token_storage)
+    @pytest.fixture(scope="class")
+    def github_provider(self, oauth_token_storage):
+        """GitHub provider with mocked dependencies, built once per class (read-only in tests)."""
+        # Class-scoped fixtures can't use the function-scoped monkeypatch fixture
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv("GITHUB_CLIENT_ID", "test_client_id")
+            mp.setenv("GITHUB_CLIENT_SECRET", "test_client_secret")
+            return GitHubProvider(token_storage=oauth_token_storage)
 
     def test_provider_name(self, github_provider):
         """Test provider returns correct name."""
@@ -299,107 +340,75 @@ class TestGitHubProvider:
         """Test provider is configured when credentials are set."""
         assert github_provider.is_configured() is True
 
-    def test_successful_oauth_flow(self, github_provider, mock_token_storage):
+    def test_successful_oauth_flow(self, github_provider, oauth_token_storage):
         """Test successful GitHub OAuth code exchange."""
-        user_id = "test_user"
-        state_token = generate_state_token(user_id)
+        state_token = _SHARED_STATE_TOKEN
         code = "test_auth_code"
         redirect_uri = "http://localhost:8501/callback"
 
-        # Mock the token exchange request
-        mock_token_response = Mock()
-        mock_token_response.json.return_value = {
-            "access_token": "gho_test_token_123",
-            "token_type": "bearer",
-            "scope": "repo,user",
-        }
-        mock_token_response.raise_for_status = Mock()
-
-        # Mock the user info request
-        mock_user_response = Mock()
-        mock_user_response.json.return_value = {
-            "login": "testuser",
-            "id": 12345,
-        }
-        mock_user_response.raise_for_status = Mock()
-
-        with patch("agentllm.oauth_callback.providers.requests") as mock_requests:
-            mock_requests.post.return_value = mock_token_response
-            mock_requests.get.return_value = mock_user_response
-            mock_requests.exceptions = requests.exceptions
-
-            success, message = github_provider.exchange_code_for_token(code, state_token, redirect_uri)
-
-            assert success is True
-            assert "Successfully authenticated" in message
-            assert "testuser" in message
-            mock_token_storage.upsert_token.assert_called_once()
-
-            # Verify timeout was set on requests
-            post_call_kwargs = mock_requests.post.call_args[1]
-            assert "timeout" in post_call_kwargs
-            assert post_call_kwargs["timeout"] == 10
-
-            get_call_kwargs = mock_requests.get.call_args[1]
-            assert "timeout" in get_call_kwargs
-            assert get_call_kwargs["timeout"] == 10
+        mock_requests = self.mock_requests
+        mock_requests.post.return_value = _GH_OK_TOKEN_RESP
+        mock_requests.get.return_value = _GH_OK_USER_RESP
+
+        success, message = github_provider.exchange_code_for_token(code, state_token, redirect_uri)
+
+        assert success is True
+        assert "Successfully authenticated" in message
+        assert "testuser" in message
+        oauth_token_storage.upsert_token.assert_called_once()
+
+        # Verify timeout was set on requests
+        post_call_kwargs = mock_requests.post.call_args[1]
+        assert "timeout" in post_call_kwargs
+        assert post_call_kwargs["timeout"] == 10
+
+        get_call_kwargs = mock_requests.get.call_args[1]
+        assert "timeout" in get_call_kwargs
+        assert get_call_kwargs["timeout"] == 10
 
     def test_oauth_flow_with_timeout(self, github_provider):
         """Test OAuth flow handles request timeouts."""
-        user_id = "test_user"
-        state_token = generate_state_token(user_id)
+        state_token = _SHARED_STATE_TOKEN
         code = "test_auth_code"
         redirect_uri = "http://localhost:8501/callback"
 
-        with patch("agentllm.oauth_callback.providers.requests") as mock_requests:
-            mock_requests.post.side_effect = requests.exceptions.Timeout("Request timed out")
-            mock_requests.exceptions = requests.exceptions
+        mock_requests = self.mock_requests
+        mock_requests.post.side_effect = requests.exceptions.Timeout("Request timed out")
 
-            success, message = github_provider.exchange_code_for_token(code, state_token, redirect_uri)
+        success, message = github_provider.exchange_code_for_token(code, state_token, redirect_uri)
 
-            assert success is False
-            assert "timed out" in message.lower()
+        assert success is False
+        assert "timed out" in message.lower()
 
     def test_oauth_flow_with_http_error(self, github_provider):
         """Test OAuth flow handles HTTP errors."""
-        user_id = "test_user"
-        state_token = generate_state_token(user_id)
+        state_token = _SHARED_STATE_TOKEN
         code = "test_auth_code"
         redirect_uri = "http://localhost:8501/callback"
 
-        with patch("agentllm.oauth_callback.providers.requests") as mock_requests:
-            mock_response = Mock()
-            mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("401 Unauthorized")
-            mock_requests.post.return_value = mock_response
-            mock_requests.exceptions = requests.exceptions
+        mock_requests = self.mock_requests
+        mock_response = Mock()
+        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("401 Unauthorized")
+        mock_requests.post.return_value = mock_response
 
-            success, message = github_provider.exchange_code_for_token(code, state_token, redirect_uri)
+        success, message = github_provider.exchange_code_for_token(code, state_token, redirect_uri)
 
-            assert success is False
-            assert "GitHub authorization failed" in message or "try again" in message.lower()
+        assert success is False
+        assert "GitHub authorization failed" in message or "try again" in message.lower()
 
     def test_oauth_flow_with_github_error_response(self, github_provider):
         """Test OAuth flow handles GitHub error responses."""
-        user_id = "test_user"
-        state_token = generate_state_token(user_id)
+        state_token = _SHARED_STATE_TOKEN
         code = "invalid_code"
         redirect_uri = "http://localhost:8501/callback"
 
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "error": "bad_verification_code",
-            "error_description": "The code passed is incorrect or expired.",
-        }
-        mock_response.raise_for_status = Mock()
-
-        with patch("agentllm.oauth_callback.providers.requests") as mock_requests:
-            mock_requests.post.return_value = mock_response
-            mock_requests.exceptions = requests.exceptions
+        mock_requests = self.mock_requests
+        mock_requests.post.return_value = _GH_ERROR_TOKEN_RESP
 
-            success, message = github_provider.exchange_code_for_token(code, state_token, redirect_uri)
+        success, message = github_provider.exchange_code_for_token(code, state_token, redirect_uri)
 
-            assert success is False
-            assert "GitHub authorization failed" in message or "try again" in message.lower()
+        assert success is False
+        assert "GitHub authorization failed" in message or "try again" in message.lower()
 
 
 # ============================================================================
@@ -410,48 +419,39 @@ class TestGitHubProvider:
 class TestProviderRegistry:
     """Tests for OAuth provider registry."""
 
-    @pytest.fixture
-    def mock_token_storage(self):
-        """Mock TokenStorage for testing."""
-        return MagicMock()
-
-    def test_registry_initialization(self, mock_token_storage):
+    @pytest.fixture(scope="class")
+    def registry(self, oauth_token_storage):
+        """Registry with both providers configured, built once per class (read-only in tests)."""
+        # Class-scoped fixtures can't use the function-scoped monkeypatch fixture
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv("GDRIVE_CLIENT_ID", "test_gdrive_id")
+            mp.setenv("GDRIVE_CLIENT_SECRET", "test_gdrive_secret")
+            mp.setenv("GITHUB_CLIENT_ID", "test_github_id")
+            mp.setenv("GITHUB_CLIENT_SECRET", "test_github_secret")
+            return ProviderRegistry(token_storage=oauth_token_storage)
+
+    def test_registry_initialization(self, registry):
         """Test provider registry initializes with built-in providers."""
-        with patch.dict(
-            os.environ,
-            {
-                "GDRIVE_CLIENT_ID": "test_gdrive_id",
-                "GDRIVE_CLIENT_SECRET": "test_gdrive_secret",
-                "GITHUB_CLIENT_ID": "test_github_id",
-                "GITHUB_CLIENT_SECRET": "test_github_secret",
-            },
-        ):
-            registry = ProviderRegistry(token_storage=mock_token_storage)
-
-            # Check providers are registered
-            assert registry.get_provider("google") is not None
-            assert registry.get_provider("github") is not None
-            assert isinstance(registry.get_provider("google"), GoogleDriveProvider)
-            assert isinstance(registry.get_provider("github"), GitHubProvider)
-
-    def test_get_configured_providers(self, mock_token_storage):
+        # Check providers are registered
+        assert registry.get_provider("google") is not None
+        assert registry.get_provider("github") is not None
+        assert isinstance(registry.get_provider("google"), GoogleDriveProvider)
+        assert isinstance(registry.get_provider("github"), GitHubProvider)
+
+    def test_get_configured_providers(self, oauth_token_storage, monkeypatch):
         """Test get_configured_providers returns only configured providers."""
-        with patch.dict(
-            os.environ,
-            {
-                "GDRIVE_CLIENT_ID": "test_gdrive_id",
-                "GDRIVE_CLIENT_SECRET": "test_gdrive_secret",
-                # GitHub credentials not set
-            },
-            clear=True,
-        ):
-            registry = ProviderRegistry(token_storage=mock_token_storage)
-
-            configured = registry.get_configured_providers()
-            assert "google" in configured
-            assert "github" not in configured
-
-    def test_get_unknown_provider(self, mock_token_storage):
+        monkeypatch.setenv("GDRIVE_CLIENT_ID", "test_gdrive_id")
+        monkeypatch.setenv("GDRIVE_CLIENT_SECRET", "test_gdrive_secret")
+        # GitHub credentials not set
+        monkeypatch.delenv("GITHUB_CLIENT_ID", raising=False)
+        monkeypatch.delenv("GITHUB_CLIENT_SECRET", raising=False)
+
+        registry = ProviderRegistry(token_storage=oauth_token_storage)
+
+        configured = registry.get_configured_providers()
+        assert "google" in configured
+        assert "github" not in configured
+
+    def test_get_unknown_provider(self, registry):
         """Test get_provider returns None for unknown provider."""
-        registry = ProviderRegistry(token_storage=mock_token_storage)
         assert registry.get_provider("unknown_provider") is None
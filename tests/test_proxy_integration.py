@@ -30,6 +30,8 @@ class ProxyManager:
         self.port = port
         self.process = None
         self.base_url = f"http://localhost:{port}"
+        # Keep-alive client reused for health polling and plain HTTP checks
+        self.client = httpx.Client(base_url=self.base_url)
 
     def start(self):
         """Start the proxy server."""
@@ -56,7 +58,7 @@ class ProxyManager:
         max_attempts = 30
         for _attempt in range(max_attempts):
             try:
-                response = httpx.get(f"{self.base_url}/health")
+                response = self.client.get("/health")
                 # Accept 200 OK or 401 Unauthorized (means server is up)
                 if response.status_code in [200, 401]:
                     return
@@ -69,6 +71,7 @@ class ProxyManager:
 
     def stop(self):
         """Stop the proxy server."""
+        self.client.close()
         if self.process:
             self.process.terminate()
             try:
@@ -216,7 +219,7 @@ class TestProxyHealthAndSetup:
 
     def test_proxy_health_endpoint(self, proxy):
         """Test that proxy health endpoint responds."""
-        response = httpx.get(f"{proxy.base_url}/health")
+        response = proxy.client.get("/health")
         # May require auth, so 401 is also acceptable
         assert response.status_code in [200, 401]
 
@@ -53,6 +53,14 @@ def sample_release_data() -> str:
         return f.read()
 
 
+@pytest.fixture(autouse=True)
+def clear_releases_cache():
+    """Start every test with an empty RHAITools release cache."""
+    RHAITools.invalidate_cache()
+    yield
+    RHAITools.invalidate_cache()
+
+
 @pytest.fixture
 def env_var_set():
     """Set the required environment variable for testing."""
@@ -192,6 +200,53 @@ class TestGetReleasesSuccess:
             "https://docs.google.com/document/d/test_doc_id/edit", format_key=None
         )
 
+    @patch("agentllm.tools.rhai_toolkit.GoogleDriveExporter")
+    def test_get_releases_serves_repeat_calls_from_cache(
+        self,
+        mock_exporter_class,
+        mock_credentials: Credentials,
+        sample_release_data: str,
+        env_var_set,
+    ):
+        """Test that repeat calls reuse cached releases until the cache is invalidated."""
+        mock_exporter = MagicMock()
+        mock_exporter.get_document_content_as_string.return_value = sample_release_data
+        mock_exporter_class.return_value = mock_exporter
+
+        first = RHAITools(credentials=mock_credentials).get_releases()
+        second = RHAITools(credentials=mock_credentials).get_releases()
+
+        assert second == first
+        mock_exporter.get_document_content_as_string.assert_called_once()
+
+        RHAITools.invalidate_cache()
+        RHAITools(credentials=mock_credentials).get_releases()
+
+        assert mock_exporter.get_document_content_as_string.call_count == 2
+
+    @patch("agentllm.tools.rhai_toolkit.GoogleDriveExporter")
+    def test_get_releases_cache_not_shared_between_credentials(
+        self,
+        mock_exporter_class,
+        mock_credentials: Credentials,
+        sample_release_data: str,
+        env_var_set,
+    ):
+        """Test that releases cached for one user's credentials are not served to another user."""
+        mock_exporter = MagicMock()
+        mock_exporter.get_document_content_as_string.return_value = sample_release_data
+        mock_exporter_class.return_value = mock_exporter
+
+        other_credentials = Mock(spec=Credentials)
+        other_credentials.token = "other_access_token"
+        other_credentials.refresh_token = "other_refresh_token"
+        other_credentials.client_id = "mock_client_id"
+
+        RHAITools(credentials=mock_credentials).get_releases()
+        RHAITools(credentials=other_credentials).get_releases()
+
+        assert mock_exporter.get_document_content_as_string.call_count == 2
+
 
 class TestGetReleasesErrorHandling:
     """Tests for error handling in get_releases()."""
@@ -337,6 +392,30 @@ rhoai-3.0,,Thu Nov-13-2025"""
         assert releases[0].details == ""
         assert releases[0].release_date == date(2025, 11, 13)
 
+    @patch("agentllm.tools.rhai_toolkit.logger")
+    @patch("agentllm.tools.rhai_toolkit.GoogleDriveExporter")
+    def test_get_releases_skips_blank_rows_without_warning(
+        self, mock_exporter_class, mock_logger, mock_credentials: Credentials, env_var_set
+    ):
+        """Test that blank and all-empty rows are skipped without logging a warning."""
+        # Setup mock with blank lines and an all-empty trailing row (CSV format)
+        blank_rows_data = """Release,Details,Planned Release Date
+
+rhoai-3.0,3.0 RHOAI GA,Thu Nov-13-2025
+,,
+"""
+
+        mock_exporter = MagicMock()
+        mock_exporter.get_document_content_as_string.return_value = blank_rows_data
+        mock_exporter_class.return_value = mock_exporter
+
+        toolkit = RHAITools(credentials=mock_credentials)
+        releases = toolkit.get_releases()
+
+        assert len(releases) == 1
+        assert releases[0].release == "rhoai-3.0"
+        mock_logger.warning.assert_not_called()
+
 
 class TestRHAIReleaseModel:
     """Tests for the RHAIRelease data model."""
@@ -3,7 +3,8 @@ Tests for the SprintReviewer agent.
 
 This test suite covers:
 - Agent instantiation and configuration
-- Jira toolkit methods (search_issues, get_issue, get_sprint_metrics, extract_sprint_info)
+- Jira toolkit methods (search_issues, get_issue, get_sprint_metrics, extract_sprint_info, prepare_sprint_data, get_issues_bulk,
+  build_metric_link)
 """
 
 import json
@@ -211,3 +212,134 @@ class TestSprintReviewerJiraToolkit:
 
         assert result["sprint_id"] == "22222"
         assert result["sprint_name"] == "Sprint UI 29392"
+
+    def test_prepare_sprint_data_combines_all_sprint_queries(self, mock_jira_client):
+        """Test that prepare_sprint_data returns issues, sprint info, metrics and epic summaries."""
+        from agentllm.tools.jira_toolkit import JiraTools
+
+        current_issues = [
+            self._create_mock_issue(key="PROJ-1", epic_link="PROJ-100"),
+            self._create_mock_issue(key="PROJ-2", status="Review", epic_link="PROJ-100"),
+        ]
+        backlog_issues = [self._create_mock_issue(key="PROJ-3", status="To Do")]
+        metric_totals = {
+            "Sprint = 22222": 25,
+            "Sprint = 22222 AND resolution = done": 18,
+            "Sprint = 22222 AND resolution = done AND type in (Story, Task)": 15,
+            "Sprint = 22222 AND resolution = done AND type = Bug": 3,
+        }
+
+        def search_issues(jql, maxResults=50, json_result=False, **kwargs):
+            if jql == "key in (PROJ-100)":
+                return [self._create_mock_issue(key="PROJ-100", summary="Epic summary")]
+            issues = current_issues if "openSprints()" in jql else backlog_issues
+            if json_result:
+                return {"total": metric_totals.get(jql, len(issues))}
+            return issues
+
+        mock_jira_client.search_issues.side_effect = search_issues
+        mock_jira_client.issue.return_value = self._create_mock_issue(
+            key="PROJ-1", sprint_data=["Sprint@1a2b3c[id=22222,name=Sprint UI 29392]"]
+        )
+
+        toolkit = JiraTools(token="test_token", server_url="https://mock-jira-url.com")
+
+        result = json.loads(toolkit.prepare_sprint_data("4267"))
+
+        assert [i["key"] for i in result["current_sprint"]["issues"]] == ["PROJ-1", "PROJ-2"]
+        assert [i["key"] for i in result["backlog"]["issues"]] == ["PROJ-3"]
+        assert result["sprint"] == {"sprint_id": "22222", "sprint_name": "Sprint UI 29392"}
+        assert result["metrics"]["total_planned"] == 25
+        assert result["metrics"]["bugs_closed"] == 3
+        assert result["epics"] == {"PROJ-100": "Epic summary"}
+
+    def test_get_issues_bulk_uses_one_query_per_chunk(self, mock_jira_client):
+        """Test that get_issues_bulk batches keys into chunked `key in (...)` queries."""
+        from agentllm.tools.jira_toolkit import BULK_KEYS_PER_QUERY, JiraTools
+
+        keys = [f"PROJ-{i}" for i in range(BULK_KEYS_PER_QUERY + 1)]
+
+        def search_issues(jql, **kwargs):
+            chunk = jql.removeprefix("key in (").removesuffix(")").split(",")
+            return [self._create_mock_issue(key=key, summary=f"Summary {key}") for key in chunk if key != "PROJ-0"]
+
+        mock_jira_client.search_issues.side_effect = search_issues
+
+        toolkit = JiraTools(token="test_token", server_url="https://mock-jira-url.com")
+
+        result = json.loads(toolkit.get_issues_bulk(keys + ["PROJ-1"]))
+
+        assert mock_jira_client.search_issues.call_count == 2
+        assert len(result["issues"]) == BULK_KEYS_PER_QUERY
+        assert result["issues"]["PROJ-1"]["summary"] == "Summary PROJ-1"
+        assert result["not_found"] == ["PROJ-0"]
+        mock_jira_client.issue.assert_not_called()
+
+    def test_get_issues_bulk_reports_missing_keys(self, mock_jira_client):
+        """Test that a key that does not exist is reported in not_found instead of failing the query."""
+        from jira import JIRAError
+
+        from agentllm.tools.jira_toolkit import JiraTools
+
+        existing = {"PROJ-1", "PROJ-3"}
+
+        def search_issues(jql, validate_query=True, **kwargs):
+            # Like Jira: a validated `key in (...)` query fails outright if any key does not exist
+            chunk = jql.removeprefix("key in (").removesuffix(")").split(",")
+            missing = [key for key in chunk if key not in existing]
+            if validate_query and missing:
+                raise JIRAError(status_code=400, text=f"An issue with key '{missing[0]}' does not exist")
+            return [self._create_mock_issue(key=key, summary=f"Summary {key}") for key in chunk if key in existing]
+
+        mock_jira_client.search_issues.side_effect = search_issues
+
+        toolkit = JiraTools(token="test_token", server_url="https://mock-jira-url.com")
+
+        result = json.loads(toolkit.get_issues_bulk(["PROJ-1", "PROJ-2", "PROJ-3"]))
+
+        assert "error" not in result
+        assert sorted(result["issues"]) == ["PROJ-1", "PROJ-3"]
+        assert result["not_found"] == ["PROJ-2"]
+
+    @pytest.mark.parametrize(
+        "bad_key",
+        ["PROJ-1) OR project = SECRET OR key in (PROJ-2", "proj-1", "PROJ", "PROJ-1 ", "1PROJ-1"],
+    )
+    def test_get_issues_bulk_does_not_query_invalid_keys(self, mock_jira_client, bad_key):
+        """Test that strings that are not issue keys never reach the JQL query."""
+        from agentllm.tools.jira_toolkit import JiraTools
+
+        mock_jira_client.search_issues.return_value = [self._create_mock_issue(key="PROJ-5")]
+
+        toolkit = JiraTools(token="test_token", server_url="https://mock-jira-url.com")
+
+        result = json.loads(toolkit.get_issues_bulk(["PROJ-5", bad_key]))
+
+        mock_jira_client.search_issues.assert_called_once()
+        assert mock_jira_client.search_issues.call_args.args[0] == "key in (PROJ-5)"
+        assert list(result["issues"]) == ["PROJ-5"]
+        assert result["not_found"] == [bad_key]
+
+    def test_get_issues_bulk_with_only_invalid_keys_skips_query(self, mock_jira_client):
+        """Test that no query is sent when none of the keys are valid."""
+        from agentllm.tools.jira_toolkit import JiraTools
+
+        toolkit = JiraTools(token="test_token", server_url="https://mock-jira-url.com")
+
+        result = json.loads(toolkit.get_issues_bulk(["not a key"]))
+
+        mock_jira_client.search_issues.assert_not_called()
+        assert result == {"issues": {}, "not_found": ["not a key"]}
+
+    def test_build_metric_link_encodes_jql(self, mock_jira_client):
+        """Test that build_metric_link returns a fully URL-encoded search link."""
+        from agentllm.tools.jira_toolkit import JiraTools
+
+        toolkit = JiraTools(token="test_token", server_url="https://issues.redhat.com/")
+
+        result = toolkit.build_metric_link("Sprint = 75290 AND resolution = done AND type in (Story, Task)")
+
+        assert result == (
+            "https://issues.redhat.com/issues/?jql="
+            "Sprint%20%3D%2075290%20AND%20resolution%20%3D%20done%20AND%20type%20in%20%28Story%2C%20Task%29"
+        )
@@ -242,6 +242,63 @@ class TestGoogleDriveTokenEncryption:
         assert retrieved.client_secret == credentials.client_secret
         assert retrieved.scopes == credentials.scopes
 
+    def test_gdrive_token_cached_until_upsert(self, storage):
+        """Repeated reads should reuse cached credentials until the token is updated."""
+        user_id = "test-user"
+        credentials = Credentials(
+            token="access-token",
+            refresh_token="refresh-token",
+            token_uri="https://oauth2.googleapis.com/token",
+            client_id="client-id",
+            client_secret="client-secret",
+            scopes=["https://www.googleapis.com/auth/drive"],
+        )
+        storage.upsert_token("gdrive", user_id=user_id, credentials=credentials)
+
+        first = storage.get_token("gdrive", user_id)
+        assert storage.get_token("gdrive", user_id) is first
+
+        credentials.token = "new-access-token"
+        storage.upsert_token("gdrive", user_id=user_id, credentials=credentials)
+
+        refreshed = storage.get_token("gdrive", user_id)
+        assert refreshed is not first
+        assert refreshed.token == "new-access-token"
+
+    def test_gdrive_token_cache_sees_writes_from_other_instances(self):
+        """Cached credentials should not outlive updates or deletes made by another TokenStorage."""
+        key = TokenEncryption.generate_key()
+        user_id = "test-user"
+        credentials = Credentials(
+            token="access-token",
+            refresh_token="refresh-token",
+            token_uri="https://oauth2.googleapis.com/token",
+            client_id="client-id",
+            client_secret="client-secret",
+            scopes=["https://www.googleapis.com/auth/drive"],
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_file = Path(tmpdir) / "test.db"
+            # e.g. the proxy and the OAuth callback server, each with its own TokenStorage
+            reader = TokenStorage(db_file=db_file, encryption_key=key)
+            writer = TokenStorage(db_file=db_file, encryption_key=key)
+
+            writer.upsert_token("gdrive", user_id=user_id, credentials=credentials)
+            first = reader.get_token("gdrive", user_id)
+            assert reader.get_token("gdrive", user_id) is first
+
+            credentials.token = "new-access-token"
+            writer.upsert_token("gdrive", user_id=user_id, credentials=credentials)
+
+            refreshed = reader.get_token("gdrive", user_id)
+            assert refreshed is not first
+            assert refreshed.token == "new-access-token"
+
+            writer.delete_token("gdrive", user_id)
+
+            assert reader.get_token("gdrive", user_id) is None
+
     def test_gdrive_all_three_fields_encrypted_at_rest(self, storage):
         """All three sensitive fields should be encrypted: token, refresh_token, client_secret."""
         user_id = "test-user"